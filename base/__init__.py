@@ -1,4 +1,5 @@
 from base.api.api_client import APIClient
+from base.api.async_api_client import AsyncAPIClient
 from base.models.base_model import BaseModel
 
-__all__ = ["APIClient", "BaseModel"]
+__all__ = ["APIClient", "AsyncAPIClient", "BaseModel"]
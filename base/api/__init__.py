@@ -1,3 +1,43 @@
-from base.api.api_client import APIClient
+from base.api.api_client import APIClient, BaseAPIClient
+from base.api.async_api_client import AsyncAPIClient
+from base.api.batch import BatchResult
+from base.api.cache import MemoryCacheStore, ResponseCache
+from base.api.cassette import Cassette, CassetteMissError, CassetteTransport
+from base.api.circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
+from base.api.decoders import Decoder, get_decoder
+from base.api.instrumentation import MetricsRegistry, RequestEvent, RequestHooks
+from base.api.rate_limit import RateLimit, RateLimiter
+from base.api.request_log import RequestLog, StructuredFormatter, configure_logging
+from base.api.retry import RetryPolicy
+from base.api.single_flight import AsyncSingleFlight, SingleFlight
+from base.api.transport import PoolStats, TransportConfig
 
-__all__ = ["APIClient"]
+__all__ = [
+    "APIClient",
+    "AsyncAPIClient",
+    "AsyncSingleFlight",
+    "BaseAPIClient",
+    "BatchResult",
+    "Cassette",
+    "CassetteMissError",
+    "CassetteTransport",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "CircuitState",
+    "Decoder",
+    "MemoryCacheStore",
+    "MetricsRegistry",
+    "PoolStats",
+    "RateLimit",
+    "RateLimiter",
+    "RequestEvent",
+    "RequestHooks",
+    "RequestLog",
+    "ResponseCache",
+    "RetryPolicy",
+    "SingleFlight",
+    "StructuredFormatter",
+    "TransportConfig",
+    "configure_logging",
+    "get_decoder",
+]
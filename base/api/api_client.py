@@ -1,79 +1,238 @@
+import dataclasses
 import logging
+import threading
 import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, suppress
+from contextvars import ContextVar
 from typing import Any
 
-from httpx import Client, HTTPStatusError, Response
+from httpx import URL, AsyncBaseTransport, AsyncClient, BaseTransport, Client, HTTPError, PoolTimeout, Request, Response
 
-logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
-logger = logging.getLogger(__name__)
+from base.api.cache import CACHEABLE_METHODS, CacheEntry, ResponseCache, request_key
+from base.api.circuit_breaker import CircuitBreaker
+from base.api.decoders import Decoder, ModelT, get_decoder
+from base.api.instrumentation import RequestHooks
+from base.api.rate_limit import RateLimiter
+from base.api.request_log import RequestLog
+from base.api.retry import RetryPolicy
+from base.api.single_flight import SingleFlight
+from base.api.transport import PoolStats, TransportConfig, pool_stats
+from base.models.trusted import VALIDATING, ModelBuilder
 
+# request() keyword arguments that belong to Client.send rather than Client.build_request
+SEND_OPTIONS = ("auth", "follow_redirects")
 
-class APIClient:
-    """Base API wrapper for HTTP requests with retry logic and logging"""
 
-    def __init__(self, base_url: str, retries: int = 3, retry_interval: float = 1.0, enable_logging: bool = True):
+class BaseAPIClient:
+    """Transport-independent part of the API wrapper shared by sync and async clients"""
+
+    client: Client | AsyncClient
+
+    def __init__(  # noqa: PLR0913
+        self,
+        base_url: str,
+        retries: int = 3,
+        retry_interval: float = 1.0,
+        enable_logging: bool = True,
+        *,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        cache: ResponseCache | None = None,
+        decoder: Decoder | str = "pydantic",
+        model_builder: ModelBuilder | None = None,
+        hooks: RequestHooks | None = None,
+        transport_config: TransportConfig | None = None,
+        request_log: RequestLog | None = None,
+    ):
         self.base_url = base_url.rstrip("/")
-        self.retries = max(0, retries)
-        self.retry_interval = max(0.0, retry_interval)
+        self.host = URL(self.base_url).host
+        # retries/retry_interval build the default policy: exponential backoff starting at retry_interval
+        self.retry_policy = retry_policy or RetryPolicy(retries=max(0, retries), backoff=max(0.0, retry_interval))
+        self.retries = self.retry_policy.retries
+        self.retry_interval = self.retry_policy.backoff
         self.enable_logging = enable_logging
-        self.client = Client(base_url=self.base_url, timeout=10.0)
+        # Structured request logs (successes may be sampled), enable_logging=False skips even the level checks
+        self.request_log = (request_log or RequestLog()) if enable_logging else None
+        # Optional limiter, may be shared with other clients talking to the same backend
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        # Opt-in cache for GET/HEAD responses, mutating calls invalidate the resource they touch
+        self.cache = cache
+        # Turns response bodies into JSON values or models, see base.api.decoders
+        self.decoder = get_decoder(decoder) if isinstance(decoder, str) else decoder
+        # Full validation unless a trusted builder is set here or per call with trusted()
+        self.model_builder = model_builder or VALIDATING
+        self._call_builder: ContextVar[ModelBuilder | None] = ContextVar(f"model_builder_{id(self)}", default=None)
         # Default headers applied to every request unless overridden by explicit headers
         self.default_headers: dict[str, str] = {}
+        # Optional lifecycle callbacks with phase timings, e.g. feeding a MetricsRegistry
+        self.hooks = hooks
+        # Pool limits, per-phase timeouts, HTTP/2 and pre-warming, DUMMYJSON_HTTP_* variables unless given
+        self.transport_config = transport_config or TransportConfig.from_env()
+        self.transport: BaseTransport | AsyncBaseTransport | None = None
 
-    def _log(self, level: str, message: str):
-        if self.enable_logging:
-            getattr(logger, level)(message)
+    def pool_stats(self) -> PoolStats | None:
+        """Connections of the pool and what they are doing, None when a transport without a pool was passed in"""
+        return pool_stats(self.transport)
 
-    def request(self, method: str, endpoint: str, **kwargs: Any) -> Response:
+    def _warm_up_count(self, connections: int | None) -> int:
+        return self.transport_config.warm_connections if connections is None else connections
+
+    def _log(self, level: int, event: str, **fields: Any) -> None:
+        if self.request_log is not None:
+            self.request_log.log(level, event, **fields)
+
+    def _log_attempt(self, method: str, url: str, attempt: int) -> None:
+        if self.request_log is not None and self.request_log.enabled(logging.DEBUG):
+            self.request_log.log(logging.DEBUG, "request.start", method=method, url=f"{self.base_url}/{url}", attempt=attempt)
+
+    def _log_success(self, method: str, url: str, response: Response, attempt: int, started: float) -> None:
+        if self.request_log is not None and self.request_log.sampled():
+            self.request_log.log(
+                logging.INFO,
+                "request.ok",
+                method=method,
+                url=f"{self.base_url}/{url}",
+                status=response.status_code,
+                attempt=attempt,
+                elapsed_ms=round((time.monotonic() - started) * 1000, 1),
+            )
+
+    def _merge_headers(self, kwargs: dict[str, Any]) -> dict[str, Any]:
+        """Merge default headers with per-call headers if provided"""
+        if self.default_headers:
+            call_headers = kwargs.get("headers")
+            if call_headers:
+                kwargs["headers"] = {**self.default_headers, **call_headers}
+            else:
+                kwargs["headers"] = self.default_headers
+        return kwargs
+
+    def _build_request(self, method: str, url: str, kwargs: dict[str, Any]) -> tuple[Request, dict[str, Any]]:
+        """Build the request once so it can be looked up in the cache and resent on retries"""
+        send_kwargs = {name: kwargs.pop(name) for name in SEND_OPTIONS if name in kwargs}
+        return self.client.build_request(method, url, **self._merge_headers(kwargs)), send_kwargs
+
+    def _shared(self, request: Request, send_kwargs: dict[str, Any]) -> bool:
         """
-        HTTP request method with certain amount of retries
-        Returns API Response
-        Raises: HTTPStatusError in case all attempts failed
+        Whether a read may be answered from the cache or by another caller's request
+        Auth flows add their credentials only when sending, after the request is keyed, so their requests are never shared
         """
-        url = endpoint.lstrip("/")
-        attempt = 0
+        return request.method in CACHEABLE_METHODS and send_kwargs.get("auth", self.client.auth) is None
 
-        while attempt <= self.retries:
-            try:
-                self._log("info", f"Request: {method} {self.base_url}/{url}, attempt {attempt + 1}")
-                # Merge default headers with per-call headers if provided
-                if self.default_headers:
-                    call_headers = kwargs.get("headers")
-                    if call_headers:
-                        merged = {**self.default_headers, **call_headers}
-                        kwargs["headers"] = merged
-                    else:
-                        kwargs["headers"] = self.default_headers
-
-                response = self.client.request(method, url, **kwargs)
-                response.raise_for_status()
-                self._log("info", f"Response: {method} {self.base_url}/{url} - {response.status_code}")
-                return response
-            except HTTPStatusError as e:
-                attempt += 1
-                if attempt > self.retries:
-                    self._log("error", f"Failed after {self.retries} retries: {method} {self.base_url}/{url} - {e!s}")
-                    raise
-                self._log("warning", f"Retry {attempt}:{self.retries}")
-                time.sleep(self.retry_interval)
-            except Exception as e:
-                self._log("error", f"Unexpected error: {e!s}")
-                raise
+    def _cache_lookup(self, request: Request, send_kwargs: dict[str, Any]) -> tuple[Response | None, CacheEntry | None]:
+        """Return a fresh cached response, or the stale entry being revalidated"""
+        if self.cache is None or not self._shared(request, send_kwargs):
+            return None, None
+        cached, stale = self.cache.lookup(request)
+        if cached is not None and self.request_log is not None and self.request_log.sampled():
+            self.request_log.log(logging.INFO, "cache.hit", method=request.method, url=str(request.url))
+        return cached, stale
 
-    def get(self, endpoint: str, **kwargs: Any) -> Response:
-        return self.request("GET", endpoint, **kwargs)
+    def _cache_update(self, request: Request, send_kwargs: dict[str, Any], response: Response, stale: CacheEntry | None) -> Response:
+        """Store a read response or invalidate the resource possibly changed by a mutating call"""
+        if self.cache is None:
+            return response
+        if request.method not in CACHEABLE_METHODS:
+            self.cache.invalidate(self._resource_path(request))
+            return response
+        if not self._shared(request, send_kwargs):
+            return response
+        return self.cache.store_response(request, response, stale)
 
-    def post(self, endpoint: str, **kwargs: Any) -> Response:
-        return self.request("POST", endpoint, **kwargs)
+    def _resource_path(self, request: Request) -> str:
+        """Path of the collection a request belongs to, e.g. /products for PUT /products/1"""
+        base_path = self.client.base_url.path.rstrip("/")
+        resource = request.url.path[len(base_path) :].lstrip("/").split("/", 1)[0]
+        return f"{base_path}/{resource}"
 
-    def delete(self, endpoint: str, **kwargs: Any) -> Response:
-        return self.request("DELETE", endpoint, **kwargs)
+    @contextmanager
+    def trusted(self, sample_every: int = 0) -> Iterator[ModelBuilder]:
+        """
+        Build models from already decoded data (merged pages, iterated and batched items) without full validation
+        for calls made inside the block (in this thread or task); with sample_every=N every Nth record is still validated
+        """
+        token = self._call_builder.set(ModelBuilder(trusted=True, sample_every=sample_every))
+        try:
+            yield self._call_builder.get()
+        finally:
+            self._call_builder.reset(token)
 
-    def put(self, endpoint: str, **kwargs: Any) -> Response:
-        return self.request("PUT", endpoint, **kwargs)
+    @property
+    def builder(self) -> ModelBuilder:
+        """Model builder for the current call: a trusted() block wins over the client setting"""
+        return self._call_builder.get() or self.model_builder
 
-    def patch(self, endpoint: str, **kwargs: Any) -> Response:
-        return self.request("PATCH", endpoint, **kwargs)
+    def build(self, model: type[ModelT], data: Any) -> ModelT:
+        """Build model from decoded JSON with the current builder"""
+        return self.builder.build(model, data)
+
+    def parse(self, response: Response, model: type[ModelT]) -> ModelT:
+        """
+        Decode the body of a response into model with the configured decoder
+        Bodies are validated in one pass even in trusted mode: model_validate_json beats decoding plus
+        Python-level construction for these models, so the builder only applies to already decoded data (see build)
+        The result is memoised on the response, so callers sharing a coalesced response share one parsed model
+        """
+        parsed = response.extensions.setdefault("parsed_models", {})
+        if model not in parsed:
+            started = time.perf_counter()
+            result = self.decoder.decode(response.content, model)
+            if self.hooks is not None:
+                self.hooks.parsed(response, model.__name__, {"decode_validate": time.perf_counter() - started})
+            # Threads sharing the response may parse it at the same time, all of them return the first result stored
+            return parsed.setdefault(model, result)
+        return parsed[model]
+
+    def json(self, response: Response) -> Any:
+        """Decode the body of a response into plain JSON values with the configured decoder"""
+        if self.hooks is None:
+            return self.decoder.loads(response.content)
+        started = time.perf_counter()
+        data = self.decoder.loads(response.content)
+        self.hooks.parsed(response, None, {"decode": time.perf_counter() - started})
+        return data
+
+    def _check_circuit(self) -> None:
+        """Fail fast with CircuitOpenError while the circuit for this host is open"""
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.before_request(self.host)
+
+    def _record_outcome(self, error: Exception | None) -> None:
+        """Report the result of an attempt to the circuit breaker"""
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record(self.host, error)
+
+    def _rate_limit_delay(self, url: str) -> float:
+        """Reserve a rate limiter slot for the next attempt, returns seconds to wait before sending it"""
+        if self.rate_limiter is None:
+            return 0.0
+        delay = self.rate_limiter.reserve(self.host, url)
+        if delay > 0:
+            self._log(logging.DEBUG, "request.rate_limited", url=f"{self.base_url}/{url}", delay=round(delay, 3))
+        return delay
+
+    def _retry_delay(self, method: str, url: str, attempt: int, error: Exception, elapsed: float) -> float | None:
+        """
+        Decide what to do after a failed attempt (attempt numbering starts at 1)
+        Returns delay in seconds before the next attempt, or None when the error must be re-raised
+        """
+        delay = self.retry_policy.next_delay(method, attempt, error, elapsed)
+        if delay is not None:
+            event, level = "request.retry", logging.WARNING
+        elif attempt > self.retries:
+            event, level = "request.gave_up", logging.ERROR
+        else:
+            event, level = "request.failed", logging.ERROR
+        if self.request_log is not None and self.request_log.enabled(level):
+            fields = {"delay": round(delay, 2)} if delay is not None else {}
+            self.request_log.log(
+                level, event, method=method, url=f"{self.base_url}/{url}", attempt=attempt, retries=self.retries, error=str(error), **fields
+            )
+        return delay
 
     # --- Default headers and auth helpers -----------------------------------
     def set_default_headers(self, headers: dict[str, str]) -> None:
@@ -97,6 +256,176 @@ class APIClient:
         """Set X-Auth-Token: <token> in default headers (custom header scheme)."""
         self.update_default_headers({"X-Auth-Token": token})
 
+
+class APIClient(BaseAPIClient):
+    """Base API wrapper for HTTP requests with retry logic and logging"""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        base_url: str,
+        retries: int = 3,
+        retry_interval: float = 1.0,
+        enable_logging: bool = True,
+        *,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        cache: ResponseCache | None = None,
+        coalesce: bool = False,
+        decoder: Decoder | str = "pydantic",
+        model_builder: ModelBuilder | None = None,
+        hooks: RequestHooks | None = None,
+        transport_config: TransportConfig | None = None,
+        request_log: RequestLog | None = None,
+        transport: BaseTransport | None = None,
+    ):
+        super().__init__(
+            base_url,
+            retries,
+            retry_interval,
+            enable_logging,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+            cache=cache,
+            decoder=decoder,
+            model_builder=model_builder,
+            hooks=hooks,
+            transport_config=transport_config,
+            request_log=request_log,
+        )
+        config = self.transport_config
+        self.transport = transport or config.transport()
+        self.client = Client(base_url=self.base_url, timeout=config.timeout, transport=self.transport)
+        # Identical concurrent GET/HEAD requests from several threads share one network call
+        self.single_flight = SingleFlight() if coalesce else None
+        # httpcore's sync pool can give one idle HTTP/1.1 connection to two waiting threads and close it under one
+        # of them (ReadError: Bad file descriptor), so threads wait here for a free connection instead of in the pool
+        limited = transport is None and config.max_connections and not config.use_http2
+        self._connection_slots = threading.BoundedSemaphore(config.max_connections) if limited else None
+        self._waiting = 0
+        self._waiting_lock = threading.Lock()
+        if self.transport_config.prewarm:
+            self.warm_up()
+
+    def _send_request(self, request: Request, send_kwargs: dict[str, Any]) -> Response:
+        """Send one attempt, first waiting up to the pool timeout for a free connection when the pool is bounded"""
+        if self._connection_slots is None:
+            return self.client.send(request, **send_kwargs)
+        with self._waiting_lock:
+            self._waiting += 1
+        try:
+            timeout = self.transport_config.pool_timeout
+            acquired = self._connection_slots.acquire(timeout=timeout) if timeout is not None else self._connection_slots.acquire()
+        finally:
+            with self._waiting_lock:
+                self._waiting -= 1
+        if not acquired:
+            raise PoolTimeout(f"No free connection within {timeout}s", request=request)
+        try:
+            return self.client.send(request, **send_kwargs)
+        finally:
+            self._connection_slots.release()
+
+    def pool_stats(self) -> PoolStats | None:
+        """Connections of the pool and what they are doing, waiting includes threads queued for a connection"""
+        stats = super().pool_stats()
+        return dataclasses.replace(stats, waiting=stats.waiting + self._waiting) if stats is not None else None
+
+    def warm_up(self, connections: int | None = None) -> PoolStats | None:
+        """
+        Open connections before the first request, so requests do not pay for TCP and TLS setup
+        Concurrent HEAD requests to prewarm_path each hold their connection until all are open;
+        failures are logged and never raised. Defaults to the prewarm setting (one connection with HTTP/2)
+        """
+        count = self._warm_up_count(connections)
+        if count <= 0:
+            return self.pool_stats()
+        barrier = threading.Barrier(count)
+
+        def open_connection() -> None:
+            try:
+                with self.client.stream("HEAD", self.transport_config.prewarm_path) as response:
+                    with suppress(threading.BrokenBarrierError):
+                        barrier.wait(timeout=self.transport_config.connect_timeout)
+                    # Reading returns the connection to the pool, so it waits until every connection is open;
+                    # an unread response would close its connection instead
+                    response.read()
+            except HTTPError as e:
+                barrier.abort()
+                self._log(logging.WARNING, "pool.warm_up_failed", url=self.base_url, error=str(e))
+
+        with ThreadPoolExecutor(max_workers=count) as executor:
+            list(executor.map(lambda _: open_connection(), range(count)))
+        stats = self.pool_stats()
+        if stats is not None:
+            self._log(logging.INFO, "pool.warmed", url=self.base_url, connections=stats.connections, http2=stats.http2)
+        return stats
+
+    def request(self, method: str, endpoint: str, **kwargs: Any) -> Response:
+        """
+        HTTP request method with certain amount of retries
+        Returns API Response
+        Raises: HTTPStatusError or transport error when the retry policy gives up
+        """
+        url = endpoint.lstrip("/")
+        request, send_kwargs = self._build_request(method, url, kwargs)
+        cached, stale = self._cache_lookup(request, send_kwargs)
+        if cached is not None:
+            return cached
+        if self.single_flight is not None and self._shared(request, send_kwargs):
+            return self.single_flight.do(request_key(request), lambda: self._send(url, request, send_kwargs, stale))
+        return self._send(url, request, send_kwargs, stale)
+
+    def _send(self, url: str, request: Request, send_kwargs: dict[str, Any], stale: CacheEntry | None) -> Response:
+        """Send the request, retrying failed attempts as the retry policy allows"""
+        method = request.method
+        attempt = 0
+        started = time.monotonic()
+
+        while True:
+            self._check_circuit()
+            wait = self._rate_limit_delay(url)
+            if wait > 0:
+                time.sleep(wait)
+            event = timer = None
+            try:
+                self._log_attempt(method, url, attempt + 1)
+                if self.hooks is not None:
+                    event, timer = self.hooks.start(request, attempt + 1)
+                # A 304 answer to a revalidation is turned into the cached response here
+                response = self._cache_update(request, send_kwargs, self._send_request(request, send_kwargs), stale)
+                response.raise_for_status()
+                self._record_outcome(None)
+                self._log_success(method, url, response, attempt + 1, started)
+                if event is not None:
+                    self.hooks.succeeded(event, timer, response)
+                return response
+            except Exception as e:
+                self._record_outcome(e)
+                attempt += 1
+                delay = self._retry_delay(method, url, attempt, e, time.monotonic() - started)
+                if event is not None:
+                    self.hooks.failed(event, timer, e, delay)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+
+    def get(self, endpoint: str, **kwargs: Any) -> Response:
+        return self.request("GET", endpoint, **kwargs)
+
+    def post(self, endpoint: str, **kwargs: Any) -> Response:
+        return self.request("POST", endpoint, **kwargs)
+
+    def delete(self, endpoint: str, **kwargs: Any) -> Response:
+        return self.request("DELETE", endpoint, **kwargs)
+
+    def put(self, endpoint: str, **kwargs: Any) -> Response:
+        return self.request("PUT", endpoint, **kwargs)
+
+    def patch(self, endpoint: str, **kwargs: Any) -> Response:
+        return self.request("PATCH", endpoint, **kwargs)
+
     def __enter__(self):
         """Support of context manager by class"""
         return self
@@ -0,0 +1,163 @@
+import asyncio
+import logging
+import time
+from contextlib import suppress
+from typing import Any
+
+from httpx import AsyncBaseTransport, AsyncClient, HTTPError, Request, Response
+
+from base.api.api_client import BaseAPIClient
+from base.api.cache import CacheEntry, ResponseCache, request_key
+from base.api.circuit_breaker import CircuitBreaker
+from base.api.decoders import Decoder
+from base.api.instrumentation import RequestHooks
+from base.api.rate_limit import RateLimiter
+from base.api.request_log import RequestLog
+from base.api.retry import RetryPolicy
+from base.api.single_flight import AsyncSingleFlight
+from base.api.transport import PoolStats, TransportConfig
+from base.models.trusted import ModelBuilder
+
+
+class AsyncAPIClient(BaseAPIClient):
+    """Asyncio API wrapper with the same retry logic, default headers and logging as APIClient"""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        base_url: str,
+        retries: int = 3,
+        retry_interval: float = 1.0,
+        enable_logging: bool = True,
+        *,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        cache: ResponseCache | None = None,
+        coalesce: bool = False,
+        decoder: Decoder | str = "pydantic",
+        model_builder: ModelBuilder | None = None,
+        hooks: RequestHooks | None = None,
+        transport_config: TransportConfig | None = None,
+        request_log: RequestLog | None = None,
+        transport: AsyncBaseTransport | None = None,
+    ):
+        super().__init__(
+            base_url,
+            retries,
+            retry_interval,
+            enable_logging,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+            cache=cache,
+            decoder=decoder,
+            model_builder=model_builder,
+            hooks=hooks,
+            transport_config=transport_config,
+            request_log=request_log,
+        )
+        self.transport = transport or self.transport_config.async_transport()
+        self.client = AsyncClient(base_url=self.base_url, timeout=self.transport_config.timeout, transport=self.transport)
+        # Identical concurrent GET/HEAD requests from several tasks share one network call
+        self.single_flight = AsyncSingleFlight() if coalesce else None
+
+    async def request(self, method: str, endpoint: str, **kwargs: Any) -> Response:
+        """
+        HTTP request method with certain amount of retries
+        Returns API Response
+        Raises: HTTPStatusError or transport error when the retry policy gives up
+        """
+        url = endpoint.lstrip("/")
+        request, send_kwargs = self._build_request(method, url, kwargs)
+        cached, stale = self._cache_lookup(request, send_kwargs)
+        if cached is not None:
+            return cached
+        if self.single_flight is not None and self._shared(request, send_kwargs):
+            return await self.single_flight.do(request_key(request), lambda: self._send(url, request, send_kwargs, stale))
+        return await self._send(url, request, send_kwargs, stale)
+
+    async def _send(self, url: str, request: Request, send_kwargs: dict[str, Any], stale: CacheEntry | None) -> Response:
+        """Send the request, retrying failed attempts as the retry policy allows"""
+        method = request.method
+        attempt = 0
+        started = time.monotonic()
+
+        while True:
+            self._check_circuit()
+            wait = self._rate_limit_delay(url)
+            if wait > 0:
+                await asyncio.sleep(wait)
+            event = timer = None
+            try:
+                self._log_attempt(method, url, attempt + 1)
+                if self.hooks is not None:
+                    event, timer = self.hooks.start(request, attempt + 1, asynchronous=True)
+                # A 304 answer to a revalidation is turned into the cached response here
+                response = self._cache_update(request, send_kwargs, await self.client.send(request, **send_kwargs), stale)
+                response.raise_for_status()
+                self._record_outcome(None)
+                self._log_success(method, url, response, attempt + 1, started)
+                if event is not None:
+                    self.hooks.succeeded(event, timer, response)
+                return response
+            except Exception as e:
+                self._record_outcome(e)
+                attempt += 1
+                delay = self._retry_delay(method, url, attempt, e, time.monotonic() - started)
+                if event is not None:
+                    self.hooks.failed(event, timer, e, delay)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+
+    async def get(self, endpoint: str, **kwargs: Any) -> Response:
+        return await self.request("GET", endpoint, **kwargs)
+
+    async def post(self, endpoint: str, **kwargs: Any) -> Response:
+        return await self.request("POST", endpoint, **kwargs)
+
+    async def delete(self, endpoint: str, **kwargs: Any) -> Response:
+        return await self.request("DELETE", endpoint, **kwargs)
+
+    async def put(self, endpoint: str, **kwargs: Any) -> Response:
+        return await self.request("PUT", endpoint, **kwargs)
+
+    async def patch(self, endpoint: str, **kwargs: Any) -> Response:
+        return await self.request("PATCH", endpoint, **kwargs)
+
+    async def warm_up(self, connections: int | None = None) -> PoolStats | None:
+        """Async version of APIClient.warm_up, also run on entering the client when prewarm is set"""
+        count = self._warm_up_count(connections)
+        if count <= 0:
+            return self.pool_stats()
+        barrier = asyncio.Barrier(count)
+
+        async def open_connection() -> None:
+            try:
+                async with self.client.stream("HEAD", self.transport_config.prewarm_path) as response:
+                    with suppress(TimeoutError, asyncio.BrokenBarrierError):
+                        await asyncio.wait_for(barrier.wait(), self.transport_config.connect_timeout)
+                    # Read once every connection is open, reading returns the connection to the pool
+                    await response.aread()
+            except HTTPError as e:
+                await barrier.abort()
+                self._log(logging.WARNING, "pool.warm_up_failed", url=self.base_url, error=str(e))
+
+        await asyncio.gather(*(open_connection() for _ in range(count)))
+        stats = self.pool_stats()
+        if stats is not None:
+            self._log(logging.INFO, "pool.warmed", url=self.base_url, connections=stats.connections, http2=stats.http2)
+        return stats
+
+    async def __aenter__(self):
+        """Support of async context manager by class, opening connections first when prewarm is set"""
+        if self.transport_config.prewarm:
+            await self.warm_up()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close underlying HTTP client."""
+        await self.client.aclose()
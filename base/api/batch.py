@@ -0,0 +1,161 @@
+"""Batch lookups of many resources by ID, mixing single-item requests and covering limit/skip pages"""
+
+import asyncio
+import contextvars
+from collections.abc import Awaitable, Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+from base.api.pagination import DEFAULT_CONCURRENCY, AsyncPageFetcher, PageFetcher
+
+# A window of IDs is fetched as one page when at least this share of it was requested
+DEFAULT_DENSITY = 0.5
+# Largest page requested for a window of IDs
+MAX_PAGE_SIZE = 100
+
+
+@dataclass
+class BatchResult[T]:
+    """Outcome of a batch lookup: found items by ID and the error of every ID that could not be fetched"""
+
+    items: dict[int, T] = field(default_factory=dict)
+    errors: dict[int, Exception] = field(default_factory=dict)
+
+    def __getitem__(self, item_id: int) -> T:
+        return self.items[item_id]
+
+    def __contains__(self, item_id: int) -> bool:
+        return item_id in self.items
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+@dataclass(frozen=True)
+class BatchPlan:
+    """Pages as (limit, skip, ids covered) plus the IDs requested one by one"""
+
+    pages: list[tuple[int, int, list[int]]]
+    singles: list[int]
+
+
+def plan_batch(ids: Iterable[int], density: float = DEFAULT_DENSITY, max_page_size: int = MAX_PAGE_SIZE) -> BatchPlan:
+    """
+    Deduplicate ids and group neighbouring IDs into windows of at most max_page_size
+    A window grows while the share of requested IDs in it stays at or above density; windows of two or more IDs
+    become one page request (the default listing is ordered by ID, so ID n sits at skip n - 1), the rest are
+    requested individually
+    """
+    pages: list[tuple[int, int, list[int]]] = []
+    singles: list[int] = []
+    window: list[int] = []
+    for item_id in sorted(set(ids)):
+        if window:
+            span = item_id - window[0] + 1
+            if span <= max_page_size and (len(window) + 1) / span >= density:
+                window.append(item_id)
+                continue
+            _close_window(window, pages, singles)
+        window = [item_id]
+    if window:
+        _close_window(window, pages, singles)
+    return BatchPlan(pages, singles)
+
+
+def _close_window(window: list[int], pages: list[tuple[int, int, list[int]]], singles: list[int]) -> None:
+    if len(window) > 1 and window[0] > 0:
+        pages.append((window[-1] - window[0] + 1, window[0] - 1, window))
+    else:
+        singles.extend(window)
+
+
+def _collect_page[T](
+    result: BatchResult[T], ids: list[int], page: dict[str, Any], items_key: str, parse_item: Callable[[dict[str, Any]], T]
+) -> list[int]:
+    """Store the requested items found on page, returns the IDs that were not on it"""
+    wanted = set(ids)
+    for item in page[items_key]:
+        if item.get("id") in wanted:
+            result.items[item["id"]] = parse_item(item)
+            wanted.discard(item["id"])
+    return sorted(wanted)
+
+
+def fetch_by_ids[T](  # noqa: PLR0913, PLR0917
+    ids: Iterable[int],
+    fetch_one: Callable[[int], T],
+    fetch_page: PageFetcher,
+    items_key: str,
+    parse_item: Callable[[dict[str, Any]], T],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    density: float = DEFAULT_DENSITY,
+) -> BatchResult[T]:
+    """
+    Fetch every ID with at most concurrency requests in flight, per-ID failures are reported in the result
+    IDs missing from a covering page (or on a page that failed) are retried individually
+    """
+    plan = plan_batch(ids, density)
+    result: BatchResult[T] = BatchResult()
+
+    def load_page(page: tuple[int, int, list[int]]) -> list[int]:
+        limit, skip, page_ids = page
+        try:
+            return _collect_page(result, page_ids, fetch_page(limit, skip), items_key, parse_item)
+        except Exception:
+            return page_ids
+
+    def load_one(item_id: int) -> None:
+        try:
+            result.items[item_id] = fetch_one(item_id)
+        except Exception as error:
+            result.errors[item_id] = error
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        # Workers run in a copy of the caller's context, so per-call settings such as api.trusted() apply
+        pages = [executor.submit(contextvars.copy_context().run, load_page, page) for page in plan.pages]
+        leftovers = [item_id for page in pages for item_id in page.result()]
+        singles = [executor.submit(contextvars.copy_context().run, load_one, item_id) for item_id in plan.singles + leftovers]
+        for single in singles:
+            single.result()
+    return result
+
+
+async def afetch_by_ids[T](  # noqa: PLR0913, PLR0917
+    ids: Iterable[int],
+    fetch_one: Callable[[int], Awaitable[T]],
+    fetch_page: AsyncPageFetcher,
+    items_key: str,
+    parse_item: Callable[[dict[str, Any]], T],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    density: float = DEFAULT_DENSITY,
+) -> BatchResult[T]:
+    """Async version of fetch_by_ids, at most concurrency requests are in flight at once"""
+    plan = plan_batch(ids, density)
+    result: BatchResult[T] = BatchResult()
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def load_page(page: tuple[int, int, list[int]]) -> list[int]:
+        limit, skip, page_ids = page
+        try:
+            async with semaphore:
+                payload = await fetch_page(limit, skip)
+            return _collect_page(result, page_ids, payload, items_key, parse_item)
+        except Exception:
+            return page_ids
+
+    async def load_one(item_id: int) -> None:
+        try:
+            async with semaphore:
+                result.items[item_id] = await fetch_one(item_id)
+        except Exception as error:
+            result.errors[item_id] = error
+
+    missing = await asyncio.gather(*(load_page(page) for page in plan.pages))
+    leftovers = [item_id for page_missing in missing for item_id in page_missing]
+    await asyncio.gather(*(load_one(item_id) for item_id in plan.singles + leftovers))
+    return result
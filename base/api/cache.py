@@ -0,0 +1,204 @@
+"""Opt-in HTTP response cache for read endpoints with TTL/LRU eviction and ETag revalidation"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field, replace
+from typing import Protocol
+
+from httpx import Request, Response
+
+CACHEABLE_METHODS = frozenset({"GET", "HEAD"})
+# Headers describing the transfer rather than the payload, dropped when a response is stored
+HOP_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding", "connection", "keep-alive"})
+VARY_HEADERS = ("Authorization", "X-Auth-Token", "Accept")
+
+
+def request_key(request: Request, vary_headers: Iterable[str] = VARY_HEADERS) -> str:
+    """Identity of a read request: method, URL with sorted query and the values of headers that change the response"""
+    query = "&".join(f"{name}={value}" for name, value in sorted(request.url.params.multi_items()))
+    parts = [request.method, f"{request.url.scheme}://{request.url.netloc.decode()}{request.url.path}", query]
+    parts.extend(f"{name.lower()}={request.headers.get(name, '')}" for name in vary_headers)
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """Stored response together with its validators"""
+
+    key: str
+    path: str  # request path, used to invalidate entries after mutating calls
+    status_code: int
+    headers: tuple[tuple[str, str], ...]
+    content: bytes
+    stored_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def to_response(self, request: Request) -> Response:
+        return Response(self.status_code, headers=list(self.headers), content=self.content, request=request)
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0  # served from cache without a request
+    revalidated: int = 0  # conditional request answered with 304
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def add(self, **counters: int) -> None:
+        with self._lock:
+            for name, value in counters.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.revalidated + self.misses
+        return (self.hits + self.revalidated) / lookups if lookups else 0.0
+
+
+class CacheStore(Protocol):
+    """Storage backend of ResponseCache"""
+
+    def get(self, key: str) -> CacheEntry | None: ...
+
+    def set(self, entry: CacheEntry) -> int:
+        """Store entry, returns the number of entries evicted to make room"""
+        ...
+
+    def delete_prefix(self, path_prefix: str) -> int:
+        """Delete entries whose path starts with path_prefix, returns the number deleted"""
+        ...
+
+    def clear(self) -> None: ...
+
+    def __len__(self) -> int: ...
+
+
+class MemoryCacheStore:
+    """In-process LRU store bounded by number of entries"""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, entry: CacheEntry) -> int:
+        with self._lock:
+            self._entries[entry.key] = entry
+            self._entries.move_to_end(entry.key)
+            evicted = 0
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                evicted += 1
+            return evicted
+
+    def delete_prefix(self, path_prefix: str) -> int:
+        with self._lock:
+            keys = [key for key, entry in self._entries.items() if entry.path.startswith(path_prefix)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ResponseCache:
+    """
+    Cache for successful GET/HEAD responses keyed by method, URL with normalised query and vary headers
+    Fresh entries (younger than ttl) are served without a request; stale entries with an ETag or
+    Last-Modified are revalidated with If-None-Match/If-Modified-Since
+    """
+
+    def __init__(
+        self,
+        ttl: float = 300.0,
+        max_entries: int = 1024,
+        store: CacheStore | None = None,
+        vary_headers: Iterable[str] = VARY_HEADERS,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.ttl = ttl
+        self.store = store if store is not None else MemoryCacheStore(max_entries)
+        self.vary_headers = tuple(header.lower() for header in vary_headers)
+        self.stats = CacheStats()
+        self._clock = clock
+
+    def key(self, request: Request) -> str:
+        return request_key(request, self.vary_headers)
+
+    def lookup(self, request: Request) -> tuple[Response | None, CacheEntry | None]:
+        """
+        Returns (cached response, None) for a fresh hit, otherwise (None, stale entry or None)
+        When a stale entry with validators is returned, conditional headers were added to request
+        """
+        if request.method not in CACHEABLE_METHODS:
+            return None, None
+        entry = self.store.get(self.key(request))
+        if entry is None:
+            self.stats.add(misses=1)
+            return None, None
+        if self._clock() - entry.stored_at < self.ttl:
+            self.stats.add(hits=1)
+            return entry.to_response(request), None
+        if entry.etag or entry.last_modified:
+            if entry.etag:
+                request.headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                request.headers["If-Modified-Since"] = entry.last_modified
+            return None, entry
+        self.stats.add(misses=1)
+        return None, None
+
+    def store_response(self, request: Request, response: Response, stale: CacheEntry | None = None) -> Response:
+        """Store a successful response (or refresh the stale entry on 304), returns the response to hand out"""
+        if request.method not in CACHEABLE_METHODS:
+            return response
+        if response.status_code == 304 and stale is not None:  # noqa: PLR2004
+            self.stats.add(revalidated=1)
+            self.store.set(replace(stale, stored_at=self._clock()))
+            return stale.to_response(request)
+        if stale is not None:
+            self.stats.add(misses=1)
+        if response.status_code != 200 or "no-store" in response.headers.get("Cache-Control", ""):  # noqa: PLR2004
+            return response
+
+        entry = CacheEntry(
+            key=self.key(request),
+            path=request.url.path,
+            status_code=response.status_code,
+            headers=tuple((name, value) for name, value in response.headers.items() if name.lower() not in HOP_HEADERS),
+            content=response.content,
+            stored_at=self._clock(),
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        evicted = self.store.set(entry)
+        self.stats.add(stores=1, evictions=evicted)
+        return response
+
+    def invalidate(self, path_prefix: str) -> int:
+        """Drop every entry under path_prefix, e.g. "/products" after a product was changed"""
+        removed = self.store.delete_prefix(path_prefix)
+        self.stats.add(invalidations=removed)
+        return removed
+
+    def clear(self) -> None:
+        self.store.clear()
@@ -0,0 +1,252 @@
+"""Record/replay transport storing request/response pairs in gzip-compressed cassette files"""
+
+import asyncio
+import base64
+import contextlib
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Literal
+
+import httpx
+
+from base.api.transport import TransportConfig
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+CASSETTE_VERSION = 1
+# Headers describing the wire encoding of the recorded body, which is stored decoded
+SKIPPED_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding", "connection", "keep-alive"})
+
+Mode = Literal["record", "replay", "auto"]
+
+
+class CassetteMissError(LookupError):
+    """Raised in replay mode for a request the cassette holds no response for"""
+
+    def __init__(self, key: tuple[str, str, str, str]):
+        method, path, query, _ = key
+        super().__init__(f"No recorded response for {method} {path}{'?' + query if query else ''} (body must match too)")
+        self.key = key
+
+
+def normalize_query(request: httpx.Request) -> str:
+    return "&".join(f"{name}={value}" for name, value in sorted(request.url.params.multi_items()))
+
+
+def body_digest(content: bytes) -> str:
+    """Digest of a request body, JSON bodies are compared regardless of key order and whitespace"""
+    if not content:
+        return ""
+    with contextlib.suppress(ValueError):
+        content = json.dumps(json.loads(content), sort_keys=True, separators=(",", ":")).encode()
+    return hashlib.sha256(content).hexdigest()[:32]
+
+
+def match_key(request: httpx.Request) -> tuple[str, str, str, str]:
+    """Method, path, normalised query and body digest: what a recorded response is matched on"""
+    return request.method, request.url.path, normalize_query(request), body_digest(request.content)
+
+
+@dataclass
+class Interaction:
+    """One recorded request/response pair"""
+
+    method: str
+    path: str
+    query: str
+    body: str
+    status: int
+    headers: list[tuple[str, str]]
+    content: str
+    base64: bool
+    elapsed: float
+
+    @property
+    def key(self) -> tuple[str, str, str, str]:
+        return self.method, self.path, self.query, self.body
+
+    @classmethod
+    def capture(cls, request: httpx.Request, response: httpx.Response, elapsed: float) -> "Interaction":
+        try:
+            content, encoded = response.content.decode(), False
+        except UnicodeDecodeError:
+            content, encoded = base64.b64encode(response.content).decode(), True
+        headers = [(name, value) for name, value in response.headers.multi_items() if name.lower() not in SKIPPED_HEADERS]
+        return cls(*match_key(request), response.status_code, headers, content, encoded, round(elapsed, 6))
+
+    def to_response(self, request: httpx.Request) -> httpx.Response:
+        content = base64.b64decode(self.content) if self.base64 else self.content.encode()
+        return httpx.Response(self.status, headers=self.headers, content=content, request=request, extensions={"cassette": "replayed"})
+
+
+def _load(path: Path) -> list[Interaction]:
+    if not path.exists():
+        return []
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        data = json.load(file)
+    if data.get("version") != CASSETTE_VERSION:
+        raise ValueError(f"Unsupported cassette version {data.get('version')} in {path}")
+    return [Interaction(**{**item, "headers": [tuple(header) for header in item["headers"]]}) for item in data["interactions"]]
+
+
+@contextlib.contextmanager
+def _file_lock(path: Path) -> Iterator[None]:
+    """Exclusive lock between processes (e.g. xdist workers recording together), a no-op where fcntl is missing"""
+    if fcntl is None:
+        yield
+        return
+    with open(path.with_name(f"{path.name}.lock"), "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+class Cassette:
+    """
+    Interactions loaded from and saved to a gzip-compressed JSON file
+    Identical requests recorded several times (e.g. repeated logins) are replayed in recording order,
+    and the last recording keeps being served once they are used up
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.interactions: list[Interaction] = []
+        self._recorded: list[Interaction] = []
+        self._by_key: dict[tuple[str, str, str, str], list[Interaction]] = defaultdict(list)
+        self._served: dict[tuple[str, str, str, str], int] = defaultdict(int)
+        self._lock = threading.Lock()
+        for interaction in _load(self.path):
+            self._add(interaction)
+
+    def __len__(self) -> int:
+        return len(self.interactions)
+
+    def __contains__(self, request: httpx.Request) -> bool:
+        return match_key(request) in self._by_key
+
+    def _add(self, interaction: Interaction) -> None:
+        self.interactions.append(interaction)
+        self._by_key[interaction.key].append(interaction)
+
+    def record(self, interaction: Interaction) -> None:
+        with self._lock:
+            self._add(interaction)
+            self._recorded.append(interaction)
+
+    def play(self, request: httpx.Request) -> Interaction:
+        key = match_key(request)
+        with self._lock:
+            recorded = self._by_key.get(key)
+            if not recorded:
+                raise CassetteMissError(key)
+            index = min(self._served[key], len(recorded) - 1)
+            self._served[key] += 1
+            return recorded[index]
+
+    def save(self) -> None:
+        """
+        Append what this process recorded to the file, atomically and only when something was recorded
+        The file is re-read under a lock, so processes recording into one cassette do not drop each other's pairs
+        """
+        with self._lock:
+            recorded, self._recorded = self._recorded, []
+        if not recorded:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with _file_lock(self.path):
+            interactions = [*_load(self.path), *recorded]
+            temporary = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            with gzip.open(temporary, "wt", encoding="utf-8", compresslevel=9) as file:
+                json.dump(
+                    {"version": CASSETTE_VERSION, "interactions": [asdict(item) for item in interactions]}, file, separators=(",", ":")
+                )
+            os.replace(temporary, self.path)
+
+
+class CassetteTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """
+    Transport for APIClient/AsyncAPIClient(transport=...) that records or replays a cassette
+    record: send through transport and store every pair; replay: never touch the network, unknown requests raise
+    CassetteMissError; auto: replay what is recorded and record the rest
+    Without transport, recording goes through one built from transport_config (pool limits, HTTP/2, keepalive)
+    simulate_latency sleeps for the recorded duration (times latency_scale) before returning a replayed response
+    """
+
+    def __init__(  # noqa: PLR0913, PLR0917
+        self,
+        cassette: Cassette | str | Path,
+        mode: Mode = "replay",
+        transport: httpx.BaseTransport | None = None,
+        async_transport: httpx.AsyncBaseTransport | None = None,
+        simulate_latency: bool = False,
+        latency_scale: float = 1.0,
+        transport_config: TransportConfig | None = None,
+    ):
+        if mode not in ("record", "replay", "auto"):
+            raise ValueError(f"Unknown cassette mode {mode!r}")
+        self.cassette = cassette if isinstance(cassette, Cassette) else Cassette(cassette)
+        self.mode = mode
+        self.simulate_latency = simulate_latency
+        self.latency_scale = latency_scale
+        self.transport_config = transport_config or TransportConfig()
+        self._transport = transport
+        self._async_transport = async_transport
+
+    def _replays(self, request: httpx.Request) -> bool:
+        return self.mode == "replay" or (self.mode == "auto" and request in self.cassette)
+
+    def _latency(self, interaction: Interaction) -> float:
+        return interaction.elapsed * self.latency_scale if self.simulate_latency else 0.0
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        request.read()
+        if self._replays(request):
+            interaction = self.cassette.play(request)
+            if delay := self._latency(interaction):
+                time.sleep(delay)
+            return interaction.to_response(request)
+        if self._transport is None:
+            self._transport = self.transport_config.transport()
+        started = time.perf_counter()
+        response = self._transport.handle_request(request)
+        response.read()
+        self.cassette.record(Interaction.capture(request, response, time.perf_counter() - started))
+        return response
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        if self._replays(request):
+            interaction = self.cassette.play(request)
+            if delay := self._latency(interaction):
+                await asyncio.sleep(delay)
+            return interaction.to_response(request)
+        if self._async_transport is None:
+            self._async_transport = self.transport_config.async_transport()
+        started = time.perf_counter()
+        response = await self._async_transport.handle_async_request(request)
+        await response.aread()
+        self.cassette.record(Interaction.capture(request, response, time.perf_counter() - started))
+        return response
+
+    def close(self) -> None:
+        self.cassette.save()
+        if self._transport is not None:
+            self._transport.close()
+
+    async def aclose(self) -> None:
+        self.cassette.save()
+        if self._async_transport is not None:
+            await self._async_transport.aclose()
@@ -0,0 +1,193 @@
+"""Per-host circuit breaker letting API clients fail fast while a backend is degraded"""
+
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from enum import StrEnum
+
+from httpx import HTTPStatusError, TransportError
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request while the circuit for its host is open"""
+
+    def __init__(self, host: str, retry_in: float):
+        super().__init__(f"Circuit for {host} is open, next probe allowed in {retry_in:.1f}s")
+        self.host = host
+        self.retry_in = retry_in
+
+
+@dataclass(frozen=True)
+class CircuitEvent:
+    """State transition reported to listeners"""
+
+    host: str
+    previous: CircuitState
+    state: CircuitState
+    reason: str
+
+
+@dataclass
+class CircuitStats:
+    """Counters and current state of one host circuit"""
+
+    state: CircuitState = CircuitState.CLOSED
+    consecutive_failures: int = 0
+    successes: int = 0
+    failures: int = 0
+    rejected: int = 0
+    opened: int = 0
+    outcomes: deque[bool] = field(default_factory=deque)  # recent outcomes, True means failure
+    opened_at: float = 0.0
+    probe_started_at: float | None = None
+
+    @property
+    def error_rate(self) -> float:
+        return sum(self.outcomes) / len(self.outcomes) if self.outcomes else 0.0
+
+
+class CircuitBreaker:
+    """
+    Closed -> open after failure_threshold consecutive failures, or when the error rate over the last
+    window calls reaches error_rate_threshold (once at least min_calls were seen)
+    Open -> half-open after recovery_timeout, then a single probe request decides between closed and open
+    Failures are transport errors and 5xx responses; other 4xx responses mean the backend is alive
+    """
+
+    def __init__(  # noqa: PLR0913, PLR0917
+        self,
+        failure_threshold: int = 5,
+        error_rate_threshold: float | None = None,
+        window: int = 20,
+        min_calls: int = 10,
+        recovery_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.error_rate_threshold = error_rate_threshold
+        self.window = window
+        self.min_calls = min_calls
+        self.recovery_timeout = recovery_timeout
+        self._clock = clock
+        self._circuits: dict[str, CircuitStats] = {}
+        self._listeners: list[Callable[[CircuitEvent], None]] = []
+        self._lock = threading.Lock()
+
+    def add_listener(self, listener: Callable[[CircuitEvent], None]) -> None:
+        """Register a callback invoked on every state change"""
+        self._listeners.append(listener)
+
+    def state(self, host: str) -> CircuitState:
+        with self._lock:
+            return self._circuit(host).state
+
+    def stats(self) -> dict[str, CircuitStats]:
+        """Snapshot of per-host counters"""
+        with self._lock:
+            return {
+                host: CircuitStats(**{**vars(circuit), "outcomes": deque(circuit.outcomes, maxlen=self.window)})
+                for host, circuit in self._circuits.items()
+            }
+
+    @staticmethod
+    def is_failure(error: Exception) -> bool:
+        """Only errors pointing at an unhealthy backend count against the circuit"""
+        if isinstance(error, HTTPStatusError):
+            return error.response.status_code >= 500  # noqa: PLR2004
+        return isinstance(error, TransportError)
+
+    def before_request(self, host: str) -> None:
+        """Raise CircuitOpenError when the request must not be sent"""
+        event = None
+        with self._lock:
+            circuit = self._circuit(host)
+            now = self._clock()
+            if circuit.state is CircuitState.OPEN:
+                retry_in = circuit.opened_at + self.recovery_timeout - now
+                if retry_in > 0:
+                    circuit.rejected += 1
+                    raise CircuitOpenError(host, retry_in)
+                event = self._transition(host, circuit, CircuitState.HALF_OPEN, "recovery timeout elapsed")
+            if circuit.state is CircuitState.HALF_OPEN:
+                # A probe that never reported back (e.g. cancelled task) must not block the circuit forever
+                probe_busy = circuit.probe_started_at is not None and now - circuit.probe_started_at < self.recovery_timeout
+                if probe_busy:
+                    circuit.rejected += 1
+                    raise CircuitOpenError(host, circuit.probe_started_at + self.recovery_timeout - now)
+                circuit.probe_started_at = now
+        self._notify(event)
+
+    def record_success(self, host: str) -> None:
+        event = None
+        with self._lock:
+            circuit = self._circuit(host)
+            circuit.successes += 1
+            circuit.consecutive_failures = 0
+            circuit.outcomes.append(False)
+            if circuit.state is CircuitState.HALF_OPEN:
+                circuit.outcomes.clear()
+                event = self._transition(host, circuit, CircuitState.CLOSED, "probe succeeded")
+        self._notify(event)
+
+    def record_failure(self, host: str) -> None:
+        event = None
+        with self._lock:
+            circuit = self._circuit(host)
+            circuit.failures += 1
+            circuit.consecutive_failures += 1
+            circuit.outcomes.append(True)
+            if circuit.state is CircuitState.HALF_OPEN:
+                event = self._open(host, circuit, "probe failed")
+            elif circuit.state is CircuitState.CLOSED:
+                if circuit.consecutive_failures >= self.failure_threshold:
+                    event = self._open(host, circuit, f"{circuit.consecutive_failures} consecutive failures")
+                elif (
+                    self.error_rate_threshold is not None
+                    and len(circuit.outcomes) >= self.min_calls
+                    and circuit.error_rate >= self.error_rate_threshold
+                ):
+                    event = self._open(host, circuit, f"error rate {circuit.error_rate:.0%}")
+        self._notify(event)
+
+    def record(self, host: str, error: Exception | None) -> None:
+        """Record the outcome of one attempt"""
+        if error is not None and self.is_failure(error):
+            self.record_failure(host)
+        else:
+            self.record_success(host)
+
+    def _circuit(self, host: str) -> CircuitStats:
+        circuit = self._circuits.get(host)
+        if circuit is None:
+            circuit = self._circuits[host] = CircuitStats(outcomes=deque(maxlen=self.window))
+        return circuit
+
+    def _open(self, host: str, circuit: CircuitStats, reason: str) -> CircuitEvent:
+        circuit.opened += 1
+        circuit.opened_at = self._clock()
+        return self._transition(host, circuit, CircuitState.OPEN, reason)
+
+    @staticmethod
+    def _transition(host: str, circuit: CircuitStats, state: CircuitState, reason: str) -> CircuitEvent:
+        event = CircuitEvent(host=host, previous=circuit.state, state=state, reason=reason)
+        circuit.state = state
+        circuit.probe_started_at = None
+        return event
+
+    def _notify(self, event: CircuitEvent | None) -> None:
+        if event is None:
+            return
+        logger.warning(f"Circuit for {event.host}: {event.previous} -> {event.state} ({event.reason})")
+        for listener in self._listeners:
+            listener(event)
@@ -0,0 +1,101 @@
+"""Pluggable JSON decoders turning response bodies into models in as few passes as possible"""
+
+import json
+import logging
+from typing import Any, Protocol, TypeVar
+
+from base.models.base_model import BaseModel
+
+try:
+    import orjson
+except ImportError:  # optional speed-up
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # optional speed-up
+    msgspec = None
+
+logger = logging.getLogger(__name__)
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class Decoder(Protocol):
+    """Decodes raw response bodies into plain JSON values or directly into models"""
+
+    name: str
+
+    def loads(self, content: bytes) -> Any: ...
+
+    def decode(self, content: bytes, model: type[ModelT]) -> ModelT: ...
+
+
+class StdlibDecoder:
+    """json.loads followed by model_validate, always available"""
+
+    name = "stdlib"
+
+    def loads(self, content: bytes) -> Any:
+        return json.loads(content)
+
+    def decode(self, content: bytes, model: type[ModelT]) -> ModelT:
+        return model.model_validate(self.loads(content))
+
+
+class PydanticDecoder(StdlibDecoder):
+    """Validates straight from bytes with model_validate_json, no intermediate dict is built"""
+
+    name = "pydantic"
+
+    def decode(self, content: bytes, model: type[ModelT]) -> ModelT:
+        return model.model_validate_json(content)
+
+
+class OrjsonDecoder(StdlibDecoder):
+    """orjson.loads followed by model_validate"""
+
+    name = "orjson"
+
+    def loads(self, content: bytes) -> Any:
+        return orjson.loads(content)
+
+
+class MsgspecDecoder(StdlibDecoder):
+    """msgspec.json.decode followed by model_validate"""
+
+    name = "msgspec"
+
+    def __init__(self):
+        self._decoder = msgspec.json.Decoder()
+
+    def loads(self, content: bytes) -> Any:
+        return self._decoder.decode(content)
+
+
+def available_decoders() -> list[str]:
+    """Names accepted by get_decoder in this environment"""
+    names = ["pydantic", "stdlib"]
+    if orjson is not None:
+        names.append("orjson")
+    if msgspec is not None:
+        names.append("msgspec")
+    return names
+
+
+def get_decoder(name: str = "pydantic") -> Decoder:
+    """
+    Decoder by name: "pydantic" (default, single pass from bytes), "orjson", "msgspec" or "stdlib"
+    Asking for a backend that is not installed falls back to the stdlib decoder
+    """
+    if name == "pydantic":
+        return PydanticDecoder()
+    if name == "orjson" and orjson is not None:
+        return OrjsonDecoder()
+    if name == "msgspec" and msgspec is not None:
+        return MsgspecDecoder()
+    if name not in {"orjson", "msgspec", "stdlib"}:
+        raise ValueError(f"Unknown decoder {name!r}, expected one of {available_decoders()}")
+    if name != "stdlib":
+        logger.warning(f"{name} is not installed, falling back to the stdlib JSON decoder")
+    return StdlibDecoder()
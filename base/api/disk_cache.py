@@ -0,0 +1,140 @@
+"""SQLite-backed response cache store shared between pytest sessions and worker processes"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+
+from base.api.cache import CacheEntry
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    path TEXT NOT NULL,
+    status_code INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    etag TEXT,
+    last_modified TEXT
+);
+CREATE INDEX IF NOT EXISTS entries_path ON entries (path);
+CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at);
+"""
+
+
+class SQLiteCacheStore:
+    """
+    CacheStore persisted in a SQLite file with zlib-compressed bodies
+    WAL mode plus a busy timeout make it safe to share between threads and processes (e.g. pytest-xdist
+    workers); the total compressed body size is kept under max_bytes by evicting least recently used entries
+    """
+
+    def __init__(self, path: str | Path, max_bytes: int = 256 * 1024 * 1024, compression_level: int = 6, timeout: float = 30.0):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.compression_level = compression_level
+        self.timeout = timeout
+        self._local = threading.local()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection().executescript(SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        """One connection per thread and process, connections must not cross a fork"""
+        connection = getattr(self._local, "connection", None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def get(self, key: str) -> CacheEntry | None:
+        connection = self._connection()
+        row = connection.execute(
+            "SELECT path, status_code, headers, body, stored_at, etag, last_modified FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        connection.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (time.time(), key))
+        path, status_code, headers, body, stored_at, etag, last_modified = row
+        return CacheEntry(
+            key=key,
+            path=path,
+            status_code=status_code,
+            headers=tuple(tuple(header) for header in json.loads(headers)),
+            content=zlib.decompress(body),
+            stored_at=stored_at,
+            etag=etag,
+            last_modified=last_modified,
+        )
+
+    def set(self, entry: CacheEntry) -> int:
+        body = zlib.compress(entry.content, self.compression_level)
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    entry.key,
+                    entry.path,
+                    entry.status_code,
+                    json.dumps(entry.headers),
+                    body,
+                    len(body),
+                    entry.stored_at,
+                    time.time(),
+                    entry.etag,
+                    entry.last_modified,
+                ),
+            )
+            evicted = self._evict(connection)
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return evicted
+
+    def _evict(self, connection: sqlite3.Connection) -> int:
+        """Delete least recently used entries until the stored bodies fit into max_bytes"""
+        (total,) = connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()
+        evicted = 0
+        if total <= self.max_bytes:
+            return evicted
+        for key, size in connection.execute("SELECT key, size FROM entries ORDER BY accessed_at").fetchall():
+            if total <= self.max_bytes:
+                break
+            connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+            total -= size
+            evicted += 1
+        return evicted
+
+    def delete_prefix(self, path_prefix: str) -> int:
+        cursor = self._connection().execute("DELETE FROM entries WHERE substr(path, 1, ?) = ?", (len(path_prefix), path_prefix))
+        return cursor.rowcount
+
+    def clear(self) -> None:
+        self._connection().execute("DELETE FROM entries")
+
+    def size_bytes(self) -> int:
+        """Total size of the compressed bodies"""
+        (total,) = self._connection().execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()
+        return total
+
+    def __len__(self) -> int:
+        (count,) = self._connection().execute("SELECT COUNT(*) FROM entries").fetchone()
+        return count
+
+    def close(self) -> None:
+        """Close the connection of the calling thread"""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
@@ -0,0 +1,256 @@
+"""Request lifecycle hooks with per-phase timings, and an in-memory metrics registry with Prometheus text export"""
+
+import logging
+import re
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from httpx import HTTPStatusError, Request, Response
+
+logger = logging.getLogger(__name__)
+
+EVENTS = ("request", "retry", "response", "error", "parse")
+# Path segments standing for one resource, e.g. /products/1 -> /products/{id}
+ID_SEGMENT = re.compile(r"(?<=/)(\d+|[0-9a-fA-F]{8}-[0-9a-fA-F-]{27})(?=/|$)")
+# Spans between httpcore trace events making up the phases of one attempt
+TRACE_PHASES = {
+    "connect": ("connect_tcp.started", "connect_tcp.complete"),
+    "tls": ("start_tls.started", "start_tls.complete"),
+    "ttfb": ("send_request_headers.started", "receive_response_headers.complete"),
+    "body": ("receive_response_body.started", "receive_response_body.complete"),
+}
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def compile_template(template: str) -> tuple[re.Pattern[str], str]:
+    """Pattern matching paths of a template such as "/products/category/{slug}" """
+    pattern = re.sub(r"\\\{\w+\\\}", "[^/]+", re.escape(template))
+    return re.compile(pattern), template
+
+
+def endpoint_template(path: str, templates: Iterable[tuple[re.Pattern[str], str]] = ()) -> str:
+    """Label for a path: the first matching template, otherwise the path with numeric and UUID segments as {id}"""
+    for pattern, template in templates:
+        if pattern.fullmatch(path):
+            return template
+    return ID_SEGMENT.sub("{id}", path)
+
+
+@dataclass
+class RequestEvent:
+    """
+    What hooks receive for one attempt (attempt counts from 1) or one parsed body
+    phases holds seconds per phase: connect, tls, ttfb and body when the transport reports them, total for the
+    attempt; decode and validate (or decode_validate when the decoder does both in one step) for parse events
+    """
+
+    method: str
+    endpoint: str
+    url: str
+    attempt: int = 1
+    phases: dict[str, float] = field(default_factory=dict)
+    status: int | None = None
+    error: BaseException | None = None
+    retry_in: float | None = None
+    model: str | None = None
+
+
+class PhaseTimer:
+    """httpcore trace callback recording when each connection phase of an attempt starts and ends"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.marks: dict[str, float] = {}
+
+    def __call__(self, name: str, info: dict[str, Any]) -> None:
+        # "http11.send_request_headers.started" -> "send_request_headers.started"
+        self.marks[name.partition(".")[2]] = time.perf_counter()
+
+    async def atrace(self, name: str, info: dict[str, Any]) -> None:
+        self(name, info)
+
+    def phases(self) -> dict[str, float]:
+        phases = {"total": time.perf_counter() - self.started}
+        for phase, (start, end) in TRACE_PHASES.items():
+            if start in self.marks and end in self.marks:
+                phases[phase] = self.marks[end] - self.marks[start]
+        return phases
+
+
+class RequestHooks:
+    """
+    Callbacks for request, retry, response, error and parse events of APIClient/AsyncAPIClient(hooks=...)
+    Register with hooks.on("response", callback) (also usable as a decorator); a failing callback is logged and
+    never breaks the request. templates name endpoints whose variable parts are not numeric ids
+    """
+
+    def __init__(self, templates: Iterable[str] = ()):
+        self.templates = [compile_template(template) for template in templates]
+        self._listeners: dict[str, list[Callable[[RequestEvent], Any]]] = {event: [] for event in EVENTS}
+
+    def on(self, event: str, callback: Callable[[RequestEvent], Any]) -> Callable[[RequestEvent], Any]:
+        if event not in self._listeners:
+            raise ValueError(f"Unknown event {event!r}, choose from {', '.join(EVENTS)}")
+        self._listeners[event].append(callback)
+        return callback
+
+    def emit(self, event: str, payload: RequestEvent) -> None:
+        for callback in self._listeners[event]:
+            try:
+                callback(payload)
+            except Exception:
+                logger.exception("Hook for %s event failed", event)
+
+    def endpoint(self, request: Request) -> str:
+        return endpoint_template(request.url.path, self.templates)
+
+    def start(self, request: Request, attempt: int, asynchronous: bool = False) -> tuple[RequestEvent, PhaseTimer]:
+        """Emit the request event and attach a timer collecting the phases of this attempt"""
+        timer = PhaseTimer()
+        request.extensions["trace"] = timer.atrace if asynchronous else timer
+        event = RequestEvent(request.method, self.endpoint(request), str(request.url), attempt)
+        self.emit("request", event)
+        return event, timer
+
+    def succeeded(self, event: RequestEvent, timer: PhaseTimer, response: Response) -> None:
+        event.phases, event.status = timer.phases(), response.status_code
+        self.emit("response", event)
+
+    def failed(self, event: RequestEvent, timer: PhaseTimer, error: Exception, retry_in: float | None) -> None:
+        """Emit retry when another attempt follows, error when the failure is final"""
+        event.phases, event.error, event.retry_in = timer.phases(), error, retry_in
+        if isinstance(error, HTTPStatusError):
+            event.status = error.response.status_code
+        self.emit("retry" if retry_in is not None else "error", event)
+
+    def parsed(self, response: Response, model: str | None, phases: dict[str, float]) -> None:
+        request = response.request
+        self.emit("parse", RequestEvent(request.method, self.endpoint(request), str(request.url), phases=phases, model=model))
+
+
+class Histogram:
+    """Prometheus-style histogram: cumulative bucket counts, sum and count"""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last one is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        index = next((index for index, bound in enumerate(self.buckets) if value <= bound), len(self.buckets))
+        self.counts[index] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        bounds = [f"{bound:g}" for bound in self.buckets] + ["+Inf"]
+        total, result = 0, []
+        for bound, count in zip(bounds, self.counts, strict=True):
+            total += count
+            result.append((bound, total))
+        return result
+
+
+Labels = tuple[tuple[str, str], ...]
+
+
+def _labels(labels: dict[str, Any]) -> Labels:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Labels, extra: Labels = ()) -> str:
+    pairs = [*labels, *extra]
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}" if pairs else ""
+
+
+METRIC_HELP = {
+    "api_requests_total": "Completed requests by method, endpoint and status",
+    "api_retries_total": "Failed attempts that were retried, by reason",
+    "api_errors_total": "Requests that failed for good, by reason",
+    "api_request_duration_seconds": "Duration of request phases (connect, tls, ttfb, body, total)",
+    "api_parse_duration_seconds": "Duration of decoding and validating response bodies",
+}
+
+
+class MetricsRegistry:
+    """
+    Thread-safe counters and histograms keyed by name and labels
+    attach(hooks) records the client metrics: api_requests_total, api_retries_total, api_errors_total,
+    api_request_duration_seconds (by phase) and api_parse_duration_seconds (by phase and model)
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counters: dict[str, dict[Labels, float]] = {}
+        self.histograms: dict[str, dict[Labels, Histogram]] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, name: str, value: float = 1.0, **labels: Any) -> None:
+        key = _labels(labels)
+        with self._lock:
+            series = self.counters.setdefault(name, {})
+            series[key] = series.get(key, 0.0) + value
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        key = _labels(labels)
+        with self._lock:
+            series = self.histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = Histogram(self.buckets)
+            histogram.observe(value)
+
+    def counter(self, name: str, **labels: Any) -> float:
+        return self.counters.get(name, {}).get(_labels(labels), 0.0)
+
+    def histogram(self, name: str, **labels: Any) -> Histogram | None:
+        return self.histograms.get(name, {}).get(_labels(labels))
+
+    def attach(self, hooks: RequestHooks) -> RequestHooks:
+        """Record the metrics of every client using hooks"""
+        hooks.on("response", self._on_response)
+        hooks.on("retry", self._on_failure)
+        hooks.on("error", self._on_failure)
+        hooks.on("parse", self._on_parse)
+        return hooks
+
+    def _on_response(self, event: RequestEvent) -> None:
+        self.inc("api_requests_total", method=event.method, endpoint=event.endpoint, status=event.status)
+        for phase, seconds in event.phases.items():
+            self.observe("api_request_duration_seconds", seconds, method=event.method, endpoint=event.endpoint, phase=phase)
+
+    def _on_failure(self, event: RequestEvent) -> None:
+        reason = f"HTTP {event.status}" if event.status is not None else type(event.error).__name__
+        name = "api_retries_total" if event.retry_in is not None else "api_errors_total"
+        self.inc(name, method=event.method, endpoint=event.endpoint, reason=reason)
+        if event.retry_in is None and event.status is not None:
+            self.inc("api_requests_total", method=event.method, endpoint=event.endpoint, status=event.status)
+
+    def _on_parse(self, event: RequestEvent) -> None:
+        for phase, seconds in event.phases.items():
+            self.observe("api_parse_duration_seconds", seconds, endpoint=event.endpoint, model=event.model, phase=phase)
+
+    def to_prometheus(self) -> str:
+        """Metrics in the Prometheus text exposition format"""
+        lines: list[str] = []
+        with self._lock:
+            for name, series in sorted(self.counters.items()):
+                lines += [f"# HELP {name} {METRIC_HELP.get(name, name)}", f"# TYPE {name} counter"]
+                lines += [f"{name}{_format_labels(labels)} {value:g}" for labels, value in sorted(series.items())]
+            for name, series in sorted(self.histograms.items()):
+                lines += [f"# HELP {name} {METRIC_HELP.get(name, name)}", f"# TYPE {name} histogram"]
+                for labels, histogram in sorted(series.items()):
+                    lines += [f"{name}_bucket{_format_labels(labels, (('le', bound),))} {count}" for bound, count in histogram.cumulative()]
+                    lines += [
+                        f"{name}_sum{_format_labels(labels)} {histogram.sum:.9g}",
+                        f"{name}_count{_format_labels(labels)} {histogram.count}",
+                    ]
+        return "\n".join(lines) + "\n"
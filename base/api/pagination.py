@@ -0,0 +1,114 @@
+"""Helpers for limit/skip paginated list endpoints"""
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+# Default number of pages requested at the same time when fetching a whole collection
+DEFAULT_CONCURRENCY = 8
+
+PageFetcher = Callable[[int, int], dict[str, Any]]
+AsyncPageFetcher = Callable[[int, int], Awaitable[dict[str, Any]]]
+
+
+def remaining_pages(total: int, skip: int, fetched: int) -> list[int]:
+    """
+    Return skip offsets of the pages still missing after the first page
+    The step is the size of the first page, so a server-side cap on limit is respected
+    """
+    return list(range(skip + fetched, total, fetched)) if fetched else []
+
+
+def merge_pages(first_page: dict[str, Any], pages: list[dict[str, Any]], items_key: str) -> dict[str, Any]:
+    """Combine pages (already in offset order) into a single list response payload"""
+    items = list(first_page[items_key])
+    for page in pages:
+        items.extend(page[items_key])
+    return {items_key: items, "total": first_page["total"], "skip": first_page["skip"], "limit": len(items)}
+
+
+def fetch_all_pages(
+    fetch_page: PageFetcher, items_key: str, page_size: int, skip: int = 0, concurrency: int = DEFAULT_CONCURRENCY
+) -> dict[str, Any]:
+    """
+    Fetch every page of a collection starting at skip
+    The first page tells the total, the remaining pages are requested in parallel by at most concurrency threads
+    """
+    first_page = fetch_page(page_size, skip)
+    if page_size <= 0:
+        # limit=0 already returns the whole collection in one response
+        return first_page
+
+    step = len(first_page[items_key])
+    offsets = remaining_pages(first_page["total"], skip, step)
+    if not offsets:
+        return merge_pages(first_page, [], items_key)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(offsets)))) as executor:
+        pages = list(executor.map(lambda offset: fetch_page(step, offset), offsets))
+    return merge_pages(first_page, pages, items_key)
+
+
+async def afetch_all_pages(
+    fetch_page: AsyncPageFetcher, items_key: str, page_size: int, skip: int = 0, concurrency: int = DEFAULT_CONCURRENCY
+) -> dict[str, Any]:
+    """Async version of fetch_all_pages, at most concurrency page requests are in flight at once"""
+    first_page = await fetch_page(page_size, skip)
+    if page_size <= 0:
+        return first_page
+
+    step = len(first_page[items_key])
+    offsets = remaining_pages(first_page["total"], skip, step)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def fetch_bounded(offset: int) -> dict[str, Any]:
+        async with semaphore:
+            return await fetch_page(step, offset)
+
+    pages = await asyncio.gather(*(fetch_bounded(offset) for offset in offsets))
+    return merge_pages(first_page, list(pages), items_key)
+
+
+def iter_pages(fetch_page: PageFetcher, items_key: str, page_size: int, skip: int = 0) -> Iterator[dict[str, Any]]:
+    """
+    Yield pages one at a time while the next page is fetched by a background thread
+    Closing the generator early (e.g. break out of a for loop) cancels the pending prefetch
+    """
+    if page_size <= 0:
+        raise ValueError(f"page_size must be positive, got {page_size}")
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    pending = executor.submit(fetch_page, page_size, skip)
+    try:
+        while pending is not None:
+            page = pending.result()
+            skip += len(page[items_key])
+            has_more = bool(page[items_key]) and skip < page["total"]
+            pending = executor.submit(fetch_page, page_size, skip) if has_more else None
+            yield page
+    finally:
+        if pending is not None:
+            pending.cancel()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def aiter_pages(fetch_page: AsyncPageFetcher, items_key: str, page_size: int, skip: int = 0) -> AsyncIterator[dict[str, Any]]:
+    """
+    Async version of iter_pages, the next page is fetched by a background task
+    Wrap in contextlib.aclosing() to cancel the prefetch deterministically after an early break
+    """
+    if page_size <= 0:
+        raise ValueError(f"page_size must be positive, got {page_size}")
+
+    pending: asyncio.Task | None = asyncio.ensure_future(fetch_page(page_size, skip))
+    try:
+        while pending is not None:
+            page = await pending
+            skip += len(page[items_key])
+            has_more = bool(page[items_key]) and skip < page["total"]
+            pending = asyncio.ensure_future(fetch_page(page_size, skip)) if has_more else None
+            yield page
+    finally:
+        if pending is not None:
+            pending.cancel()
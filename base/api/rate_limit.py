@@ -0,0 +1,108 @@
+"""Client-side token-bucket rate limiting shared by sync and async API clients"""
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Sustained request rate with an allowed burst on top of it"""
+
+    rate: float  # requests per second
+    burst: float | None = None  # bucket capacity, defaults to one second worth of requests
+
+    @property
+    def capacity(self) -> float:
+        return self.burst if self.burst is not None else max(1.0, self.rate)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket
+    Callers reserve a token and get back how long to wait before using it, so the same bucket
+    serves threads (time.sleep) and event loops (asyncio.sleep) without blocking under the lock
+    """
+
+    def __init__(self, limit: RateLimit, clock: Callable[[], float] = time.monotonic):
+        if limit.rate <= 0:
+            raise ValueError(f"Rate must be positive, got {limit.rate}")
+        self.limit = limit
+        self._clock = clock
+        self._tokens = limit.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Take tokens and return seconds to wait until they are actually available"""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.limit.capacity, self._tokens + (now - self._updated) * self.limit.rate)
+            self._updated = now
+            self._tokens -= tokens
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.limit.rate
+
+
+class RateLimiter:
+    """
+    Token buckets per host and endpoint prefix
+    Rules map path prefixes ("/auth" or "/auth/*") to limits, the longest matching prefix wins
+    and paths without a rule use the default limit; every host gets its own set of buckets
+    One instance can be shared by any number of APIClient and AsyncAPIClient instances
+    """
+
+    def __init__(
+        self,
+        default: RateLimit | None = None,
+        rules: dict[str, RateLimit] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.default = default
+        self.rules = {_normalize_prefix(prefix): limit for prefix, limit in (rules or {}).items()}
+        self._clock = clock
+        self._buckets: dict[tuple[str, str | None], TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def match(self, path: str) -> str | None:
+        """Return the longest rule prefix matching path, None when the default limit applies"""
+        path = "/" + path.split("?", 1)[0].lstrip("/")
+        matches = [prefix for prefix in self.rules if path == prefix or path.startswith(prefix.rstrip("/") + "/")]
+        return max(matches, key=len) if matches else None
+
+    def bucket(self, host: str, path: str) -> TokenBucket | None:
+        """Get or create the bucket for a request, None when the request is not limited"""
+        prefix = self.match(path)
+        limit = self.rules[prefix] if prefix is not None else self.default
+        if limit is None:
+            return None
+        key = (host, prefix)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(limit, self._clock)
+            return bucket
+
+    def reserve(self, host: str, path: str) -> float:
+        """Reserve a slot for a request, returns seconds to wait before sending it"""
+        bucket = self.bucket(host, path)
+        return bucket.reserve() if bucket else 0.0
+
+    def acquire(self, host: str, path: str) -> float:
+        """Block the calling thread until the request may be sent, returns the time waited"""
+        delay = self.reserve(host, path)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self, host: str, path: str) -> float:
+        """Suspend the calling task until the request may be sent, returns the time waited"""
+        delay = self.reserve(host, path)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+
+def _normalize_prefix(prefix: str) -> str:
+    return "/" + prefix.rstrip("*").strip("/")
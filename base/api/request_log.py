@@ -0,0 +1,134 @@
+"""Structured, level-guarded and sampled request logs, written by a background thread"""
+
+import atexit
+import itertools
+import json
+import logging
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+from typing import Any, TextIO
+
+# Records keep the name of the client module they used to come from, so existing logger settings still apply
+logger = logging.getLogger("base.api.api_client")
+
+FORMATS = ("kv", "json", "text")
+
+
+def _kv_value(value: Any) -> str:
+    text = value if isinstance(value, str) else str(value)
+    # Quote values a key=value parser would split, the rest stays bare for grep
+    return json.dumps(text, ensure_ascii=False) if not text or any(char in text for char in ' ="\n') else text
+
+
+class StructuredMessage:
+    """Event name and fields of a record, rendered as key=value text only when a handler formats it"""
+
+    __slots__ = ("event", "fields")
+
+    def __init__(self, event: str, fields: dict[str, Any]):
+        self.event = event
+        self.fields = fields
+
+    def __str__(self) -> str:
+        return " ".join([self.event, *(f"{key}={_kv_value(value)}" for key, value in self.fields.items())])
+
+
+class RequestLog:
+    """
+    Request logging of a client: nothing is formatted unless the logger is enabled for the level,
+    successes are logged 1 in sample_every (per client), retries and failures always
+    """
+
+    def __init__(self, sample_every: int = 1, log: logging.Logger = logger):
+        self.sample_every = max(1, sample_every)
+        self.logger = log
+        self._successes = itertools.count()
+
+    def enabled(self, level: int) -> bool:
+        return self.logger.isEnabledFor(level)
+
+    def sampled(self) -> bool:
+        """Whether to log this success, call only once per successful request"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return False
+        return self.sample_every == 1 or next(self._successes) % self.sample_every == 0
+
+    def log(self, level: int, event: str, **fields: Any) -> None:
+        if self.logger.isEnabledFor(level):
+            self.logger.log(level, StructuredMessage(event, fields), extra={"event": event, "fields": fields})
+
+
+class StructuredFormatter(logging.Formatter):
+    """
+    kv: ts=... level=INFO logger=... event=request.ok method=GET ..., one JSON object per line for json,
+    text: the classic "time - level - message" line. Records without fields log their message as the event
+    """
+
+    def __init__(self, fmt: str = "kv"):
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown log format {fmt!r}, expected one of {', '.join(FORMATS)}")
+        super().__init__("%(asctime)s - %(levelname)s - %(message)s" if fmt == "text" else None)
+        self.structured = fmt != "text"
+        self.json = fmt == "json"
+
+    def format(self, record: logging.LogRecord) -> str:
+        if not self.structured:
+            return super().format(record)
+        event = getattr(record, "event", None)
+        fields = getattr(record, "fields", None) or {}
+        entry: dict[str, Any] = {
+            "ts": self.formatTime(record, "%Y-%m-%dT%H:%M:%S") + f".{int(record.msecs):03d}",
+            "level": record.levelname,
+            "logger": record.name,
+            "event": event or record.getMessage(),
+            **fields,
+        }
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        if self.json:
+            return json.dumps(entry, ensure_ascii=False, default=str)
+        return " ".join(f"{key}={_kv_value(value)}" for key, value in entry.items())
+
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    Queue handler for a listener in the same process: records are queued as they are,
+    so messages are rendered by the listener thread instead of the thread sending requests
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # %-style arguments may be mutated after the call returns, render those now like QueueHandler does
+        return super().prepare(record) if record.args else record
+
+
+class BackgroundListener(QueueListener):
+    """Queue listener that may be stopped more than once, by its owner and again at exit"""
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            super().stop()
+
+
+def configure_logging(level: int | str = logging.INFO, fmt: str = "kv", stream: TextIO | None = None) -> BackgroundListener:
+    """
+    Log to stream (stderr by default) through a queue drained by a background thread, replacing an earlier call
+    Returns the started listener, stopped (and flushed) at exit
+    """
+    formatter = StructuredFormatter(fmt)
+    root = logging.getLogger()
+    for handler in [handler for handler in root.handlers if isinstance(handler, DeferredQueueHandler)]:
+        root.removeHandler(handler)
+        atexit.unregister(handler.listener.stop)
+        handler.listener.stop()
+    output = logging.StreamHandler(stream or sys.stderr)
+    output.setFormatter(formatter)
+    queue: SimpleQueue = SimpleQueue()
+    listener = BackgroundListener(queue, output, respect_handler_level=True)
+    handler = DeferredQueueHandler(queue)
+    handler.listener = listener
+    root.addHandler(handler)
+    root.setLevel(level)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
@@ -0,0 +1,98 @@
+"""Retry policy deciding which failures are retried and how long to wait between attempts"""
+
+import random
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+
+from httpx import (
+    ConnectError,
+    ConnectTimeout,
+    HTTPStatusError,
+    NetworkError,
+    PoolTimeout,
+    RemoteProtocolError,
+    TimeoutException,
+)
+
+# Statuses that may succeed on a later attempt; other 4xx responses never will
+RETRYABLE_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"})
+# Failures raised before the request reached the server, safe to retry for any method
+CONNECT_ERRORS: tuple[type[Exception], ...] = (ConnectError, ConnectTimeout, PoolTimeout)
+# Failures that may happen after the server got the request, retried for idempotent methods only
+TRANSIENT_ERRORS: tuple[type[Exception], ...] = (TimeoutException, NetworkError, RemoteProtocolError)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Exponential backoff with jitter, Retry-After support and a total deadline across attempts
+    Attempt numbers passed to the policy count failed attempts, starting at 1
+    """
+
+    retries: int = 3
+    backoff: float = 1.0  # delay after the first failure
+    multiplier: float = 2.0  # growth of the delay per further failure
+    max_backoff: float = 30.0
+    jitter: float = 0.5  # share of the delay that is randomised, 0 disables jitter, 1 is "full jitter"
+    retry_statuses: frozenset[int] = RETRYABLE_STATUSES
+    retry_methods: frozenset[str] = IDEMPOTENT_METHODS
+    respect_retry_after: bool = True
+    max_retry_after: float = 60.0
+    deadline: float | None = None  # seconds allowed for all attempts together, None means no limit
+
+    def is_retryable(self, method: str, error: Exception) -> bool:
+        """Classify a failed attempt"""
+        if isinstance(error, HTTPStatusError):
+            return error.response.status_code in self.retry_statuses
+        if isinstance(error, CONNECT_ERRORS):
+            return True
+        return isinstance(error, TRANSIENT_ERRORS) and method.upper() in self.retry_methods
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Exponential backoff for the given failed attempt with part of it randomised"""
+        delay = min(self.max_backoff, self.backoff * self.multiplier ** max(0, attempt - 1))
+        jitter = min(1.0, max(0.0, self.jitter))
+        return delay * (1 - jitter) + random.uniform(0, delay * jitter)
+
+    def retry_after(self, error: Exception) -> float | None:
+        """Seconds requested by the server through the Retry-After header, if any"""
+        if not self.respect_retry_after or not isinstance(error, HTTPStatusError):
+            return None
+        return parse_retry_after(error.response.headers.get("Retry-After"))
+
+    def next_delay(self, method: str, attempt: int, error: Exception, elapsed: float = 0.0) -> float | None:
+        """
+        Delay before the next attempt
+        Returns None when the request must not be retried: error not retryable, retries or deadline exhausted
+        """
+        if attempt > self.retries or not self.is_retryable(method, error):
+            return None
+
+        delay = self.backoff_delay(attempt)
+        retry_after = self.retry_after(error)
+        if retry_after is not None:
+            if retry_after > self.max_retry_after:
+                return None
+            delay = retry_after
+
+        if self.deadline is not None and elapsed + delay > self.deadline:
+            return None
+        return delay
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse Retry-After given either as delay in seconds or as HTTP date"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
@@ -0,0 +1,155 @@
+"""Connection pool, timeout and HTTP/2 settings of the clients, read from the constructor, the environment or a .env file"""
+
+import dataclasses
+import logging
+import os
+import sys
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import cached_property
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Any
+
+import httpx
+from dotenv import dotenv_values
+
+logger = logging.getLogger(__name__)
+
+ENV_PREFIX = "DUMMYJSON_HTTP_"
+# httpx negotiates HTTP/2 through the optional h2 package (pip install "httpx[http2]")
+HTTP2_AVAILABLE = find_spec("h2") is not None
+
+
+def _parse(name: str, value: str, kind: type) -> Any:
+    if value.strip().lower() in ("", "none"):
+        return None
+    if kind is bool:
+        if value.strip().lower() in ("1", "true", "yes", "on"):
+            return True
+        if value.strip().lower() in ("0", "false", "no", "off"):
+            return False
+        raise ValueError(f"{ENV_PREFIX}{name.upper()} should be true or false, got {value!r}")
+    try:
+        return kind(value)
+    except ValueError:
+        raise ValueError(f"{ENV_PREFIX}{name.upper()} should be a {kind.__name__}, got {value!r}") from None
+
+
+@dataclass(frozen=True)
+class TransportConfig:
+    """
+    How clients talk to the server: pool size, keep-alive, per-phase timeouts (seconds, None waits forever),
+    HTTP/2 and how many connections warm_up() opens before the first request (prewarm, 0 to skip)
+    Every field can be set with DUMMYJSON_HTTP_<FIELD>, e.g. DUMMYJSON_HTTP_MAX_CONNECTIONS=20, see from_env
+    """
+
+    max_connections: int | None = 100
+    max_keepalive_connections: int | None = 20
+    keepalive_expiry: float | None = 5.0
+    connect_timeout: float | None = 10.0
+    read_timeout: float | None = 10.0
+    write_timeout: float | None = 10.0
+    pool_timeout: float | None = 10.0
+    http2: bool = False
+    prewarm: int = 0
+    prewarm_path: str = "/"
+
+    @classmethod
+    def from_env(cls, env_file: str | Path | None = None, environ: Mapping[str, str] | None = None, **overrides: Any) -> "TransportConfig":
+        """
+        Settings from DUMMYJSON_HTTP_* variables of env_file (a .env file) and of the environment, which wins
+        Keyword overrides win over both; fields that are set nowhere keep their defaults
+        """
+        values: dict[str, str | None] = dict(dotenv_values(env_file)) if env_file else {}
+        values.update(os.environ if environ is None else environ)
+        kinds = {"max_connections": int, "max_keepalive_connections": int, "prewarm": int, "http2": bool, "prewarm_path": str}
+        settings = {}
+        for field in dataclasses.fields(cls):
+            value = values.get(f"{ENV_PREFIX}{field.name.upper()}")
+            if value is not None:
+                settings[field.name] = _parse(field.name, value, kinds.get(field.name, float))
+        return cls(**{**settings, **overrides})
+
+    @property
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    @property
+    def timeout(self) -> httpx.Timeout:
+        return httpx.Timeout(connect=self.connect_timeout, read=self.read_timeout, write=self.write_timeout, pool=self.pool_timeout)
+
+    @cached_property
+    def use_http2(self) -> bool:
+        """HTTP/2 when asked for and available, a missing h2 package falls back to HTTP/1.1 with a warning"""
+        if self.http2 and not HTTP2_AVAILABLE:
+            logger.warning('HTTP/2 needs the h2 package (pip install "httpx[http2]"), using HTTP/1.1')
+            return False
+        return self.http2
+
+    @property
+    def warm_connections(self) -> int:
+        """Connections warm_up() opens: one HTTP/2 connection carries every concurrent request"""
+        if self.prewarm <= 0:
+            return 0
+        return 1 if self.http2 and HTTP2_AVAILABLE else min(self.prewarm, self.max_connections or self.prewarm)
+
+    def transport(self) -> httpx.HTTPTransport:
+        return httpx.HTTPTransport(http2=self.use_http2, limits=self.limits)
+
+    def async_transport(self) -> httpx.AsyncHTTPTransport:
+        return httpx.AsyncHTTPTransport(http2=self.use_http2, limits=self.limits)
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """
+    Snapshot of a connection pool: open connections (active ones serve a request, idle ones wait for the next),
+    how many of them speak HTTP/2, requests being served and requests queued for a free connection
+    """
+
+    connections: int
+    active: int
+    idle: int
+    http2: int
+    requests: int
+    waiting: int
+    max_connections: int | None
+
+    @property
+    def utilisation(self) -> float:
+        """Share of the allowed connections busy serving requests"""
+        return self.active / self.max_connections if self.max_connections else 0.0
+
+
+def pool_stats(transport: httpx.BaseTransport | httpx.AsyncBaseTransport) -> PoolStats | None:
+    """
+    Stats of the pool of an httpx HTTP transport, also when wrapped by transports keeping it as .transport
+    (cassettes, load recording); None for transports without a pool such as mocks
+    """
+    while transport is not None and not hasattr(transport, "_pool"):
+        transport = (
+            getattr(transport, "transport", None) or getattr(transport, "_transport", None) or getattr(transport, "_async_transport", None)
+        )
+    # httpx keeps its httpcore pool private, reading it is the only way to see connection reuse
+    pool = getattr(transport, "_pool", None)
+    if pool is None:
+        return None
+    max_connections = getattr(pool, "_max_connections", None)
+    connections = list(pool.connections)
+    requests = list(getattr(pool, "_requests", []))
+    idle = sum(connection.is_idle() for connection in connections)
+    return PoolStats(
+        connections=len(connections),
+        active=len(connections) - idle,
+        idle=idle,
+        http2=sum(connection.info().startswith("HTTP/2") for connection in connections),
+        requests=len(requests),
+        waiting=sum(request.connection is None for request in requests),
+        # httpcore stores "no limit" as sys.maxsize
+        max_connections=None if max_connections == sys.maxsize else max_connections,
+    )
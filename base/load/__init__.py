@@ -0,0 +1,4 @@
+from base.load.histogram import LatencyHistogram
+from base.load.runner import LoadProfile, LoadReport, LoadRunner, Scenario
+
+__all__ = ["LatencyHistogram", "LoadProfile", "LoadReport", "LoadRunner", "Scenario"]
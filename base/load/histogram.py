@@ -0,0 +1,71 @@
+"""Latency histogram with bounded relative error, in the style of HdrHistogram"""
+
+import math
+from collections import Counter
+from typing import Self
+
+DEFAULT_PERCENTILES = (50.0, 90.0, 95.0, 99.0, 99.9)
+
+
+class LatencyHistogram:
+    """
+    Counts latencies in logarithmic buckets so that any reported value is within relative_error of a recorded one
+    Memory depends on the range of values, not on how many are recorded; histograms of workers can be merged
+    Values are seconds, reported percentiles are the upper bound of their bucket (never below the true value)
+    """
+
+    def __init__(self, relative_error: float = 0.01, lowest: float = 1e-6):
+        if not 0 < relative_error < 1:
+            raise ValueError("relative_error must be between 0 and 1")
+        self.relative_error = relative_error
+        self.lowest = lowest
+        self._log_base = math.log1p(relative_error)
+        self.counts: Counter[int] = Counter()
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def _bucket(self, value: float) -> int:
+        return math.floor(math.log(max(value, self.lowest) / self.lowest) / self._log_base)
+
+    def _upper(self, bucket: int) -> float:
+        return self.lowest * math.exp((bucket + 1) * self._log_base)
+
+    def record(self, value: float) -> None:
+        self.counts[self._bucket(value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other: Self) -> None:
+        if (other.relative_error, other.lowest) != (self.relative_error, self.lowest):
+            raise ValueError("Only histograms with the same precision can be merged")
+        self.counts.update(other.counts)
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, percentile: float) -> float:
+        """Smallest bucket bound with at least percentile % of the values at or below it, capped by the maximum"""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(self.count * percentile / 100))
+        seen = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen >= rank:
+                return min(self._upper(bucket), self.max)
+        return self.max
+
+    def summary(self, percentiles: tuple[float, ...] = DEFAULT_PERCENTILES) -> dict[str, float]:
+        """Count, min, mean, max and percentiles (keys such as "p99.9") with latencies in seconds"""
+        result = {"count": self.count, "min": self.min if self.count else 0.0, "mean": self.mean, "max": self.max}
+        result.update({f"p{percentile:g}": self.percentile(percentile) for percentile in percentiles})
+        return result
@@ -0,0 +1,257 @@
+"""Async load generator running weighted scenarios in open-loop or closed-loop mode"""
+
+import asyncio
+import itertools
+import math
+import random
+from collections import Counter
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from typing import Any, Literal
+
+import httpx
+
+from base.api.instrumentation import endpoint_template
+from base.api.transport import TransportConfig
+from base.load.histogram import DEFAULT_PERCENTILES, LatencyHistogram
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """A named user journey, picked with probability proportional to weight; run gets the runner's context"""
+
+    name: str
+    weight: float
+    run: Callable[[Any], Awaitable[Any]]
+
+
+@dataclass(frozen=True)
+class LoadProfile:
+    """
+    How load is generated
+    closed: users virtual users loop over scenarios (with think_time between them), rps optionally caps throughput
+    open: scenarios start at rps per second whatever the response times, at most users in flight (later arrivals
+    are dropped); latencies count from the planned start, so a slow server cannot hide queueing (coordinated omission)
+    ramp_up: seconds over which the arrival rate (open) or the number of started users (closed) grows to its target
+    """
+
+    mode: Literal["open", "closed"] = "closed"
+    duration: float = 10.0
+    users: int = 10
+    rps: float | None = None
+    ramp_up: float = 0.0
+    think_time: float = 0.0
+    seed: int | None = None
+
+
+def error_name(error: BaseException) -> str:
+    """Error category for breakdowns, e.g. "HTTP 503" or "ConnectTimeout" """
+    if isinstance(error, httpx.HTTPStatusError):
+        return f"HTTP {error.response.status_code}"
+    return type(error).__name__
+
+
+def endpoint_name(method: str, path: str) -> str:
+    return f"{method} {endpoint_template(path)}"
+
+
+class Stats:
+    """Latencies, outcome counts and error categories of one scenario or endpoint"""
+
+    def __init__(self):
+        self.latency = LatencyHistogram()
+        self.errors: Counter[str] = Counter()
+
+    @property
+    def count(self) -> int:
+        return self.latency.count
+
+    def record(self, latency: float, error: str | None = None) -> None:
+        self.latency.record(latency)
+        if error is not None:
+            self.errors[error] += 1
+
+    def to_dict(self, elapsed: float) -> dict[str, Any]:
+        return {
+            **self.latency.summary(),
+            "errors": sum(self.errors.values()),
+            "error_breakdown": dict(self.errors.most_common()),
+            "throughput": self.count / elapsed if elapsed else 0.0,
+        }
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Wraps a transport and records each request's latency and outcome per endpoint"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, endpoints: dict[str, Stats]):
+        self.transport = transport
+        self.endpoints = endpoints
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        stats = self.endpoints.setdefault(endpoint_name(request.method, request.url.path), Stats())
+        try:
+            response = await self.transport.handle_async_request(request)
+            await response.aread()
+        except Exception as error:
+            stats.record(loop.time() - started, error_name(error))
+            raise
+        stats.record(loop.time() - started, f"HTTP {response.status_code}" if response.is_error else None)
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class LoadReport:
+    """Results of a run: per-scenario and per-endpoint statistics, throughput and dropped arrivals"""
+
+    def __init__(self, profile: LoadProfile, elapsed: float, scenarios: dict[str, Stats], endpoints: dict[str, Stats], dropped: int):
+        self.profile = profile
+        self.elapsed = elapsed
+        self.scenarios = scenarios
+        self.endpoints = endpoints
+        self.dropped = dropped
+
+    @property
+    def total(self) -> int:
+        return sum(stats.count for stats in self.scenarios.values())
+
+    @property
+    def errors(self) -> int:
+        return sum(sum(stats.errors.values()) for stats in self.scenarios.values())
+
+    @property
+    def throughput(self) -> float:
+        return self.total / self.elapsed if self.elapsed else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "profile": self.profile.__dict__,
+            "elapsed": self.elapsed,
+            "total": self.total,
+            "errors": self.errors,
+            "dropped": self.dropped,
+            "throughput": self.throughput,
+            "scenarios": {name: stats.to_dict(self.elapsed) for name, stats in sorted(self.scenarios.items())},
+            "endpoints": {name: stats.to_dict(self.elapsed) for name, stats in sorted(self.endpoints.items())},
+        }
+
+    def format(self) -> str:
+        """Plain-text tables with latencies in milliseconds"""
+        percentiles = [f"p{percentile:g}" for percentile in DEFAULT_PERCENTILES]
+        header = f"{'':<28}{'count':>8}{'errors':>8}{'rps':>9}" + "".join(f"{name:>9}" for name in [*percentiles, "max"])
+        lines = [
+            f"{self.profile.mode}-loop run: {self.total} scenarios in {self.elapsed:.1f}s, {self.throughput:.1f}/s,"
+            f" {self.errors} errors, {self.dropped} dropped"
+        ]
+        for title, group in (("Scenarios", self.scenarios), ("Endpoints", self.endpoints)):
+            lines += ["", title, header]
+            for name, stats in sorted(group.items()):
+                row = stats.to_dict(self.elapsed)
+                latencies = "".join(f"{row[key] * 1000:>9.1f}" for key in [*percentiles, "max"])
+                lines.append(f"{name[:27]:<28}{row['count']:>8}{row['errors']:>8}{row['throughput']:>9.1f}{latencies}")
+        breakdown = Counter()
+        for stats in self.endpoints.values() or self.scenarios.values():
+            breakdown.update(stats.errors)
+        if breakdown:
+            lines += ["", "Errors", *(f"  {name}: {count}" for name, count in breakdown.most_common())]
+        return "\n".join(lines)
+
+
+def arrival_time(index: int, rps: float, ramp_up: float) -> float:
+    """Planned start of arrival index when the rate grows linearly from 0 to rps over ramp_up seconds"""
+    ramp_arrivals = rps * ramp_up / 2
+    if index < ramp_arrivals:
+        return math.sqrt(2 * ramp_up * index / rps)
+    return ramp_up + (index - ramp_arrivals) / rps
+
+
+class LoadRunner:
+    """
+    Runs weighted scenarios against a context (e.g. domain clients sharing one AsyncAPIClient)
+    Pass the transport returned by record_endpoints() to the client to also get per-endpoint statistics
+    """
+
+    def __init__(self, scenarios: Sequence[Scenario], context: Any = None):
+        if not scenarios or any(scenario.weight < 0 for scenario in scenarios) or not sum(s.weight for s in scenarios):
+            raise ValueError("Scenarios need non-negative weights with a positive sum")
+        self.scenarios = list(scenarios)
+        self.context = context
+        self.endpoints: dict[str, Stats] = {}
+
+    def record_endpoints(self, transport: httpx.AsyncBaseTransport | None = None) -> RecordingTransport:
+        return RecordingTransport(transport or TransportConfig.from_env().async_transport(), self.endpoints)
+
+    async def _execute(self, scenario: Scenario, started: float, results: dict[str, Stats]) -> None:
+        error = None
+        try:
+            await scenario.run(self.context)
+        except Exception as exc:
+            error = error_name(exc)
+        results.setdefault(scenario.name, Stats()).record(asyncio.get_running_loop().time() - started, error)
+
+    def _pick(self, rng: random.Random) -> Scenario:
+        return rng.choices(self.scenarios, [scenario.weight for scenario in self.scenarios])[0]
+
+    async def _open_loop(self, profile: LoadProfile, start: float, rng: random.Random, results: dict[str, Stats]) -> int:
+        """Start scenarios on the arrival schedule, returns the number of arrivals dropped for too many in flight"""
+        if not profile.rps:
+            raise ValueError("Open-loop runs need a target rps")
+        loop = asyncio.get_running_loop()
+        tasks: set[asyncio.Task] = set()
+        dropped = 0
+        for index in itertools.count():
+            planned = start + arrival_time(index, profile.rps, profile.ramp_up)
+            if planned >= start + profile.duration:
+                break
+            await asyncio.sleep(max(0.0, planned - loop.time()))
+            if len(tasks) >= profile.users:
+                dropped += 1
+                continue
+            task = asyncio.create_task(self._execute(self._pick(rng), planned, results))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        await asyncio.gather(*tasks)
+        return dropped
+
+    async def _closed_loop(self, profile: LoadProfile, start: float, rng: random.Random, results: dict[str, Stats]) -> None:
+        """Virtual users each running one scenario after the other, paced to rps when it is set"""
+        loop = asyncio.get_running_loop()
+        end = start + profile.duration
+        next_slot = start
+
+        async def user(index: int) -> None:
+            nonlocal next_slot
+            await asyncio.sleep(profile.ramp_up * index / profile.users)
+            while loop.time() < end:
+                if profile.rps:
+                    slot = max(next_slot, loop.time())
+                    next_slot = slot + 1 / profile.rps
+                    if slot >= end:
+                        return
+                    await asyncio.sleep(slot - loop.time())
+                await self._execute(self._pick(rng), loop.time(), results)
+                if profile.think_time:
+                    await asyncio.sleep(profile.think_time)
+
+        await asyncio.gather(*(user(index) for index in range(profile.users)))
+
+    async def run(self, profile: LoadProfile) -> LoadReport:
+        if profile.mode not in ("open", "closed"):
+            raise ValueError(f"Unknown load mode {profile.mode!r}")
+        loop = asyncio.get_running_loop()
+        rng = random.Random(profile.seed)
+        results: dict[str, Stats] = {}
+        self.endpoints.clear()
+        start = loop.time()
+        dropped = 0
+        if profile.mode == "open":
+            dropped = await self._open_loop(profile, start, rng, results)
+        else:
+            await self._closed_loop(profile, start, rng, results)
+        return LoadReport(profile, loop.time() - start, results, dict(self.endpoints), dropped)
+
+    def run_sync(self, profile: LoadProfile) -> LoadReport:
+        return asyncio.run(self.run(profile))
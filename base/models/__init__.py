@@ -1,3 +1,16 @@
 from base.models.base_model import BaseModel
+from base.models.partial import partial_envelope, partial_model
+from base.models.records import Record, record_type, to_model, to_record, to_records
+from base.models.trusted import ModelBuilder
 
-__all__ = ["BaseModel"]
+__all__ = [
+    "BaseModel",
+    "ModelBuilder",
+    "Record",
+    "partial_envelope",
+    "partial_model",
+    "record_type",
+    "to_model",
+    "to_record",
+    "to_records",
+]
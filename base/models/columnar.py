@@ -0,0 +1,208 @@
+"""Columnar tables of API records backed by NumPy arrays (requires the optional numpy dependency)"""
+
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any, ClassVar, Self
+
+import numpy as np
+from pydantic import BaseModel as PydanticBaseModel
+
+# Code of a missing value in a Categorical
+MISSING = -1
+
+
+def _field(record: Any, path: str) -> Any:
+    """Value of a dotted field path (e.g. "hair.color") on a model or a decoded JSON dict"""
+    value = record
+    for name in path.split("."):
+        if value is None:
+            return None
+        value = value.get(name) if isinstance(value, dict) else getattr(value, name, None)
+    return value
+
+
+class Categorical:
+    """Dictionary-encoded strings: an int32 code per row pointing into a sorted array of distinct values"""
+
+    def __init__(self, codes: np.ndarray, categories: np.ndarray):
+        self.codes = codes
+        self.categories = categories
+
+    @classmethod
+    def from_values(cls, values: Sequence[str | None]) -> Self:
+        present = [value for value in values if value is not None]
+        categories = np.array(sorted(set(present)), dtype=object)
+        lookup = {value: code for code, value in enumerate(categories)}
+        codes = np.fromiter((lookup.get(value, MISSING) for value in values), dtype=np.int32, count=len(values))
+        return cls(codes, categories)
+
+    def code(self, value: str) -> int:
+        """Code of value, MISSING when it does not occur"""
+        index = int(np.searchsorted(self.categories, value)) if len(self.categories) else 0
+        return index if index < len(self.categories) and self.categories[index] == value else MISSING
+
+    def __eq__(self, value: object) -> np.ndarray:  # type: ignore[override]
+        code = self.code(value) if isinstance(value, str) else MISSING
+        return self.codes == code if code != MISSING else np.zeros(len(self.codes), dtype=bool)
+
+    def __ne__(self, value: object) -> np.ndarray:  # type: ignore[override]
+        return ~(self == value)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def isin(self, values: Iterable[str]) -> np.ndarray:
+        codes = [code for code in (self.code(value) for value in values) if code != MISSING]
+        return np.isin(self.codes, codes)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, index: Any) -> Self:
+        return type(self)(self.codes[index], self.categories)
+
+    def to_list(self) -> list[str | None]:
+        return [self.categories[code] if code != MISSING else None for code in self.codes.tolist()]
+
+    @property
+    def nbytes(self) -> int:
+        return self.codes.nbytes + sum(len(value) for value in self.categories)
+
+
+Column = np.ndarray | Categorical
+
+
+class GroupBy:
+    """Per-category aggregates of a table, computed with bincount over the category codes"""
+
+    def __init__(self, table: "ColumnTable", key: str):
+        self.table = table
+        self.key = key
+        self.keys: Categorical = table[key]
+        self._valid = self.keys.codes != MISSING
+        self._codes = self.keys.codes[self._valid]
+        self._groups = len(self.keys.categories)
+
+    def _result(self, values: np.ndarray) -> dict[str, Any]:
+        return dict(zip(self.keys.categories.tolist(), values.tolist(), strict=True))
+
+    def _values(self, column: str) -> tuple[np.ndarray, np.ndarray]:
+        """Codes and values of rows with a group and a non-NaN value"""
+        values = self.table[column][self._valid].astype(np.float64)
+        present = ~np.isnan(values)
+        return self._codes[present], values[present]
+
+    def count(self) -> dict[str, int]:
+        return self._result(np.bincount(self._codes, minlength=self._groups))
+
+    def sum(self, column: str) -> dict[str, float]:
+        codes, values = self._values(column)
+        return self._result(np.bincount(codes, weights=values, minlength=self._groups))
+
+    def mean(self, column: str) -> dict[str, float]:
+        codes, values = self._values(column)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = np.bincount(codes, weights=values, minlength=self._groups) / np.bincount(codes, minlength=self._groups)
+        return self._result(means)
+
+    def _extreme(self, column: str, ufunc: np.ufunc, initial: float) -> dict[str, float]:
+        codes, values = self._values(column)
+        result = np.full(self._groups, initial)
+        ufunc.at(result, codes, values)
+        result[result == initial] = np.nan  # groups without values
+        return self._result(result)
+
+    def min(self, column: str) -> dict[str, float]:
+        return self._extreme(column, np.minimum, np.inf)
+
+    def max(self, column: str) -> dict[str, float]:
+        return self._extreme(column, np.maximum, -np.inf)
+
+
+class ColumnTable:
+    """
+    Immutable table with one NumPy array per numeric field and one Categorical per string field
+    Subclasses declare numeric_columns (name -> dtype, nullable numbers should be float) and categorical_columns;
+    dotted names such as "hair.color" read nested fields
+    """
+
+    numeric_columns: ClassVar[dict[str, type]] = {}
+    categorical_columns: ClassVar[tuple[str, ...]] = ()
+    items_key: ClassVar[str] = ""
+
+    def __init__(self, columns: dict[str, Column]):
+        lengths = {len(column) for column in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"Columns have different lengths: {sorted(lengths)}")
+        for column in columns.values():
+            (column.codes if isinstance(column, Categorical) else column).flags.writeable = False
+        self.columns = columns
+
+    @classmethod
+    def from_records(cls, records: Iterable[PydanticBaseModel | dict[str, Any]]) -> Self:
+        """Build from models or decoded JSON dicts, e.g. a response list or a client iterator"""
+        names = [*cls.numeric_columns, *cls.categorical_columns]
+        values: dict[str, list[Any]] = {name: [] for name in names}
+        for record in records:
+            for name in names:
+                values[name].append(_field(record, name))
+        columns: dict[str, Column] = {}
+        for name, dtype in cls.numeric_columns.items():
+            if np.issubdtype(dtype, np.floating):
+                columns[name] = np.array([np.nan if value is None else value for value in values[name]], dtype=dtype)
+            else:
+                columns[name] = np.array(values[name], dtype=dtype)
+        for name in cls.categorical_columns:
+            columns[name] = Categorical.from_values(values[name])
+        return cls(columns)
+
+    @classmethod
+    def from_response(cls, response: PydanticBaseModel) -> Self:
+        """Build from a list response such as ProductsResponse"""
+        return cls.from_records(getattr(response, cls.items_key))
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def __getitem__(self, name: str) -> Any:
+        return self.columns[name]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(rows={len(self)}, columns={list(self.columns)})"
+
+    def take(self, index: np.ndarray) -> Self:
+        """Rows selected by a boolean mask or an array of positions"""
+        return type(self)({name: column[index] for name, column in self.columns.items()})
+
+    def filter(self, mask: np.ndarray | Callable[[Self], np.ndarray]) -> Self:
+        """Rows where mask is true, mask may be a function of the table, e.g. lambda t: t["price"] < 10"""
+        return self.take(mask(self) if callable(mask) else mask)
+
+    def sort(self, by: str, descending: bool = False) -> Self:
+        """Rows ordered by a column, categoricals sort alphabetically; missing values always go last"""
+        column = self.columns[by]
+        if isinstance(column, Categorical):
+            keys, missing = column.codes, column.codes == MISSING
+        else:
+            keys, missing = column, np.isnan(column) if np.issubdtype(column.dtype, np.floating) else np.zeros(len(column), dtype=bool)
+        order = np.argsort(-keys if descending else keys, kind="stable")
+        order = order[~missing[order]]
+        return self.take(np.concatenate([order, np.flatnonzero(missing)]))
+
+    def group_by(self, key: str) -> GroupBy:
+        if not isinstance(self.columns.get(key), Categorical):
+            raise ValueError(f"Can only group by a categorical column, got {key!r}")
+        return GroupBy(self, key)
+
+    def row(self, index: int) -> dict[str, Any]:
+        """One row as a dict, mainly for debugging and reports"""
+        row = {}
+        for name, column in self.columns.items():
+            if isinstance(column, Categorical):
+                code = int(column.codes[index])
+                row[name] = column.categories[code] if code != MISSING else None
+            else:
+                row[name] = column[index].item()
+        return row
+
+    @property
+    def nbytes(self) -> int:
+        return sum(column.nbytes for column in self.columns.values())
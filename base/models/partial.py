@@ -0,0 +1,49 @@
+"""Partial models for responses projected with DummyJSON's select= parameter"""
+
+from collections.abc import Iterable
+from functools import cache
+from typing import Any, get_args
+
+from pydantic import BaseModel as PydanticBaseModel
+from pydantic import create_model
+
+# Returned by DummyJSON whatever is selected
+ALWAYS_SELECTED = frozenset({"id"})
+
+
+def select_params(fields: Iterable[str] | None) -> dict[str, str]:
+    """Query parameters asking the API for fields only (id is always returned)"""
+    return {"select": ",".join(dict.fromkeys(fields))} if fields else {}
+
+
+@cache
+def _partial_model(model: type[PydanticBaseModel], fields: frozenset[str]) -> type[PydanticBaseModel]:
+    unknown = fields - model.model_fields.keys()
+    if unknown:
+        raise ValueError(f"Unknown {model.__name__} fields: {', '.join(sorted(unknown))}")
+    kept = fields | ALWAYS_SELECTED
+    # Fields left out of the projection become optional, so the partial model is still a model subclass
+    dropped: dict[str, Any] = {
+        name: (field.annotation | None, None) for name, field in model.model_fields.items() if name not in kept and field.is_required()
+    }
+    return create_model(f"Partial{model.__name__}", __base__=model, __module__=model.__module__, **dropped)
+
+
+def partial_model[ModelT: PydanticBaseModel](model: type[ModelT], fields: Iterable[str] | None) -> type[ModelT]:
+    """
+    Subclass of model for records holding only fields (plus id); other fields default to None
+    Returns model itself when no fields are given; classes are cached per field set
+    """
+    return _partial_model(model, frozenset(fields)) if fields else model
+
+
+@cache
+def _partial_envelope(envelope: type[PydanticBaseModel], items_key: str, fields: frozenset[str]) -> type[PydanticBaseModel]:
+    (item_model,) = get_args(envelope.model_fields[items_key].annotation)
+    items = (list[_partial_model(item_model, fields)], ...)
+    return create_model(f"Partial{envelope.__name__}", __base__=envelope, __module__=envelope.__module__, **{items_key: items})
+
+
+def partial_envelope[ModelT: PydanticBaseModel](envelope: type[ModelT], items_key: str, fields: Iterable[str] | None) -> type[ModelT]:
+    """List response model (e.g. ProductsResponse) whose items_key list holds partial records"""
+    return _partial_envelope(envelope, items_key, frozenset(fields)) if fields else envelope
@@ -0,0 +1,75 @@
+"""Frozen, slotted record types mirroring pydantic models, for holding large result sets in memory"""
+
+from collections.abc import Iterable, Iterator
+from dataclasses import fields, make_dataclass
+from functools import cache
+from typing import Any, ClassVar
+
+from pydantic import BaseModel as PydanticBaseModel
+
+
+class Record:
+    """Base of generated record types, pickled by model so that records can be sent to worker processes"""
+
+    __slots__ = ()
+    __model__: ClassVar[type[PydanticBaseModel]]
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return _rebuild, (type(self).__model__, {field.name: getattr(self, field.name) for field in fields(self)})
+
+
+def _rebuild(model: type[PydanticBaseModel], values: dict[str, Any]) -> Record:
+    return record_type(model)(**values)
+
+
+@cache
+def record_type(model: type[PydanticBaseModel]) -> type[Record]:
+    """
+    Frozen dataclass with __slots__ and the same fields as model (e.g. Product -> ProductRecord)
+    Nested models become nested records and lists become tuples, so records are hashable and immutable
+    """
+    record = make_dataclass(
+        f"{model.__name__}Record",
+        [(name, Any) for name in model.model_fields],
+        bases=(Record,),
+        frozen=True,
+        slots=True,
+        kw_only=True,
+    )
+    record.__module__ = model.__module__
+    record.__model__ = model
+    record.__doc__ = f"Read-only, slotted counterpart of {model.__name__}"
+    return record
+
+
+def _to_record_value(value: Any) -> Any:
+    if isinstance(value, PydanticBaseModel):
+        return to_record(value)
+    if isinstance(value, list):
+        return tuple(_to_record_value(item) for item in value)
+    return value
+
+
+def to_record(instance: PydanticBaseModel) -> Record:
+    """Convert a model instance (partial models get a record type of their own) into its record type"""
+    model = type(instance)
+    values = instance.__dict__
+    return record_type(model)(**{name: _to_record_value(values.get(name)) for name in model.model_fields})
+
+
+def to_records(instances: Iterable[PydanticBaseModel]) -> Iterator[Record]:
+    """Convert models lazily, e.g. to_records(client.iter_products()) never holds more than one page of models"""
+    return (to_record(instance) for instance in instances)
+
+
+def _to_data(value: Any) -> Any:
+    if isinstance(value, Record):
+        return {field.name: _to_data(getattr(value, field.name)) for field in fields(value)}
+    if isinstance(value, tuple):
+        return [_to_data(item) for item in value]
+    return value
+
+
+def to_model(record: Record) -> PydanticBaseModel:
+    """Convert a record back into a validated pydantic model"""
+    return type(record).__model__.model_validate(_to_data(record))
@@ -0,0 +1 @@
+"""Micro-benchmarks for the client layer"""
@@ -0,0 +1,103 @@
+"""
+Run the benchmark suites offline and compare results with a stored baseline
+python -m benchmarks run --output bench.json
+python -m benchmarks run --quick --only "^(client|models)/" --baseline benchmarks/baseline.json
+python -m benchmarks compare bench.json benchmarks/baseline.json --threshold 0.15
+"""
+
+import argparse
+import sys
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+from benchmarks import bench_assignment, bench_client, bench_decoding, bench_models, bench_pagination, bench_records, bench_tables
+from benchmarks.harness import (
+    DEFAULT_THRESHOLD,
+    QUICK_SIZES,
+    Case,
+    Config,
+    compare,
+    format_comparison,
+    load_results,
+    run_cases,
+    save_results,
+)
+from benchmarks.payloads import Payloads
+
+SUITES: dict[str, Callable[[Config], Iterator[Case]]] = {
+    "client": bench_client.cases,
+    "models": bench_models.cases,
+    "pagination": bench_pagination.cases,
+    "assignment": bench_assignment.cases,
+    "decoding": bench_decoding.cases,
+    "records": bench_records.cases,
+    "tables": bench_tables.cases,
+}
+
+
+def all_cases(config: Config) -> Iterator[Case]:
+    for suite in SUITES.values():
+        yield from suite(config)
+
+
+def report(current: dict, baseline_path: Path, threshold: float, only: str | None = None) -> int:
+    """Print the comparison, returns 1 when a case regressed"""
+    baseline = load_results(baseline_path)
+    comparisons = compare(current, baseline, threshold, only)
+    print(format_comparison(comparisons, {**baseline, **current}))
+    regressions = [item.name for item in comparisons if item.status == "regression"]
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+def parse_sizes(value: str) -> tuple[int, ...]:
+    return tuple(int(size) for size in value.split(","))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmarks of the client, model and parsing hot paths")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Measure the cases and write the results as JSON")
+    run.add_argument("--only", default=None, metavar="REGEX", help=f"Cases whose name matches, suites: {', '.join(SUITES)}")
+    run.add_argument("--sizes", type=parse_sizes, default=None, help="Record counts for model cases (default 1,100,10000,100000)")
+    run.add_argument("--quick", action="store_true", help=f"Smaller sizes ({','.join(map(str, QUICK_SIZES))}) and fewer samples")
+    run.add_argument("--repeat", type=int, default=None, help="Samples per case, the median is compared (default 5)")
+    run.add_argument("--min-time", type=float, default=None, help="Seconds each sample loops for (default 0.2)")
+    run.add_argument("--latency", type=float, default=Config.latency, help="Simulated round trip in pagination cases")
+    run.add_argument("--cassette", type=Path, default=None, help="Grow payloads from products and users recorded in a cassette")
+    run.add_argument("--output", type=Path, default=Path("bench.json"), help="Results file (default bench.json)")
+    run.add_argument("--baseline", type=Path, default=None, help="Compare with this results file, exit 1 on regressions")
+    run.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Relative change of the median that counts")
+
+    check = commands.add_parser("compare", help="Compare two results files, exit 1 on regressions")
+    check.add_argument("current", type=Path)
+    check.add_argument("baseline", type=Path)
+    check.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Relative change of the median that counts")
+
+    commands.add_parser("list", help="Print the case names")
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+        return report(load_results(args.current), args.baseline, args.threshold)
+    if args.command == "list":
+        print("\n".join(case.name for case in all_cases(Config())))
+        return 0
+
+    config = Config(
+        sizes=args.sizes or (QUICK_SIZES if args.quick else Config.sizes),
+        repeat=args.repeat or (3 if args.quick else Config.repeat),
+        min_time=args.min_time or (0.05 if args.quick else Config.min_time),
+        latency=args.latency,
+        payloads=Payloads(args.cassette),
+    )
+    results = run_cases(all_cases(config), config, args.only, progress=print)
+    save_results(args.output, results, config)
+    print(f"\n{len(results)} cases written to {args.output}")
+    return report(results, args.baseline, args.threshold, args.only) if args.baseline else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
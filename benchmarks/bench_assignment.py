@@ -0,0 +1,39 @@
+"""
+Cost of validate_assignment=True (set on every model through base.models.base_model.BaseModel)
+Run: python -m benchmarks run --only ^assignment/
+"""
+
+from collections.abc import Callable, Iterator
+from typing import Any
+
+from pydantic import ConfigDict
+
+from benchmarks.harness import Case, Config
+from benchmarks.payloads import full_product
+from dummyjson.models.product import Product
+
+
+class UncheckedProduct(Product):
+    """Product with plain attribute assignment, as a model without validate_assignment behaves"""
+
+    model_config = ConfigDict(validate_assignment=False)
+
+
+def assign(model: type[Product], field: str, value: Any) -> Callable[[], Callable[[], Any]]:
+    def prepare() -> Callable[[], Any]:
+        product = model.model_validate(full_product(1))
+        return lambda: setattr(product, field, value)
+
+    return prepare
+
+
+def copy_with_update() -> Callable[[], Any]:
+    product = Product.model_validate(full_product(1))
+    return lambda: product.model_copy(update={"price": 12.5})
+
+
+def cases(config: Config) -> Iterator[Case]:
+    for field, value in (("price", 12.5), ("title", " Renamed product "), ("tags", ["beauty", "sale"])):
+        yield Case(f"assignment/validated/{field}", assign(Product, field, value))
+        yield Case(f"assignment/plain/{field}", assign(UncheckedProduct, field, value))
+    yield Case("assignment/model_copy", copy_with_update)
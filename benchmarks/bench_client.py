@@ -0,0 +1,78 @@
+"""
+Overhead of APIClient.request per call over an in-memory transport, against plain httpx
+Run: python -m benchmarks run --only ^client/
+"""
+
+import atexit
+import logging
+import os
+from collections.abc import Callable, Iterator
+from logging.handlers import QueueListener
+from queue import SimpleQueue
+from typing import Any
+
+import httpx
+
+from base.api.api_client import APIClient
+from base.api.instrumentation import MetricsRegistry, RequestHooks
+from base.api.request_log import DeferredQueueHandler, RequestLog, StructuredFormatter
+from benchmarks.harness import Case, Config
+
+BASE_URL = "https://dummyjson.com"
+BODY = b'{"id":1,"title":"Essence Mascara Lash Princess","price":9.99}'
+DEFAULT_HEADERS = {"Accept": "application/json", "User-Agent": "dummyjson-tests", "X-Request-Source": "benchmarks"}
+
+
+def respond(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, content=BODY, headers={"Content-Type": "application/json"})
+
+
+def httpx_get() -> Callable[[], Any]:
+    client = httpx.Client(base_url=BASE_URL, transport=httpx.MockTransport(respond))
+    return lambda: client.get("/products/1")
+
+
+def queued_logger() -> logging.Logger:
+    """Logger writing key=value lines to /dev/null from a background thread, as configure_logging sets up the root logger"""
+    log = logging.getLogger("benchmarks.queued")
+    if not log.handlers:
+        devnull = open(os.devnull, "w")  # noqa: SIM115
+        output = logging.StreamHandler(devnull)
+        output.setFormatter(StructuredFormatter("kv"))
+        queue: SimpleQueue = SimpleQueue()
+        listener = QueueListener(queue, output)
+        listener.start()
+        atexit.register(listener.stop)
+        log.addHandler(DeferredQueueHandler(queue))
+        log.propagate = False
+    return log
+
+
+def client_get(
+    headers: bool = False, logging: bool = False, hooks: bool = False, sample_every: int = 1, queued: bool = False
+) -> Callable[[], Callable[[], Any]]:
+    def prepare() -> Callable[[], Any]:
+        api = APIClient(
+            BASE_URL,
+            enable_logging=logging,
+            request_log=RequestLog(sample_every, queued_logger()) if queued else RequestLog(sample_every),
+            hooks=MetricsRegistry().attach(RequestHooks()) if hooks else None,
+            transport=httpx.MockTransport(respond),
+        )
+        if headers:
+            api.set_default_headers(DEFAULT_HEADERS)
+            api.set_bearer_token("token")
+            return lambda: api.get("/products/1", headers={"X-Trace": "1"})
+        return lambda: api.get("/products/1")
+
+    return prepare
+
+
+def cases(config: Config) -> Iterator[Case]:
+    yield Case("client/httpx.get", httpx_get)
+    yield Case("client/request", client_get())
+    yield Case("client/request+headers", client_get(headers=True), params={"default_headers": len(DEFAULT_HEADERS) + 1})
+    yield Case("client/request+logging", client_get(logging=True))
+    yield Case("client/request+logging/queued", client_get(logging=True, queued=True))
+    yield Case("client/request+logging/sampled", client_get(logging=True, sample_every=100), params={"sample_every": 100})
+    yield Case("client/request+hooks", client_get(hooks=True))
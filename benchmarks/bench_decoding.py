@@ -0,0 +1,44 @@
+"""
+Compare decoding paths for large list responses, including trusted (non-validating) and sampled construction
+Run: python -m benchmarks run --only ^decoding/
+"""
+
+import json
+from collections.abc import Callable, Iterator
+from typing import Any
+
+from base.api.decoders import available_decoders, get_decoder
+from base.models.trusted import ModelBuilder
+from benchmarks.harness import Case, Config
+from dummyjson.models.product import ProductsResponse
+from dummyjson.models.user import UsersResponse
+
+BUILDERS = {"trusted": ModelBuilder(trusted=True), "sampled": ModelBuilder(trusted=True, sample_every=10)}
+
+
+def decode(name: str, model: type, payload: Callable[[], Any]) -> Callable[[], Callable[[], Any]]:
+    def prepare() -> Callable[[], Any]:
+        content, decoder = json.dumps(payload()).encode(), get_decoder(name)
+        return lambda: decoder.decode(content, model)
+
+    return prepare
+
+
+def build(builder: ModelBuilder, model: type, payload: Callable[[], Any]) -> Callable[[], Callable[[], Any]]:
+    def prepare() -> Callable[[], Any]:
+        content, loads = json.dumps(payload()).encode(), get_decoder("orjson").loads
+        return lambda: builder.build(model, loads(content))
+
+    return prepare
+
+
+def cases(config: Config) -> Iterator[Case]:
+    for count in (size for size in config.sizes if size >= 100):  # noqa: PLR2004
+        for label, model, payload in (
+            ("UsersResponse", UsersResponse, lambda count=count: config.payloads.users(count)),
+            ("ProductsResponse", ProductsResponse, lambda count=count: config.payloads.products(count)),
+        ):
+            for name in available_decoders():
+                yield Case(f"decoding/{label}/{name}/n={count}", decode(name, model, payload), params={"records": count})
+            for name, builder in BUILDERS.items():
+                yield Case(f"decoding/{label}/{name}/n={count}", build(builder, model, payload), params={"records": count})
@@ -0,0 +1,59 @@
+"""
+response.json() plus model_validate for single records and list envelopes at growing record counts
+Run: python -m benchmarks run --only ^models/ --sizes 1,100,10000
+"""
+
+import json
+from collections.abc import Callable, Iterator
+from typing import Any
+
+import httpx
+
+from benchmarks.harness import Case, Config
+from dummyjson.models.product import Product, ProductsResponse
+from dummyjson.models.user import User, UsersResponse
+
+
+def response_of(payload: Any) -> Callable[[], httpx.Response]:
+    """Fresh responses over the same bytes, so nothing decoded is reused between calls"""
+    content = json.dumps(payload).encode()
+    return lambda: httpx.Response(200, content=content)
+
+
+def decode_only(payload: Callable[[], Any]) -> Callable[[], Callable[[], Any]]:
+    def prepare() -> Callable[[], Any]:
+        response = response_of(payload())
+        return lambda: response().json()
+
+    return prepare
+
+
+def validate_items(model: type, payload: Callable[[], dict[str, Any]], key: str) -> Callable[[], Callable[[], Any]]:
+    """Records validated one by one, as when a client reads them individually or streams a page"""
+
+    def prepare() -> Callable[[], Any]:
+        response = response_of(payload()[key])
+        return lambda: [model.model_validate(item) for item in response().json()]
+
+    return prepare
+
+
+def validate_envelope(model: type, payload: Callable[[], dict[str, Any]]) -> Callable[[], Callable[[], Any]]:
+    def prepare() -> Callable[[], Any]:
+        response = response_of(payload())
+        return lambda: model.model_validate(response().json())
+
+    return prepare
+
+
+def cases(config: Config) -> Iterator[Case]:
+    for count in config.sizes:
+        products = lambda count=count: config.payloads.products(count)  # noqa: E731
+        users = lambda count=count: config.payloads.users(count)  # noqa: E731
+        params = {"records": count}
+        yield Case(f"models/json/products/n={count}", decode_only(products), params=params)
+        yield Case(f"models/Product/n={count}", validate_items(Product, products, "products"), params=params)
+        yield Case(f"models/ProductsResponse/n={count}", validate_envelope(ProductsResponse, products), params=params)
+        yield Case(f"models/json/users/n={count}", decode_only(users), params=params)
+        yield Case(f"models/User/n={count}", validate_items(User, users, "users"), params=params)
+        yield Case(f"models/UsersResponse/n={count}", validate_envelope(UsersResponse, users), params=params)
@@ -0,0 +1,78 @@
+"""
+Ways of reading a whole collection from the fake backend with a simulated round trip per request
+Run: python -m benchmarks run --only ^pagination/ --latency 0.005
+"""
+
+import asyncio
+import time
+from collections.abc import Callable, Iterator
+from typing import Any
+
+import httpx
+
+from base.api.api_client import APIClient
+from base.api.async_api_client import AsyncAPIClient
+from benchmarks.harness import Case, Config
+from dummyjson.clients.product_client import AsyncProductClient, ProductClient
+from dummyjson.fake import FakeDummyJSON
+
+BASE_URL = "https://dummyjson.com"
+PRODUCT_COUNT = 1000
+PAGE_SIZE = 100
+
+
+class LatencyTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """Delays every response of the wrapped in-process transport by a fixed round trip"""
+
+    def __init__(self, transport: httpx.MockTransport, latency: float):
+        self.transport = transport
+        self.latency = latency
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        time.sleep(self.latency)
+        return self.transport.handle_request(request)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(self.latency)
+        return await self.transport.handle_async_request(request)
+
+
+def sync_strategy(read: Callable[[ProductClient], Any], config: Config) -> Callable[[], Callable[[], Any]]:
+    def prepare() -> Callable[[], Any]:
+        backend = FakeDummyJSON(products=config.payloads.products(PRODUCT_COUNT)["products"])
+        api = APIClient(BASE_URL, enable_logging=False, transport=LatencyTransport(backend.transport(), config.latency))
+        products = ProductClient(api)
+        return lambda: read(products)
+
+    return prepare
+
+
+def async_strategy(config: Config, concurrency: int) -> Callable[[], Callable[[], Any]]:
+    def prepare() -> Callable[[], Any]:
+        backend = FakeDummyJSON(products=config.payloads.products(PRODUCT_COUNT)["products"])
+        api = AsyncAPIClient(BASE_URL, enable_logging=False, transport=LatencyTransport(backend.transport(), config.latency))
+        products = AsyncProductClient(api)
+
+        async def read() -> None:
+            # Nothing is returned: resetting SIGINT after Runner.run formats a repr of the main task and its result,
+            # which for 1000 products costs more than the fetch itself
+            await products.get_all_products(PAGE_SIZE, fetch_all=True, concurrency=concurrency)
+
+        # One loop for all calls, like the sync cases reuse their client
+        runner = asyncio.Runner()
+        return lambda: runner.run(read())
+
+    return prepare
+
+
+def cases(config: Config) -> Iterator[Case]:
+    params = {"records": PRODUCT_COUNT, "page_size": PAGE_SIZE, "latency": config.latency}
+    strategies = {
+        "limit=0": lambda products: products.get_all_products(limit=0),
+        "sequential": lambda products: products.get_all_products(PAGE_SIZE, fetch_all=True, concurrency=1),
+        "threads": lambda products: products.get_all_products(PAGE_SIZE, fetch_all=True),
+        "iterator": lambda products: list(products.iter_products(PAGE_SIZE)),
+    }
+    for name, read in strategies.items():
+        yield Case(f"pagination/{name}", sync_strategy(read, config), params=params)
+    yield Case("pagination/async", async_strategy(config, concurrency=8), params=params)
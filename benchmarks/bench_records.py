@@ -0,0 +1,51 @@
+"""
+Memory held by products and users as pydantic models versus frozen slotted records
+Run: python -m benchmarks run --only ^records/
+"""
+
+import gc
+import tracemalloc
+from collections.abc import Callable, Iterator
+from typing import Any
+
+from base.models.records import to_records
+from benchmarks.harness import Case, Config
+from dummyjson.models.product import Product
+from dummyjson.models.user import User
+
+RECORD_COUNT = 10_000
+
+
+def retained_bytes(build: Callable[[], object]) -> int:
+    """Memory still allocated by the object build() returns, once temporaries are collected"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        gc.collect()
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del result
+    return size
+
+
+def footprint(model: type, items: Callable[[], list[dict[str, Any]]], as_records: bool) -> Callable[[], Callable[[], int]]:
+    def prepare() -> Callable[[], int]:
+        data = items()
+        if as_records:
+            # Models are converted one by one and dropped, as when streaming a client iterator into records
+            return lambda: retained_bytes(lambda: list(to_records(model.model_validate(item) for item in data)))
+        return lambda: retained_bytes(lambda: [model.model_validate(item) for item in data])
+
+    return prepare
+
+
+def cases(config: Config) -> Iterator[Case]:
+    params = {"records": RECORD_COUNT}
+    for label, model, items in (
+        ("products", Product, lambda: config.payloads.products(RECORD_COUNT)["products"]),
+        ("users", User, lambda: config.payloads.users(RECORD_COUNT)["users"]),
+    ):
+        yield Case(f"records/{label}/models", footprint(model, items, as_records=False), unit="bytes", params=params)
+        yield Case(f"records/{label}/records", footprint(model, items, as_records=True), unit="bytes", params=params)
@@ -0,0 +1,62 @@
+"""
+Compare per-category price statistics over list[Product] with the same scan over a ProductTable
+Run: python -m benchmarks run --only ^tables/
+"""
+
+import tracemalloc
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from typing import Any
+
+from benchmarks.harness import Case, Config
+from dummyjson.models.product import Product, ProductsResponse
+from dummyjson.models.tables import ProductTable
+
+PRODUCT_COUNT = 10_000
+
+
+def mean_price_by_category(products: list[Product]) -> dict[str, float]:
+    totals: dict[str, float] = defaultdict(float)
+    counts: dict[str, int] = defaultdict(int)
+    for product in products:
+        totals[product.category] += product.price
+        counts[product.category] += 1
+    return {category: totals[category] / counts[category] for category in totals}
+
+
+def traced(fn: Callable[[], Any]) -> int:
+    """Memory allocated by fn and still held when it returns, in bytes"""
+    tracemalloc.start()
+    try:
+        result = fn()  # noqa: F841 - kept alive until the measurement is taken
+        return tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def cases(config: Config) -> Iterator[Case]:
+    params = {"records": PRODUCT_COUNT}
+
+    def response() -> ProductsResponse:
+        return ProductsResponse.model_validate(config.payloads.products(PRODUCT_COUNT))
+
+    def models_memory() -> Callable[[], int]:
+        payload = config.payloads.products(PRODUCT_COUNT)
+        return lambda: traced(lambda: ProductsResponse.model_validate(payload))
+
+    def table_memory() -> Callable[[], int]:
+        products = response()
+        return lambda: traced(lambda: ProductTable.from_response(products))
+
+    def loop_group_by() -> Callable[[], Any]:
+        products = response().products
+        return lambda: mean_price_by_category(products)
+
+    def table_group_by() -> Callable[[], Any]:
+        table = ProductTable.from_response(response())
+        return lambda: table.group_by("category").mean("price")
+
+    yield Case("tables/list[Product]/memory", models_memory, unit="bytes", params=params)
+    yield Case("tables/ProductTable/memory", table_memory, unit="bytes", params=params)
+    yield Case("tables/list[Product]/group-by", loop_group_by, params=params)
+    yield Case("tables/ProductTable/group-by", table_group_by, params=params)
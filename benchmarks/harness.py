@@ -0,0 +1,238 @@
+"""Measure benchmark cases, store results as JSON and compare them with a baseline"""
+
+import gc
+import json
+import logging
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import timeit
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from importlib import metadata
+from pathlib import Path
+from typing import Any
+
+from benchmarks.payloads import Payloads
+
+RESULTS_VERSION = 1
+DEFAULT_SIZES = (1, 100, 10_000, 100_000)
+QUICK_SIZES = (1, 100, 1_000)
+# Relative change of the median beyond which a case is reported as a regression or an improvement
+DEFAULT_THRESHOLD = 0.10
+
+
+@dataclass
+class Config:
+    """Knobs shared by all suites: record counts, sampling and where payloads come from"""
+
+    sizes: tuple[int, ...] = DEFAULT_SIZES
+    repeat: int = 5
+    min_time: float = 0.2
+    # Simulated round trip of each request in network-bound cases (pagination)
+    latency: float = 0.002
+    payloads: Payloads = field(default_factory=Payloads)
+
+
+@dataclass
+class Case:
+    """
+    One measurement: prepare() builds the inputs and returns the callable to measure
+    With unit "s" the callable is timed (seconds per call); any other unit means it returns the measurement itself
+    """
+
+    name: str
+    prepare: Callable[[], Callable[[], Any]]
+    unit: str = "s"
+    params: dict[str, Any] = field(default_factory=dict)
+
+
+def time_call(fn: Callable[[], Any], repeat: int, min_time: float) -> tuple[list[float], int]:
+    """Seconds per call of repeat samples, each looping fn long enough to last at least min_time"""
+    timer = timeit.Timer(fn, setup=gc.enable)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time:
+            break
+        # Aim a little past min_time from the last run instead of growing tenfold each time
+        number = max(number + 1, int(number * min_time * 1.2 / max(elapsed, 1e-9)))
+    samples = [elapsed / number] + [total / number for total in timer.repeat(repeat - 1, number)]
+    return samples, number
+
+
+def measure(case: Case, config: Config) -> dict[str, Any]:
+    fn = case.prepare()
+    try:
+        if case.unit == "s":
+            samples, number = time_call(fn, config.repeat, config.min_time)
+        else:
+            samples, number = [float(fn())], 1
+    finally:
+        del fn
+        gc.collect()
+    quartiles = statistics.quantiles(samples, n=4) if len(samples) > 1 else [samples[0]] * 3
+    return {
+        "unit": case.unit,
+        "params": case.params,
+        "median": statistics.median(samples),
+        "min": min(samples),
+        "max": max(samples),
+        "iqr": quartiles[2] - quartiles[0],
+        "number": number,
+        "samples": samples,
+    }
+
+
+@contextmanager
+def quiet_logging() -> Iterator[None]:
+    """Send log records to /dev/null at INFO, so cases with logging pay for formatting and writing without the noise"""
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    with open(os.devnull, "w") as devnull:
+        handler = logging.StreamHandler(devnull)
+        handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
+        root.handlers[:] = [handler]
+        root.setLevel(logging.INFO)
+        try:
+            yield
+        finally:
+            root.handlers[:] = handlers
+            root.setLevel(level)
+
+
+def run_cases(
+    cases: Iterable[Case], config: Config, only: str | None = None, progress: Callable[[str], None] | None = None
+) -> dict[str, Any]:
+    """Measure the cases whose name matches the only regex (all by default), in order"""
+    pattern = re.compile(only) if only else None
+    results: dict[str, Any] = {}
+    with quiet_logging():
+        for case in cases:
+            if pattern is not None and not pattern.search(case.name):
+                continue
+            results[case.name] = measure(case, config)
+            if progress is not None:
+                progress(format_row(case.name, results[case.name]))
+    return results
+
+
+def _git_commit() -> str | None:
+    try:
+        output = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5, check=True)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return output.stdout.strip() or None
+
+
+def environment() -> dict[str, Any]:
+    """What the numbers depend on besides the code: interpreter, platform and key library versions"""
+    versions = {}
+    for package in ("httpx", "pydantic", "pydantic-core", "orjson", "msgspec", "numpy"):
+        try:
+            versions[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            continue
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "packages": versions,
+        "commit": _git_commit(),
+    }
+
+
+def save_results(path: str | Path, results: dict[str, Any], config: Config) -> None:
+    document = {
+        "version": RESULTS_VERSION,
+        "created": datetime.now(UTC).isoformat(timespec="seconds"),
+        "environment": environment(),
+        "config": {"sizes": list(config.sizes), "repeat": config.repeat, "min_time": config.min_time, "latency": config.latency},
+        "results": results,
+    }
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(document, indent=2), encoding="utf-8")
+
+
+def load_results(path: str | Path) -> dict[str, Any]:
+    document = json.loads(Path(path).read_text(encoding="utf-8"))
+    if document.get("version") != RESULTS_VERSION:
+        raise ValueError(f"Unsupported results version {document.get('version')} in {path}")
+    return document["results"]
+
+
+@dataclass
+class Comparison:
+    """Change of one case against the baseline, ratio is current / baseline median (lower is better)"""
+
+    name: str
+    status: str  # regression, improvement, unchanged, new or missing
+    baseline: float | None = None
+    current: float | None = None
+    ratio: float | None = None
+
+
+def classify(baseline: dict[str, Any], current: dict[str, Any], threshold: float) -> str:
+    """
+    A change counts when the medians differ by more than threshold and, for timings,
+    the sample ranges do not overlap, so a single noisy sample cannot flag a regression
+    """
+    ratio = current["median"] / baseline["median"] if baseline["median"] else float("inf")
+    if ratio > 1 + threshold and current["min"] > baseline["max"]:
+        return "regression"
+    if ratio < 1 - threshold and current["max"] < baseline["min"]:
+        return "improvement"
+    return "unchanged"
+
+
+def compare(
+    current: dict[str, Any], baseline: dict[str, Any], threshold: float = DEFAULT_THRESHOLD, only: str | None = None
+) -> list[Comparison]:
+    """Compare every case of both runs, baseline cases not matching only (a run restricted with --only) are ignored"""
+    pattern = re.compile(only) if only else None
+    baseline = {name: result for name, result in baseline.items() if pattern is None or pattern.search(name)}
+    comparisons = []
+    for name in sorted(current.keys() | baseline.keys()):
+        if name not in baseline:
+            comparisons.append(Comparison(name, "new", current=current[name]["median"]))
+        elif name not in current:
+            comparisons.append(Comparison(name, "missing", baseline=baseline[name]["median"]))
+        else:
+            old, new = baseline[name]["median"], current[name]["median"]
+            status = classify(baseline[name], current[name], threshold)
+            comparisons.append(Comparison(name, status, old, new, new / old if old else None))
+    return comparisons
+
+
+def format_value(value: float, unit: str) -> str:
+    if unit != "s":
+        return f"{value / 1024:,.0f} KB" if unit == "bytes" else f"{value:g} {unit}"
+    for scale, suffix in ((1, "s"), (1e-3, "ms"), (1e-6, "us")):
+        if value >= scale:
+            return f"{value / scale:.2f} {suffix}"
+    return f"{value * 1e9:.0f} ns"
+
+
+def format_row(name: str, result: dict[str, Any]) -> str:
+    spread = f"±{result['iqr'] / result['median']:.1%}" if result["unit"] == "s" and result["median"] else ""
+    return f"{name:<58}{format_value(result['median'], result['unit']):>14}{spread:>9}"
+
+
+def format_comparison(comparisons: list[Comparison], results: dict[str, Any]) -> str:
+    """Table of the comparisons, results (of either run) give the unit of each case"""
+    lines = [f"{'case':<58}{'baseline':>14}{'current':>14}{'change':>9}  status"]
+    for item in comparisons:
+        unit = results.get(item.name, {}).get("unit", "s")
+        old = format_value(item.baseline, unit) if item.baseline is not None else "-"
+        new = format_value(item.current, unit) if item.current is not None else "-"
+        change = f"{item.ratio - 1:+.1%}" if item.ratio is not None else ""
+        lines.append(f"{item.name:<58}{old:>14}{new:>14}{change:>9}  {item.status}")
+    return "\n".join(lines)
@@ -0,0 +1,108 @@
+"""Large DummyJSON-shaped list payloads for benchmarks, synthetic or grown from recorded responses"""
+
+import json
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from base.api.cassette import Cassette
+from dummyjson.tests.unit.factories import make_product, make_user
+
+# Recorded single-resource paths whose body is one product or user
+RESOURCE_PATH = re.compile(r"/(?P<kind>products|users)/\d+")
+
+
+def full_product(product_id: int) -> dict[str, Any]:
+    """Product with every optional field, reviews and metadata filled in"""
+    review = {
+        "rating": 4,
+        "comment": "Very satisfied!",
+        "date": "2024-05-23T08:56:21.618Z",
+        "reviewerName": "Lucas Gordon",
+        "reviewerEmail": "lucas.gordon@x.dummyjson.com",
+    }
+    return {
+        **make_product(product_id),
+        "discountPercentage": 7.17,
+        "rating": 4.94,
+        "tags": ["beauty", "mascara"],
+        "brand": "Essence",
+        "sku": "RCH45Q1A",
+        "weight": 2,
+        "dimensions": {"width": 23.17, "height": 14.43, "depth": 28.01},
+        "warrantyInformation": "1 month warranty",
+        "shippingInformation": "Ships in 1 month",
+        "availabilityStatus": "Low Stock",
+        "reviews": [review] * 3,
+        "returnPolicy": "30 days return policy",
+        "minimumOrderQuantity": 24,
+        "meta": {
+            "createdAt": "2024-05-23T08:56:21.618Z",
+            "updatedAt": "2024-05-23T08:56:21.618Z",
+            "barcode": "9164035109868",
+            "qrCode": "https://assets.dummyjson.com/public/qr-code.png",
+        },
+        "thumbnail": "https://cdn.dummyjson.com/products/images/beauty/thumbnail.png",
+        "images": ["https://cdn.dummyjson.com/products/images/beauty/1.png"],
+    }
+
+
+def products_payload(count: int) -> dict[str, Any]:
+    """limit=0 style dump of count products"""
+    return {"products": [full_product(i) for i in range(1, count + 1)], "total": count, "skip": 0, "limit": count}
+
+
+def users_payload(count: int) -> dict[str, Any]:
+    """limit=0 style dump of count users"""
+    return {"users": [make_user(i) for i in range(1, count + 1)], "total": count, "skip": 0, "limit": count}
+
+
+def recorded_items(path: str | Path) -> dict[str, list[dict[str, Any]]]:
+    """Distinct products and users found in the successful JSON responses of a cassette, keyed by collection"""
+    items: dict[str, dict[int, dict[str, Any]]] = {"products": {}, "users": {}}
+    for interaction in Cassette(path).interactions:
+        if interaction.status != 200 or interaction.base64:  # noqa: PLR2004
+            continue
+        try:
+            body = json.loads(interaction.content)
+        except ValueError:
+            continue
+        match = RESOURCE_PATH.fullmatch(interaction.path)
+        for kind, by_id in items.items():
+            found = body.get(kind, []) if isinstance(body, dict) else []
+            if match and match["kind"] == kind:
+                found = [body]
+            for item in found:
+                if isinstance(item, dict) and "id" in item:
+                    by_id[item["id"]] = item
+    return {kind: list(by_id.values()) for kind, by_id in items.items()}
+
+
+class Payloads:
+    """
+    List payloads of any size: synthetic by default, or the products and users recorded in a cassette
+    repeated with fresh ids, so benchmarks run offline on the shapes the real service returns
+    A kind missing from the cassette falls back to synthetic records
+    """
+
+    def __init__(self, cassette: str | Path | None = None):
+        self.cassette = cassette
+        self.recorded = recorded_items(cassette) if cassette else {"products": [], "users": []}
+        # Only the latest size is kept, large payloads hold hundreds of megabytes
+        self.products = lru_cache(maxsize=1)(self._products)
+        self.users = lru_cache(maxsize=1)(self._users)
+
+    def _grow(self, kind: str, count: int) -> list[dict[str, Any]]:
+        templates = self.recorded[kind]
+        return [{**templates[index % len(templates)], "id": index + 1} for index in range(count)]
+
+    def _products(self, count: int) -> dict[str, Any]:
+        if not self.recorded["products"]:
+            return products_payload(count)
+        return {"products": self._grow("products", count), "total": count, "skip": 0, "limit": count}
+
+    def _users(self, count: int) -> dict[str, Any]:
+        if not self.recorded["users"]:
+            return users_payload(count)
+        return {"users": self._grow("users", count), "total": count, "skip": 0, "limit": count}
@@ -1,18 +1,136 @@
+import os
+from pathlib import Path
+
 import pytest
 
 from base.api.api_client import APIClient
+from base.api.cache import ResponseCache
+from base.api.cassette import CassetteTransport
+from base.api.disk_cache import SQLiteCacheStore
+from base.api.instrumentation import MetricsRegistry, RequestHooks
+from base.api.request_log import RequestLog
+from base.api.transport import TransportConfig
 from dummyjson.clients.auth_client import AuthClient
 from dummyjson.clients.product_client import ProductClient
+from dummyjson.clients.token_manager import TokenManager
 from dummyjson.clients.user_client import UserClient
+from dummyjson.fake import FakeDummyJSON
+from dummyjson.snapshots import CatalogSnapshot, Snapshots, UserDirectory
+
+pytest_plugins = ["pytester", "dummyjson.tests.scheduling"]
 
 # Base URL for DummyJSON API
 BASE_URL = "https://dummyjson.com"
+# Default location of the persistent HTTP cache enabled with --http-cache
+HTTP_CACHE_PATH = Path(__file__).parent / ".http_cache" / "responses.sqlite3"
+
+
+def pytest_addoption(parser: pytest.Parser):
+    group = parser.getgroup("dummyjson")
+    group.addoption(
+        "--http-cache",
+        nargs="?",
+        const=str(HTTP_CACHE_PATH),
+        default=None,
+        metavar="PATH",
+        help=f"Reuse GET responses across runs from an on-disk cache (default file: {HTTP_CACHE_PATH})",
+    )
+    group.addoption("--http-cache-ttl", type=float, default=3600.0, help="Seconds a cached response is served without a request")
+    group.addoption("--http-cache-max-mb", type=float, default=256.0, help="Maximum size of the on-disk cache in megabytes")
+    group.addoption(
+        "--fake-backend",
+        action="store_true",
+        default=False,
+        help="Run against the in-process fake DummyJSON backend instead of the network",
+    )
+    group.addoption("--cassette", default=None, metavar="PATH", help="Record/replay API traffic with a gzip cassette file")
+    group.addoption(
+        "--cassette-mode",
+        choices=("record", "replay", "auto"),
+        default="auto",
+        help="record: always hit the API; replay: never hit it; auto: replay what is recorded, record the rest",
+    )
+    group.addoption(
+        "--metrics",
+        default=None,
+        metavar="PATH",
+        help="Write request/parse timings of the session in Prometheus text format (one file per xdist worker)",
+    )
+    group.addoption(
+        "--http-config",
+        default=None,
+        metavar="PATH",
+        help="Read DUMMYJSON_HTTP_* pool, timeout and HTTP/2 settings from this .env file (the environment wins)",
+    )
+    group.addoption("--log-sample", type=int, default=1, metavar="N", help="Log 1 in N successful requests (failures always)")
+    group.addoption("--cassette-latency", action="store_true", default=False, help="Sleep for the recorded duration of replayed responses")
+
+
+@pytest.fixture(scope="session")
+def http_cache(pytestconfig: pytest.Config) -> ResponseCache | None:
+    """Persistent response cache shared by sessions and xdist workers, None unless --http-cache is given"""
+    path = pytestconfig.getoption("--http-cache")
+    if not path:
+        yield None
+        return
+    store = SQLiteCacheStore(path, max_bytes=int(pytestconfig.getoption("--http-cache-max-mb") * 1024 * 1024))
+    yield ResponseCache(ttl=pytestconfig.getoption("--http-cache-ttl"), store=store)
+    store.close()
+
+
+@pytest.fixture(scope="session")
+def fake_backend(pytestconfig: pytest.Config) -> FakeDummyJSON | None:
+    """In-process DummyJSON the session talks to, None unless --fake-backend is given"""
+    return FakeDummyJSON() if pytestconfig.getoption("--fake-backend") else None
+
+
+@pytest.fixture(scope="session")
+def metrics(pytestconfig: pytest.Config) -> MetricsRegistry | None:
+    """Registry of the session's request metrics, written to the --metrics file at the end; None without --metrics"""
+    path = pytestconfig.getoption("--metrics")
+    if not path:
+        yield None
+        return
+    registry = MetricsRegistry()
+    yield registry
+    path = Path(path)
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    if worker:
+        path = path.with_name(f"{path.stem}.{worker}{path.suffix}")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(registry.to_prometheus(), encoding="utf-8")
 
 
 @pytest.fixture(scope="session")
-def api_client() -> APIClient:
+def api_client(
+    pytestconfig: pytest.Config,
+    http_cache: ResponseCache | None,
+    fake_backend: FakeDummyJSON | None,
+    metrics: MetricsRegistry | None,
+) -> APIClient:
     """Create API client for the entire test session"""
-    client = APIClient(base_url=BASE_URL, retries=2, retry_interval=0.5)
+    transport = fake_backend.transport() if fake_backend else None
+    transport_config = TransportConfig.from_env(pytestconfig.getoption("--http-config"))
+    cassette = pytestconfig.getoption("--cassette")
+    if cassette:
+        transport = CassetteTransport(
+            cassette,
+            mode=pytestconfig.getoption("--cassette-mode"),
+            transport=transport,
+            simulate_latency=pytestconfig.getoption("--cassette-latency"),
+            transport_config=transport_config,
+        )
+    hooks = metrics.attach(RequestHooks(templates=["/products/category/{slug}"])) if metrics else None
+    client = APIClient(
+        base_url=BASE_URL,
+        retries=2,
+        retry_interval=0.5,
+        cache=http_cache,
+        hooks=hooks,
+        transport_config=transport_config,
+        request_log=RequestLog(sample_every=pytestconfig.getoption("--log-sample")),
+        transport=transport,
+    )
     yield client
     client.close()
 
@@ -35,6 +153,31 @@ def auth_client(api_client: APIClient) -> AuthClient:
     return AuthClient(api_client)
 
 
+@pytest.fixture(scope="session")
+def snapshots(api_client: APIClient) -> Snapshots:
+    """Products and users downloaded once per session (both at the first use of either)"""
+    return Snapshots(ProductClient(api_client), UserClient(api_client))
+
+
+@pytest.fixture(scope="session")
+def catalog(snapshots: Snapshots) -> CatalogSnapshot:
+    """Read-only snapshot of every product, indexed by id and category"""
+    return snapshots.catalog
+
+
+@pytest.fixture(scope="session")
+def user_directory(snapshots: Snapshots) -> UserDirectory:
+    """Read-only snapshot of every user, indexed by id, email and username"""
+    return snapshots.user_directory
+
+
+@pytest.fixture(scope="session")
+def token_manager(api_client: APIClient) -> TokenManager:
+    """Access tokens shared by the session: one login per credential set, refreshed before they expire"""
+    with TokenManager(AuthClient(api_client)) as manager:
+        yield manager
+
+
 @pytest.fixture(scope="session")
 def test_credentials() -> dict[str, str]:
     """Test user credentials for authentication tests"""
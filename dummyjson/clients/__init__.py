@@ -1,5 +1,15 @@
-from dummyjson.clients.auth_client import AuthClient
-from dummyjson.clients.product_client import ProductClient
-from dummyjson.clients.user_client import UserClient
+from dummyjson.clients.auth_client import AsyncAuthClient, AuthClient
+from dummyjson.clients.product_client import AsyncProductClient, ProductClient
+from dummyjson.clients.token_manager import AsyncTokenManager, TokenManager
+from dummyjson.clients.user_client import AsyncUserClient, UserClient
 
-__all__ = ["ProductClient", "UserClient", "AuthClient"]
+__all__ = [
+    "AsyncAuthClient",
+    "AsyncProductClient",
+    "AsyncTokenManager",
+    "AsyncUserClient",
+    "AuthClient",
+    "ProductClient",
+    "TokenManager",
+    "UserClient",
+]
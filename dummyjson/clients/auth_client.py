@@ -1,4 +1,5 @@
 from base.api.api_client import APIClient
+from base.api.async_api_client import AsyncAPIClient
 from dummyjson.models.auth import LoginRequest, LoginResponse, RefreshTokenRequest, RefreshTokenResponse
 from dummyjson.models.user import User
 
@@ -12,16 +13,42 @@ class AuthClient:
     def login(self, username: str, password: str, expires_in_mins: int = 60) -> LoginResponse:
         """Login and get access and refresh tokens"""
         login_data = LoginRequest(username=username, password=password, expiresInMins=expires_in_mins)
-        response = self.api.post("/auth/login", json=login_data.model_dump())
-        return LoginResponse.model_validate(response.json())
+        # auth=None: never send a token a TokenManager attached to the client, logging in must not need one
+        response = self.api.post("/auth/login", json=login_data.model_dump(), auth=None)
+        return self.api.parse(response, LoginResponse)
 
     def get_current_user(self, access_token: str) -> User:
         """Get current authenticated user"""
         response = self.api.get("/auth/me", headers={"Authorization": f"Bearer {access_token}"})
-        return User.model_validate(response.json())
+        return self.api.parse(response, User)
 
     def refresh_token(self, refresh_token: str, expires_in_mins: int = 60) -> RefreshTokenResponse:
         """Refresh access token"""
         refresh_data = RefreshTokenRequest(refreshToken=refresh_token, expiresInMins=expires_in_mins)
-        response = self.api.post("/auth/refresh", json=refresh_data.model_dump())
-        return RefreshTokenResponse.model_validate(response.json())
+        response = self.api.post("/auth/refresh", json=refresh_data.model_dump(), auth=None)
+        return self.api.parse(response, RefreshTokenResponse)
+
+
+class AsyncAuthClient:
+    """Asyncio client for DummyJSON Authentication API"""
+
+    def __init__(self, api_client: AsyncAPIClient):
+        self.api = api_client
+
+    async def login(self, username: str, password: str, expires_in_mins: int = 60) -> LoginResponse:
+        """Login and get access and refresh tokens"""
+        login_data = LoginRequest(username=username, password=password, expiresInMins=expires_in_mins)
+        # auth=None: never send a token a TokenManager attached to the client, logging in must not need one
+        response = await self.api.post("/auth/login", json=login_data.model_dump(), auth=None)
+        return self.api.parse(response, LoginResponse)
+
+    async def get_current_user(self, access_token: str) -> User:
+        """Get current authenticated user"""
+        response = await self.api.get("/auth/me", headers={"Authorization": f"Bearer {access_token}"})
+        return self.api.parse(response, User)
+
+    async def refresh_token(self, refresh_token: str, expires_in_mins: int = 60) -> RefreshTokenResponse:
+        """Refresh access token"""
+        refresh_data = RefreshTokenRequest(refreshToken=refresh_token, expiresInMins=expires_in_mins)
+        response = await self.api.post("/auth/refresh", json=refresh_data.model_dump(), auth=None)
+        return self.api.parse(response, RefreshTokenResponse)
@@ -1,6 +1,21 @@
+from collections.abc import AsyncIterator, Iterable, Iterator
+from contextlib import aclosing, closing
+from functools import partial
 from typing import Any
 
 from base.api.api_client import APIClient
+from base.api.async_api_client import AsyncAPIClient
+from base.api.batch import DEFAULT_DENSITY, BatchResult, afetch_by_ids, fetch_by_ids
+from base.api.pagination import (
+    DEFAULT_CONCURRENCY,
+    AsyncPageFetcher,
+    PageFetcher,
+    afetch_all_pages,
+    aiter_pages,
+    fetch_all_pages,
+    iter_pages,
+)
+from base.models.partial import partial_envelope, partial_model, select_params
 from dummyjson.models.product import Product, ProductsResponse
 
 
@@ -10,30 +25,101 @@ class ProductClient:
     def __init__(self, api_client: APIClient):
         self.api = api_client
 
-    def get_all_products(self, limit: int = 30, skip: int = 0) -> ProductsResponse:
-        """Get all products with pagination"""
-        response = self.api.get(f"/products?limit={limit}&skip={skip}")
-        return ProductsResponse.model_validate(response.json())
+    def _page_fetcher(self, endpoint: str, params: dict[str, Any]) -> PageFetcher:
+        """Build a (limit, skip) -> raw page payload function for a list endpoint"""
 
-    def get_product_by_id(self, product_id: int) -> Product:
+        def fetch_page(page_limit: int, page_skip: int) -> dict[str, Any]:
+            return self.api.json(self.api.get(endpoint, params={**params, "limit": page_limit, "skip": page_skip}))
+
+        return fetch_page
+
+    def _get_products(  # noqa: PLR0913, PLR0917
+        self, endpoint: str, params: dict[str, Any], limit: int, skip: int, fetch_all: bool, concurrency: int, fields: Iterable[str] | None
+    ) -> ProductsResponse:
+        """Get one page of products, or every page from skip onwards when fetch_all is set"""
+        fields = tuple(fields or ())
+        # Built first, so unknown fields are rejected before anything is sent
+        model = partial_envelope(ProductsResponse, "products", fields)
+        params = {**params, **select_params(fields)}
+        if fetch_all:
+            pages = fetch_all_pages(self._page_fetcher(endpoint, params), "products", limit, skip, concurrency)
+            return self.api.build(model, pages)
+        # A single page is decoded straight from the response bytes
+        return self.api.parse(self.api.get(endpoint, params={**params, "limit": limit, "skip": skip}), model)
+
+    def get_all_products(
+        self,
+        limit: int = 30,
+        skip: int = 0,
+        *,
+        fetch_all: bool = False,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        fields: Iterable[str] | None = None,
+    ) -> ProductsResponse:
+        """Get all products with pagination (fetch_all=True loads every page, limit is the page size)"""
+        return self._get_products("/products", {}, limit, skip, fetch_all, concurrency, fields)
+
+    def iter_products(self, page_size: int = 30, skip: int = 0, *, fields: Iterable[str] | None = None) -> Iterator[Product]:
+        """Lazily yield validated products page by page, prefetching the next page in the background"""
+        fields = tuple(fields or ())
+        model = partial_model(Product, fields)
+        with closing(iter_pages(self._page_fetcher("/products", select_params(fields)), "products", page_size, skip)) as pages:
+            for page in pages:
+                for item in page["products"]:
+                    yield self.api.build(model, item)
+
+    def get_product_by_id(self, product_id: int, *, fields: Iterable[str] | None = None) -> Product:
         """Get a single product by ID"""
-        response = self.api.get(f"/products/{product_id}")
-        return Product.model_validate(response.json())
+        fields = tuple(fields or ())
+        model = partial_model(Product, fields)
+        response = self.api.get(f"/products/{product_id}", params=select_params(fields))
+        return self.api.parse(response, model)
 
-    def search_products(self, query: str, limit: int = 30, skip: int = 0) -> ProductsResponse:
+    def get_products_by_ids(
+        self,
+        product_ids: Iterable[int],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        density: float = DEFAULT_DENSITY,
+        fields: Iterable[str] | None = None,
+    ) -> BatchResult[Product]:
+        """Get many products by ID concurrently, dense ID ranges are read as pages; failures are reported per ID"""
+        fields = tuple(fields or ())
+        build = partial(self.api.build, partial_model(Product, fields))
+        fetch_page = self._page_fetcher("/products", select_params(fields))
+        fetch_one = partial(self.get_product_by_id, fields=fields)
+        return fetch_by_ids(product_ids, fetch_one, fetch_page, "products", build, concurrency, density)
+
+    def search_products(  # noqa: PLR0913
+        self,
+        query: str,
+        limit: int = 30,
+        skip: int = 0,
+        *,
+        fetch_all: bool = False,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        fields: Iterable[str] | None = None,
+    ) -> ProductsResponse:
         """Search products by query"""
-        response = self.api.get(f"/products/search?q={query}&limit={limit}&skip={skip}")
-        return ProductsResponse.model_validate(response.json())
+        return self._get_products("/products/search", {"q": query}, limit, skip, fetch_all, concurrency, fields)
 
-    def get_products_by_category(self, category: str, limit: int = 30, skip: int = 0) -> ProductsResponse:
+    def get_products_by_category(  # noqa: PLR0913
+        self,
+        category: str,
+        limit: int = 30,
+        skip: int = 0,
+        *,
+        fetch_all: bool = False,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        fields: Iterable[str] | None = None,
+    ) -> ProductsResponse:
         """Get products by category"""
-        response = self.api.get(f"/products/category/{category}?limit={limit}&skip={skip}")
-        return ProductsResponse.model_validate(response.json())
+        return self._get_products(f"/products/category/{category}", {}, limit, skip, fetch_all, concurrency, fields)
 
     def get_all_categories(self) -> list[Any]:
         """Get all product categories"""
         response = self.api.get("/products/categories")
-        categories = response.json()
+        categories = self.api.json(response)
         # Extract slug if categories are returned as objects
         if categories and isinstance(categories[0], dict):
             return [cat.get("slug", cat.get("name", "")) for cat in categories]
@@ -42,14 +128,138 @@ class ProductClient:
     def add_product(self, product_data: dict[str, Any]) -> Product:
         """Add a new product"""
         response = self.api.post("/products/add", json=product_data)
-        return Product.model_validate(response.json())
+        return self.api.parse(response, Product)
 
     def update_product(self, product_id: int, product_data: dict[str, Any]) -> Product:
         """Update a product"""
         response = self.api.put(f"/products/{product_id}", json=product_data)
-        return Product.model_validate(response.json())
+        return self.api.parse(response, Product)
 
     def delete_product(self, product_id: int) -> Product:
         """Delete a product"""
         response = self.api.delete(f"/products/{product_id}")
-        return Product.model_validate(response.json())
+        return self.api.parse(response, Product)
+
+
+class AsyncProductClient:
+    """Asyncio client for DummyJSON Products API"""
+
+    def __init__(self, api_client: AsyncAPIClient):
+        self.api = api_client
+
+    def _page_fetcher(self, endpoint: str, params: dict[str, Any]) -> AsyncPageFetcher:
+        """Build a (limit, skip) -> raw page payload coroutine function for a list endpoint"""
+
+        async def fetch_page(page_limit: int, page_skip: int) -> dict[str, Any]:
+            response = await self.api.get(endpoint, params={**params, "limit": page_limit, "skip": page_skip})
+            return self.api.json(response)
+
+        return fetch_page
+
+    async def _get_products(  # noqa: PLR0913, PLR0917
+        self, endpoint: str, params: dict[str, Any], limit: int, skip: int, fetch_all: bool, concurrency: int, fields: Iterable[str] | None
+    ) -> ProductsResponse:
+        """Get one page of products, or every page from skip onwards when fetch_all is set"""
+        fields = tuple(fields or ())
+        # Built first, so unknown fields are rejected before anything is sent
+        model = partial_envelope(ProductsResponse, "products", fields)
+        params = {**params, **select_params(fields)}
+        if fetch_all:
+            pages = await afetch_all_pages(self._page_fetcher(endpoint, params), "products", limit, skip, concurrency)
+            return self.api.build(model, pages)
+        # A single page is decoded straight from the response bytes
+        response = await self.api.get(endpoint, params={**params, "limit": limit, "skip": skip})
+        return self.api.parse(response, model)
+
+    async def get_all_products(
+        self,
+        limit: int = 30,
+        skip: int = 0,
+        *,
+        fetch_all: bool = False,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        fields: Iterable[str] | None = None,
+    ) -> ProductsResponse:
+        """Get all products with pagination (fetch_all=True loads every page, limit is the page size)"""
+        return await self._get_products("/products", {}, limit, skip, fetch_all, concurrency, fields)
+
+    async def iter_products(self, page_size: int = 30, skip: int = 0, *, fields: Iterable[str] | None = None) -> AsyncIterator[Product]:
+        """Lazily yield validated products page by page, prefetching the next page in a background task"""
+        fields = tuple(fields or ())
+        model = partial_model(Product, fields)
+        async with aclosing(aiter_pages(self._page_fetcher("/products", select_params(fields)), "products", page_size, skip)) as pages:
+            async for page in pages:
+                for item in page["products"]:
+                    yield self.api.build(model, item)
+
+    async def get_product_by_id(self, product_id: int, *, fields: Iterable[str] | None = None) -> Product:
+        """Get a single product by ID"""
+        fields = tuple(fields or ())
+        model = partial_model(Product, fields)
+        response = await self.api.get(f"/products/{product_id}", params=select_params(fields))
+        return self.api.parse(response, model)
+
+    async def get_products_by_ids(
+        self,
+        product_ids: Iterable[int],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        density: float = DEFAULT_DENSITY,
+        fields: Iterable[str] | None = None,
+    ) -> BatchResult[Product]:
+        """Get many products by ID concurrently, dense ID ranges are read as pages; failures are reported per ID"""
+        fields = tuple(fields or ())
+        build = partial(self.api.build, partial_model(Product, fields))
+        fetch_page = self._page_fetcher("/products", select_params(fields))
+        fetch_one = partial(self.get_product_by_id, fields=fields)
+        return await afetch_by_ids(product_ids, fetch_one, fetch_page, "products", build, concurrency, density)
+
+    async def search_products(  # noqa: PLR0913
+        self,
+        query: str,
+        limit: int = 30,
+        skip: int = 0,
+        *,
+        fetch_all: bool = False,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        fields: Iterable[str] | None = None,
+    ) -> ProductsResponse:
+        """Search products by query"""
+        return await self._get_products("/products/search", {"q": query}, limit, skip, fetch_all, concurrency, fields)
+
+    async def get_products_by_category(  # noqa: PLR0913
+        self,
+        category: str,
+        limit: int = 30,
+        skip: int = 0,
+        *,
+        fetch_all: bool = False,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        fields: Iterable[str] | None = None,
+    ) -> ProductsResponse:
+        """Get products by category"""
+        return await self._get_products(f"/products/category/{category}", {}, limit, skip, fetch_all, concurrency, fields)
+
+    async def get_all_categories(self) -> list[Any]:
+        """Get all product categories"""
+        response = await self.api.get("/products/categories")
+        categories = self.api.json(response)
+        # Extract slug if categories are returned as objects
+        if categories and isinstance(categories[0], dict):
+            return [cat.get("slug", cat.get("name", "")) for cat in categories]
+        return categories
+
+    async def add_product(self, product_data: dict[str, Any]) -> Product:
+        """Add a new product"""
+        response = await self.api.post("/products/add", json=product_data)
+        return self.api.parse(response, Product)
+
+    async def update_product(self, product_id: int, product_data: dict[str, Any]) -> Product:
+        """Update a product"""
+        response = await self.api.put(f"/products/{product_id}", json=product_data)
+        return self.api.parse(response, Product)
+
+    async def delete_product(self, product_id: int) -> Product:
+        """Delete a product"""
+        response = await self.api.delete(f"/products/{product_id}")
+        return self.api.parse(response, Product)
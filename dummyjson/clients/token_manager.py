@@ -0,0 +1,338 @@
+"""Cached access tokens per credential set, refreshed before they expire and on 401 answers"""
+
+import asyncio
+import base64
+import binascii
+import json
+import logging
+import threading
+import time
+from collections.abc import AsyncGenerator, Callable, Generator
+from dataclasses import dataclass
+
+import httpx
+
+from base.api.api_client import APIClient
+from base.api.async_api_client import AsyncAPIClient
+from base.api.single_flight import AsyncSingleFlight, SingleFlight
+from dummyjson.clients.auth_client import AsyncAuthClient, AuthClient
+from dummyjson.models.auth import LoginResponse, RefreshTokenResponse
+
+logger = logging.getLogger(__name__)
+
+# Share of the token lifetime left when it is refreshed, e.g. 12 minutes before a 60 minute token expires
+DEFAULT_REFRESH_MARGIN = 0.2
+# Request extension marking an Authorization header set by the auth flow, which retried requests carry over
+MANAGED_AUTH = "token_manager.managed"
+
+Credentials = tuple[str, str]
+
+
+def token_expiry(token: str) -> float | None:
+    """Expiry (epoch seconds) from the exp claim of a JWT, None when the token carries none"""
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError, binascii.Error):
+        return None
+
+
+@dataclass(frozen=True)
+class Tokens:
+    access_token: str
+    refresh_token: str
+    issued_at: float
+    expires_at: float
+
+    def refresh_at(self, margin: float) -> float:
+        return self.expires_at - (self.expires_at - self.issued_at) * margin
+
+
+@dataclass
+class TokenStats:
+    logins: int = 0
+    refreshes: int = 0
+    retries: int = 0  # requests sent again after a 401
+
+
+class BaseTokenManager:
+    """Token state shared by the sync and async managers"""
+
+    def __init__(self, expires_in_mins: int, refresh_margin: float, background: bool, clock: Callable[[], float]):
+        self.expires_in_mins = expires_in_mins
+        self.refresh_margin = min(max(refresh_margin, 0.0), 1.0)
+        # Refresh on a timer before callers reach the margin, otherwise the first caller inside it refreshes
+        self.background = background
+        self.clock = clock
+        self.stats = TokenStats()
+        self._tokens: dict[Credentials, Tokens] = {}
+
+    def _fresh(self, credentials: Credentials) -> Tokens | None:
+        tokens = self._tokens.get(credentials)
+        if tokens is None or tokens.refresh_at(self.refresh_margin) <= self.clock():
+            return None
+        return tokens
+
+    def _store(self, credentials: Credentials, response: LoginResponse | RefreshTokenResponse) -> Tokens:
+        now = self.clock()
+        expires_at = token_expiry(response.accessToken) or now + self.expires_in_mins * 60
+        tokens = Tokens(response.accessToken, response.refreshToken, now, expires_at)
+        self._tokens[credentials] = tokens
+        return tokens
+
+    def _refresh_delay(self, tokens: Tokens) -> float:
+        return max(0.0, tokens.refresh_at(self.refresh_margin) - self.clock())
+
+    @staticmethod
+    def _flight_key(credentials: Credentials) -> str:
+        return "\0".join(credentials)
+
+
+class TokenManager(BaseTokenManager):
+    """
+    Logs in once per credential set and hands out its access token to any number of threads
+    Tokens are refreshed once per expiry by a single caller (or a background timer), a failed refresh logs in again
+    """
+
+    def __init__(
+        self,
+        auth: AuthClient,
+        expires_in_mins: int = 60,
+        refresh_margin: float = DEFAULT_REFRESH_MARGIN,
+        background: bool = True,
+        clock: Callable[[], float] = time.time,
+    ):
+        super().__init__(expires_in_mins, refresh_margin, background, clock)
+        self.auth = auth
+        self._flight = SingleFlight()
+        self._timers: dict[Credentials, threading.Timer] = {}
+        self._timers_lock = threading.Lock()
+
+    def token(self, username: str, password: str) -> str:
+        """Access token for the credentials, logging in or refreshing only when needed"""
+        credentials = (username, password)
+        tokens = self._fresh(credentials) or self._renew(credentials, stale=None)
+        return tokens.access_token
+
+    def renew(self, username: str, password: str, rejected: str) -> str:
+        """Fresh access token after the server rejected one; callers rejected at the same time share one refresh"""
+        credentials = (username, password)
+        current = self._tokens.get(credentials)
+        if current is not None and current.access_token != rejected:
+            return current.access_token
+        return self._renew(credentials, stale=current).access_token
+
+    def auth_for(self, username: str, password: str) -> "BearerAuth":
+        """httpx auth adding the token to requests, e.g. api.get("/auth/me", auth=manager.auth_for(...))"""
+        return BearerAuth(self, username, password)
+
+    def attach(self, api: APIClient, username: str, password: str) -> None:
+        """Authenticate every request of the client that sets no Authorization header of its own"""
+        api.client.auth = self.auth_for(username, password)
+
+    def _renew(self, credentials: Credentials, stale: Tokens | None) -> Tokens:
+        return self._flight.do(self._flight_key(credentials), lambda: self._fetch(credentials, stale))
+
+    def _fetch(self, credentials: Credentials, stale: Tokens | None) -> Tokens:
+        # Another caller may have renewed the tokens between our check and the start of this flight
+        current = self._tokens.get(credentials)
+        if current is not None and current is not stale and self._fresh(credentials) is not None:
+            return current
+        response: LoginResponse | RefreshTokenResponse | None = None
+        if current is not None:
+            try:
+                response = self.auth.refresh_token(current.refresh_token, self.expires_in_mins)
+                self.stats.refreshes += 1
+            except httpx.HTTPStatusError as error:
+                logger.info("Token refresh for %s rejected (%s), logging in again", credentials[0], error.response.status_code)
+        if response is None:
+            response = self.auth.login(*credentials, expires_in_mins=self.expires_in_mins)
+            self.stats.logins += 1
+        tokens = self._store(credentials, response)
+        self._schedule(credentials, tokens)
+        return tokens
+
+    def _schedule(self, credentials: Credentials, tokens: Tokens) -> None:
+        if not self.background:
+            return
+        timer = threading.Timer(self._refresh_delay(tokens), self._refresh_in_background, (credentials, tokens))
+        timer.daemon = True
+        with self._timers_lock:
+            previous = self._timers.pop(credentials, None)
+            if previous is not None:
+                previous.cancel()
+            self._timers[credentials] = timer
+        timer.start()
+
+    def _refresh_in_background(self, credentials: Credentials, tokens: Tokens) -> None:
+        try:
+            self._renew(credentials, stale=tokens)
+        except Exception as error:
+            # The next caller inside the refresh margin tries again
+            logger.warning("Background token refresh for %s failed: %s", credentials[0], error)
+
+    def close(self) -> None:
+        """Stop the background refresh timers, later renewals happen inline"""
+        self.background = False
+        with self._timers_lock:
+            for timer in self._timers.values():
+                timer.cancel()
+            self._timers.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class AsyncTokenManager(BaseTokenManager):
+    """Asyncio version of TokenManager, background refreshes run as tasks of the loop that logged in"""
+
+    def __init__(
+        self,
+        auth: AsyncAuthClient,
+        expires_in_mins: int = 60,
+        refresh_margin: float = DEFAULT_REFRESH_MARGIN,
+        background: bool = True,
+        clock: Callable[[], float] = time.time,
+    ):
+        super().__init__(expires_in_mins, refresh_margin, background, clock)
+        self.auth = auth
+        self._flight = AsyncSingleFlight()
+        self._timers: dict[Credentials, asyncio.TimerHandle] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    async def token(self, username: str, password: str) -> str:
+        """Access token for the credentials, logging in or refreshing only when needed"""
+        credentials = (username, password)
+        tokens = self._fresh(credentials) or await self._renew(credentials, stale=None)
+        return tokens.access_token
+
+    async def renew(self, username: str, password: str, rejected: str) -> str:
+        """Fresh access token after the server rejected one; callers rejected at the same time share one refresh"""
+        credentials = (username, password)
+        current = self._tokens.get(credentials)
+        if current is not None and current.access_token != rejected:
+            return current.access_token
+        return (await self._renew(credentials, stale=current)).access_token
+
+    def auth_for(self, username: str, password: str) -> "AsyncBearerAuth":
+        """httpx auth adding the token to requests, e.g. await api.get("/auth/me", auth=manager.auth_for(...))"""
+        return AsyncBearerAuth(self, username, password)
+
+    def attach(self, api: AsyncAPIClient, username: str, password: str) -> None:
+        """Authenticate every request of the client that sets no Authorization header of its own"""
+        api.client.auth = self.auth_for(username, password)
+
+    async def _renew(self, credentials: Credentials, stale: Tokens | None) -> Tokens:
+        return await self._flight.do(self._flight_key(credentials), lambda: self._fetch(credentials, stale))
+
+    async def _fetch(self, credentials: Credentials, stale: Tokens | None) -> Tokens:
+        current = self._tokens.get(credentials)
+        if current is not None and current is not stale and self._fresh(credentials) is not None:
+            return current
+        response: LoginResponse | RefreshTokenResponse | None = None
+        if current is not None:
+            try:
+                response = await self.auth.refresh_token(current.refresh_token, self.expires_in_mins)
+                self.stats.refreshes += 1
+            except httpx.HTTPStatusError as error:
+                logger.info("Token refresh for %s rejected (%s), logging in again", credentials[0], error.response.status_code)
+        if response is None:
+            response = await self.auth.login(*credentials, expires_in_mins=self.expires_in_mins)
+            self.stats.logins += 1
+        tokens = self._store(credentials, response)
+        self._schedule(credentials, tokens)
+        return tokens
+
+    def _schedule(self, credentials: Credentials, tokens: Tokens) -> None:
+        if not self.background:
+            return
+        previous = self._timers.pop(credentials, None)
+        if previous is not None:
+            previous.cancel()
+        loop = asyncio.get_running_loop()
+        self._timers[credentials] = loop.call_later(self._refresh_delay(tokens), self._start_refresh, credentials, tokens)
+
+    def _start_refresh(self, credentials: Credentials, tokens: Tokens) -> None:
+        task = asyncio.ensure_future(self._refresh_in_background(credentials, tokens))
+        # The loop keeps weak references to tasks only
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _refresh_in_background(self, credentials: Credentials, tokens: Tokens) -> None:
+        try:
+            await self._renew(credentials, stale=tokens)
+        except Exception as error:
+            logger.warning("Background token refresh for %s failed: %s", credentials[0], error)
+
+    async def aclose(self) -> None:
+        """Stop the background refresh timers and cancel refreshes in flight, later renewals happen inline"""
+        self.background = False
+        for timer in self._timers.values():
+            timer.cancel()
+        self._timers.clear()
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+
+class BearerAuth(httpx.Auth):
+    """
+    Sends the managed access token as Authorization: Bearer, requests with their own Authorization header pass as they are
+    A 401 answer renews the token once (shared with other rejected callers) and sends the request again
+    """
+
+    def __init__(self, manager: TokenManager, username: str, password: str):
+        self.manager = manager
+        self.credentials = (username, password)
+
+    def sync_auth_flow(self, request: httpx.Request) -> Generator[httpx.Request, httpx.Response, None]:
+        if "Authorization" in request.headers and not request.extensions.get(MANAGED_AUTH):
+            yield request
+            return
+        token = self.manager.token(*self.credentials)
+        request.headers["Authorization"] = f"Bearer {token}"
+        request.extensions[MANAGED_AUTH] = True
+        response = yield request
+        if response.status_code == httpx.codes.UNAUTHORIZED:
+            self.manager.stats.retries += 1
+            request.headers["Authorization"] = f"Bearer {self.manager.renew(*self.credentials, rejected=token)}"
+            yield request
+
+    async def async_auth_flow(self, request: httpx.Request) -> AsyncGenerator[httpx.Request, httpx.Response]:
+        raise RuntimeError("BearerAuth needs a sync client, use AsyncTokenManager.auth_for with async clients")
+        yield request
+
+
+class AsyncBearerAuth(httpx.Auth):
+    """BearerAuth for async clients"""
+
+    def __init__(self, manager: AsyncTokenManager, username: str, password: str):
+        self.manager = manager
+        self.credentials = (username, password)
+
+    def sync_auth_flow(self, request: httpx.Request) -> Generator[httpx.Request, httpx.Response, None]:
+        raise RuntimeError("AsyncBearerAuth needs an async client, use TokenManager.auth_for with sync clients")
+        yield request
+
+    async def async_auth_flow(self, request: httpx.Request) -> AsyncGenerator[httpx.Request, httpx.Response]:
+        if "Authorization" in request.headers and not request.extensions.get(MANAGED_AUTH):
+            yield request
+            return
+        token = await self.manager.token(*self.credentials)
+        request.headers["Authorization"] = f"Bearer {token}"
+        request.extensions[MANAGED_AUTH] = True
+        response = yield request
+        if response.status_code == httpx.codes.UNAUTHORIZED:
+            self.manager.stats.retries += 1
+            request.headers["Authorization"] = f"Bearer {await self.manager.renew(*self.credentials, rejected=token)}"
+            yield request
@@ -1,6 +1,21 @@
+from collections.abc import AsyncIterator, Iterable, Iterator
+from contextlib import aclosing, closing
+from functools import partial
 from typing import Any
 
 from base.api.api_client import APIClient
+from base.api.async_api_client import AsyncAPIClient
+from base.api.batch import DEFAULT_DENSITY, BatchResult, afetch_by_ids, fetch_by_ids
+from base.api.pagination import (
+    DEFAULT_CONCURRENCY,
+    AsyncPageFetcher,
+    PageFetcher,
+    afetch_all_pages,
+    aiter_pages,
+    fetch_all_pages,
+    iter_pages,
+)
+from base.models.partial import partial_envelope, partial_model, select_params
 from dummyjson.models.user import User, UsersResponse
 
 
@@ -10,37 +25,225 @@ class UserClient:
     def __init__(self, api_client: APIClient):
         self.api = api_client
 
-    def get_all_users(self, limit: int = 30, skip: int = 0) -> UsersResponse:
-        """Get all users with pagination"""
-        response = self.api.get(f"/users?limit={limit}&skip={skip}")
-        return UsersResponse.model_validate(response.json())
+    def _page_fetcher(self, endpoint: str, params: dict[str, Any]) -> PageFetcher:
+        """Build a (limit, skip) -> raw page payload function for a list endpoint"""
 
-    def get_user_by_id(self, user_id: int) -> User:
+        def fetch_page(page_limit: int, page_skip: int) -> dict[str, Any]:
+            return self.api.json(self.api.get(endpoint, params={**params, "limit": page_limit, "skip": page_skip}))
+
+        return fetch_page
+
+    def _get_users(  # noqa: PLR0913, PLR0917
+        self, endpoint: str, params: dict[str, Any], limit: int, skip: int, fetch_all: bool, concurrency: int, fields: Iterable[str] | None
+    ) -> UsersResponse:
+        """Get one page of users, or every page from skip onwards when fetch_all is set"""
+        fields = tuple(fields or ())
+        # Built first, so unknown fields are rejected before anything is sent
+        model = partial_envelope(UsersResponse, "users", fields)
+        params = {**params, **select_params(fields)}
+        if fetch_all:
+            pages = fetch_all_pages(self._page_fetcher(endpoint, params), "users", limit, skip, concurrency)
+            return self.api.build(model, pages)
+        # A single page is decoded straight from the response bytes
+        return self.api.parse(self.api.get(endpoint, params={**params, "limit": limit, "skip": skip}), model)
+
+    def get_all_users(
+        self,
+        limit: int = 30,
+        skip: int = 0,
+        *,
+        fetch_all: bool = False,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        fields: Iterable[str] | None = None,
+    ) -> UsersResponse:
+        """Get all users with pagination (fetch_all=True loads every page, limit is the page size)"""
+        return self._get_users("/users", {}, limit, skip, fetch_all, concurrency, fields)
+
+    def iter_users(self, page_size: int = 30, skip: int = 0, *, fields: Iterable[str] | None = None) -> Iterator[User]:
+        """Lazily yield validated users page by page, prefetching the next page in the background"""
+        fields = tuple(fields or ())
+        model = partial_model(User, fields)
+        with closing(iter_pages(self._page_fetcher("/users", select_params(fields)), "users", page_size, skip)) as pages:
+            for page in pages:
+                for item in page["users"]:
+                    yield self.api.build(model, item)
+
+    def get_user_by_id(self, user_id: int, *, fields: Iterable[str] | None = None) -> User:
         """Get a single user by ID"""
-        response = self.api.get(f"/users/{user_id}")
-        return User.model_validate(response.json())
+        fields = tuple(fields or ())
+        model = partial_model(User, fields)
+        response = self.api.get(f"/users/{user_id}", params=select_params(fields))
+        return self.api.parse(response, model)
+
+    def get_users_by_ids(
+        self,
+        user_ids: Iterable[int],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        density: float = DEFAULT_DENSITY,
+        fields: Iterable[str] | None = None,
+    ) -> BatchResult[User]:
+        """Get many users by ID concurrently, dense ID ranges are read as pages; failures are reported per ID"""
+        fields = tuple(fields or ())
+        build = partial(self.api.build, partial_model(User, fields))
+        fetch_page = self._page_fetcher("/users", select_params(fields))
+        fetch_one = partial(self.get_user_by_id, fields=fields)
+        return fetch_by_ids(user_ids, fetch_one, fetch_page, "users", build, concurrency, density)
 
-    def search_users(self, query: str, limit: int = 30, skip: int = 0) -> UsersResponse:
+    def search_users(  # noqa: PLR0913
+        self,
+        query: str,
+        limit: int = 30,
+        skip: int = 0,
+        *,
+        fetch_all: bool = False,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        fields: Iterable[str] | None = None,
+    ) -> UsersResponse:
         """Search users by query"""
-        response = self.api.get(f"/users/search?q={query}&limit={limit}&skip={skip}")
-        return UsersResponse.model_validate(response.json())
+        return self._get_users("/users/search", {"q": query}, limit, skip, fetch_all, concurrency, fields)
 
-    def filter_users(self, key: str, value: str, limit: int = 30, skip: int = 0) -> UsersResponse:
+    def filter_users(  # noqa: PLR0913
+        self,
+        key: str,
+        value: str,
+        limit: int = 30,
+        skip: int = 0,
+        *,
+        fetch_all: bool = False,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        fields: Iterable[str] | None = None,
+    ) -> UsersResponse:
         """Filter users by key-value pair"""
-        response = self.api.get(f"/users/filter?key={key}&value={value}&limit={limit}&skip={skip}")
-        return UsersResponse.model_validate(response.json())
+        return self._get_users("/users/filter", {"key": key, "value": value}, limit, skip, fetch_all, concurrency, fields)
 
     def add_user(self, user_data: dict[str, Any]) -> User:
         """Add a new user"""
         response = self.api.post("/users/add", json=user_data)
-        return User.model_validate(response.json())
+        return self.api.parse(response, User)
 
     def update_user(self, user_id: int, user_data: dict[str, Any]) -> User:
         """Update a user"""
         response = self.api.put(f"/users/{user_id}", json=user_data)
-        return User.model_validate(response.json())
+        return self.api.parse(response, User)
 
     def delete_user(self, user_id: int) -> User:
         """Delete a user"""
         response = self.api.delete(f"/users/{user_id}")
-        return User.model_validate(response.json())
+        return self.api.parse(response, User)
+
+
+class AsyncUserClient:
+    """Asyncio client for DummyJSON Users API"""
+
+    def __init__(self, api_client: AsyncAPIClient):
+        self.api = api_client
+
+    def _page_fetcher(self, endpoint: str, params: dict[str, Any]) -> AsyncPageFetcher:
+        """Build a (limit, skip) -> raw page payload coroutine function for a list endpoint"""
+
+        async def fetch_page(page_limit: int, page_skip: int) -> dict[str, Any]:
+            response = await self.api.get(endpoint, params={**params, "limit": page_limit, "skip": page_skip})
+            return self.api.json(response)
+
+        return fetch_page
+
+    async def _get_users(  # noqa: PLR0913, PLR0917
+        self, endpoint: str, params: dict[str, Any], limit: int, skip: int, fetch_all: bool, concurrency: int, fields: Iterable[str] | None
+    ) -> UsersResponse:
+        """Get one page of users, or every page from skip onwards when fetch_all is set"""
+        fields = tuple(fields or ())
+        # Built first, so unknown fields are rejected before anything is sent
+        model = partial_envelope(UsersResponse, "users", fields)
+        params = {**params, **select_params(fields)}
+        if fetch_all:
+            pages = await afetch_all_pages(self._page_fetcher(endpoint, params), "users", limit, skip, concurrency)
+            return self.api.build(model, pages)
+        # A single page is decoded straight from the response bytes
+        response = await self.api.get(endpoint, params={**params, "limit": limit, "skip": skip})
+        return self.api.parse(response, model)
+
+    async def get_all_users(
+        self,
+        limit: int = 30,
+        skip: int = 0,
+        *,
+        fetch_all: bool = False,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        fields: Iterable[str] | None = None,
+    ) -> UsersResponse:
+        """Get all users with pagination (fetch_all=True loads every page, limit is the page size)"""
+        return await self._get_users("/users", {}, limit, skip, fetch_all, concurrency, fields)
+
+    async def iter_users(self, page_size: int = 30, skip: int = 0, *, fields: Iterable[str] | None = None) -> AsyncIterator[User]:
+        """Lazily yield validated users page by page, prefetching the next page in a background task"""
+        fields = tuple(fields or ())
+        model = partial_model(User, fields)
+        async with aclosing(aiter_pages(self._page_fetcher("/users", select_params(fields)), "users", page_size, skip)) as pages:
+            async for page in pages:
+                for item in page["users"]:
+                    yield self.api.build(model, item)
+
+    async def get_user_by_id(self, user_id: int, *, fields: Iterable[str] | None = None) -> User:
+        """Get a single user by ID"""
+        fields = tuple(fields or ())
+        model = partial_model(User, fields)
+        response = await self.api.get(f"/users/{user_id}", params=select_params(fields))
+        return self.api.parse(response, model)
+
+    async def get_users_by_ids(
+        self,
+        user_ids: Iterable[int],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        density: float = DEFAULT_DENSITY,
+        fields: Iterable[str] | None = None,
+    ) -> BatchResult[User]:
+        """Get many users by ID concurrently, dense ID ranges are read as pages; failures are reported per ID"""
+        fields = tuple(fields or ())
+        build = partial(self.api.build, partial_model(User, fields))
+        fetch_page = self._page_fetcher("/users", select_params(fields))
+        fetch_one = partial(self.get_user_by_id, fields=fields)
+        return await afetch_by_ids(user_ids, fetch_one, fetch_page, "users", build, concurrency, density)
+
+    async def search_users(  # noqa: PLR0913
+        self,
+        query: str,
+        limit: int = 30,
+        skip: int = 0,
+        *,
+        fetch_all: bool = False,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        fields: Iterable[str] | None = None,
+    ) -> UsersResponse:
+        """Search users by query"""
+        return await self._get_users("/users/search", {"q": query}, limit, skip, fetch_all, concurrency, fields)
+
+    async def filter_users(  # noqa: PLR0913
+        self,
+        key: str,
+        value: str,
+        limit: int = 30,
+        skip: int = 0,
+        *,
+        fetch_all: bool = False,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        fields: Iterable[str] | None = None,
+    ) -> UsersResponse:
+        """Filter users by key-value pair"""
+        return await self._get_users("/users/filter", {"key": key, "value": value}, limit, skip, fetch_all, concurrency, fields)
+
+    async def add_user(self, user_data: dict[str, Any]) -> User:
+        """Add a new user"""
+        response = await self.api.post("/users/add", json=user_data)
+        return self.api.parse(response, User)
+
+    async def update_user(self, user_id: int, user_data: dict[str, Any]) -> User:
+        """Update a user"""
+        response = await self.api.put(f"/users/{user_id}", json=user_data)
+        return self.api.parse(response, User)
+
+    async def delete_user(self, user_id: int) -> User:
+        """Delete a user"""
+        response = await self.api.delete(f"/users/{user_id}")
+        return self.api.parse(response, User)
@@ -0,0 +1,4 @@
+from dummyjson.fake.backend import FakeDummyJSON
+from dummyjson.fake.data import make_products, make_users
+
+__all__ = ["FakeDummyJSON", "make_products", "make_users"]
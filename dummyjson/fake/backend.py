@@ -0,0 +1,308 @@
+"""In-process DummyJSON backend, usable as an httpx transport or an ASGI app"""
+
+import base64
+import itertools
+import json
+import re
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Mapping
+from datetime import UTC, datetime
+from typing import Any
+from urllib.parse import parse_qsl
+
+import httpx
+
+from dummyjson.fake.data import make_products, make_users
+
+DEFAULT_LIMIT = 30
+DEFAULT_TOKEN_MINS = 60
+
+Payload = tuple[int, Any]
+
+
+class FakeDummyJSON:
+    """
+    Answers the DummyJSON routes used by the clients from deterministic fixture data
+    Mutations are simulated like on the real service: responses echo the change but the data never changes
+    """
+
+    def __init__(
+        self,
+        products: list[dict[str, Any]] | None = None,
+        users: list[dict[str, Any]] | None = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.products = products if products is not None else make_products()
+        self.users = users if users is not None else make_users()
+        self.clock = clock
+        # Requests served per "METHOD /path", for asserting on traffic in tests
+        self.calls: Counter[str] = Counter()
+        self._products_by_id = {product["id"]: product for product in self.products}
+        self._users_by_id = {user["id"]: user for user in self.users}
+        self._tokens: dict[str, tuple[str, int, float]] = {}  # token -> (kind, user id, expiry)
+        self._token_ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._routes: list[tuple[str, re.Pattern[str], Callable[..., Payload]]] = [
+            ("GET", re.compile(r"/test"), self._test),
+            ("GET", re.compile(r"/products"), self._list_products),
+            ("GET", re.compile(r"/products/search"), self._search_products),
+            ("GET", re.compile(r"/products/categories"), self._categories),
+            ("GET", re.compile(r"/products/category-list"), self._category_list),
+            ("GET", re.compile(r"/products/category/(?P<slug>[^/]+)"), self._category_products),
+            ("POST", re.compile(r"/products/add"), self._add_product),
+            ("GET", re.compile(r"/products/(?P<item_id>[^/]+)"), self._get_product),
+            ("PUT|PATCH", re.compile(r"/products/(?P<item_id>[^/]+)"), self._update_product),
+            ("DELETE", re.compile(r"/products/(?P<item_id>[^/]+)"), self._delete_product),
+            ("GET", re.compile(r"/users"), self._list_users),
+            ("GET", re.compile(r"/users/search"), self._search_users),
+            ("GET", re.compile(r"/users/filter"), self._filter_users),
+            ("POST", re.compile(r"/users/add"), self._add_user),
+            ("GET", re.compile(r"/users/(?P<item_id>[^/]+)"), self._get_user),
+            ("PUT|PATCH", re.compile(r"/users/(?P<item_id>[^/]+)"), self._update_user),
+            ("DELETE", re.compile(r"/users/(?P<item_id>[^/]+)"), self._delete_user),
+            ("POST", re.compile(r"/auth/login"), self._login),
+            ("GET", re.compile(r"/auth/me"), self._me),
+            ("POST", re.compile(r"/auth/refresh"), self._refresh),
+        ]
+
+    def handle(
+        self, method: str, path: str, query: Mapping[str, str], body: bytes = b"", headers: Mapping[str, str] | None = None
+    ) -> Payload:
+        """Status code and JSON payload for one request; the transports below only adapt their request types to this"""
+        path = "/" + path.strip("/")
+        self.calls[f"{method} {path}"] += 1
+        try:
+            data = json.loads(body) if body else {}
+        except ValueError:
+            return 400, {"message": "Invalid JSON body"}
+        for methods, pattern, route in self._routes:
+            match = pattern.fullmatch(path)
+            if match and method in methods.split("|"):
+                return route(query=query, data=data, headers=headers or {}, **match.groupdict())
+        return 404, {"message": f"Route {method} {path} not found"}
+
+    # Transports
+
+    def _handle_httpx(self, request: httpx.Request) -> httpx.Response:
+        status, payload = self.handle(request.method, request.url.path, request.url.params, request.content, request.headers)
+        return httpx.Response(status, content=dump_json(payload), headers={"content-type": "application/json"})
+
+    def transport(self) -> httpx.MockTransport:
+        """Transport for APIClient/AsyncAPIClient(transport=...), requests never leave the process"""
+        return httpx.MockTransport(self._handle_httpx)
+
+    async def __call__(self, scope: dict[str, Any], receive: Callable[..., Any], send: Callable[..., Any]) -> None:
+        """ASGI entry point, e.g. httpx.ASGITransport(app=FakeDummyJSON()) or uvicorn --factory dummyjson.fake:FakeDummyJSON"""
+        if scope["type"] == "lifespan":
+            while (message := await receive())["type"] != "lifespan.shutdown":
+                await send({"type": "lifespan.startup.complete"})
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+        body = b""
+        more_body = True
+        while more_body:
+            message = await receive()
+            body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+        query = dict(parse_qsl(scope.get("query_string", b"").decode()))
+        headers = {name.decode().lower(): value.decode() for name, value in scope.get("headers", [])}
+        status, payload = self.handle(scope["method"], scope["path"], query, body, headers)
+        content = dump_json(payload)
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(content)).encode())],
+            }
+        )
+        await send({"type": "http.response.body", "body": content})
+
+    # Products
+
+    def _test(self, **_: Any) -> Payload:
+        return 200, {"status": "ok", "method": "GET"}
+
+    def _list_products(self, query: Mapping[str, str], **_: Any) -> Payload:
+        return _page("products", self.products, query)
+
+    def _search_products(self, query: Mapping[str, str], **_: Any) -> Payload:
+        needle = query.get("q", "").lower()
+        matches = [product for product in self.products if needle in product["title"].lower() or needle in product["description"].lower()]
+        return _page("products", matches, query)
+
+    def _categories(self, **_: Any) -> Payload:
+        slugs = self._category_list()[1]
+        return 200, [
+            {"slug": slug, "name": slug.replace("-", " ").title(), "url": f"https://dummyjson.com/products/category/{slug}"}
+            for slug in slugs
+        ]
+
+    def _category_list(self, **_: Any) -> Payload:
+        return 200, list(dict.fromkeys(product["category"] for product in self.products))
+
+    def _category_products(self, query: Mapping[str, str], slug: str, **_: Any) -> Payload:
+        return _page("products", [product for product in self.products if product["category"] == slug], query)
+
+    def _get_product(self, query: Mapping[str, str], item_id: str, **_: Any) -> Payload:
+        product = _lookup(self._products_by_id, item_id)
+        if product is None:
+            return _not_found("Product", item_id)
+        return 200, _select(product, query.get("select"))
+
+    def _add_product(self, data: dict[str, Any], **_: Any) -> Payload:
+        return 201, {"id": len(self.products) + 1, **data}
+
+    def _update_product(self, data: dict[str, Any], item_id: str, **_: Any) -> Payload:
+        product = _lookup(self._products_by_id, item_id)
+        if product is None:
+            return _not_found("Product", item_id)
+        return 200, {**product, **data, "id": product["id"]}
+
+    def _delete_product(self, item_id: str, **_: Any) -> Payload:
+        product = _lookup(self._products_by_id, item_id)
+        if product is None:
+            return _not_found("Product", item_id)
+        return 200, {**product, "isDeleted": True, "deletedOn": _now_iso()}
+
+    # Users
+
+    def _list_users(self, query: Mapping[str, str], **_: Any) -> Payload:
+        return _page("users", self.users, query)
+
+    def _search_users(self, query: Mapping[str, str], **_: Any) -> Payload:
+        needle = query.get("q", "").lower()
+        fields = ("firstName", "lastName", "maidenName", "username", "email")
+        return _page("users", [user for user in self.users if any(needle in user[field].lower() for field in fields)], query)
+
+    def _filter_users(self, query: Mapping[str, str], **_: Any) -> Payload:
+        key, value = query.get("key", ""), query.get("value", "")
+        return _page("users", [user for user in self.users if str(_path(user, key)) == value], query)
+
+    def _get_user(self, query: Mapping[str, str], item_id: str, **_: Any) -> Payload:
+        user = _lookup(self._users_by_id, item_id)
+        if user is None:
+            return _not_found("User", item_id)
+        return 200, _select(user, query.get("select"))
+
+    def _add_user(self, data: dict[str, Any], **_: Any) -> Payload:
+        # Like the real service, fields not posted come back empty rather than missing
+        return 201, {**_blank(self.users[0]), "id": len(self.users) + 1, **data}
+
+    def _update_user(self, data: dict[str, Any], item_id: str, **_: Any) -> Payload:
+        user = _lookup(self._users_by_id, item_id)
+        if user is None:
+            return _not_found("User", item_id)
+        return 200, {**user, **data, "id": user["id"]}
+
+    def _delete_user(self, item_id: str, **_: Any) -> Payload:
+        user = _lookup(self._users_by_id, item_id)
+        if user is None:
+            return _not_found("User", item_id)
+        return 200, {**user, "isDeleted": True, "deletedOn": _now_iso()}
+
+    # Auth
+
+    def _issue(self, kind: str, user: dict[str, Any], minutes: int) -> str:
+        expiry = self.clock() + minutes * 60
+        # JWT-shaped so that clients may read the expiry, but only tokens issued here are accepted
+        claims = {"id": user["id"], "username": user["username"], "exp": int(expiry), "jti": next(self._token_ids)}
+        token = f"{_b64({'alg': 'none', 'typ': 'JWT', 'kind': kind})}.{_b64(claims)}.fake"
+        with self._lock:
+            self._tokens[token] = (kind, user["id"], expiry)
+        return token
+
+    def _token_user(self, token: str, kind: str) -> dict[str, Any] | None:
+        with self._lock:
+            entry = self._tokens.get(token)
+        if entry is None or entry[0] != kind or entry[2] <= self.clock():
+            return None
+        return self._users_by_id.get(entry[1])
+
+    def _tokens_for(self, user: dict[str, Any], data: dict[str, Any]) -> dict[str, str]:
+        minutes = int(data.get("expiresInMins") or DEFAULT_TOKEN_MINS)
+        return {"accessToken": self._issue("access", user, minutes), "refreshToken": self._issue("refresh", user, minutes * 24 * 7)}
+
+    def _login(self, data: dict[str, Any], **_: Any) -> Payload:
+        user = next((user for user in self.users if user["username"] == data.get("username")), None)
+        if user is None or user["password"] != data.get("password"):
+            return 400, {"message": "Invalid credentials"}
+        profile = {field: user[field] for field in ("id", "username", "email", "firstName", "lastName", "gender", "image")}
+        return 200, {**profile, **self._tokens_for(user, data)}
+
+    def _me(self, headers: Mapping[str, str], **_: Any) -> Payload:
+        scheme, _, token = headers.get("authorization", "").partition(" ")
+        if scheme.lower() != "bearer" or not token:
+            return 401, {"message": "Access Token is required"}
+        user = self._token_user(token, "access")
+        if user is None:
+            return 401, {"message": "Invalid/expired Token!"}
+        return 200, user
+
+    def _refresh(self, data: dict[str, Any], **_: Any) -> Payload:
+        token = data.get("refreshToken")
+        if not token:
+            return 401, {"message": "Refresh token required"}
+        user = self._token_user(token, "refresh")
+        if user is None:
+            return 403, {"message": "Invalid refresh token"}
+        return 200, self._tokens_for(user, data)
+
+
+def dump_json(payload: Any) -> bytes:
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+
+def _b64(value: dict[str, Any]) -> str:
+    return base64.urlsafe_b64encode(dump_json(value)).rstrip(b"=").decode()
+
+
+def _now_iso() -> str:
+    return datetime.now(UTC).isoformat().replace("+00:00", "Z")
+
+
+def _blank(value: Any) -> Any:
+    """Empty value of the same shape, e.g. {"hair": {"color": ""}} for a user"""
+    if isinstance(value, dict):
+        return {name: _blank(item) for name, item in value.items()}
+    return type(value)()
+
+
+def _not_found(kind: str, item_id: str) -> Payload:
+    return 404, {"message": f"{kind} with id '{item_id}' not found"}
+
+
+def _lookup(items: dict[int, dict[str, Any]], item_id: str) -> dict[str, Any] | None:
+    return items.get(int(item_id)) if item_id.isdigit() else None
+
+
+def _path(item: dict[str, Any], key: str) -> Any:
+    """Value of a dotted key such as "hair.color" """
+    value: Any = item
+    for name in key.split("."):
+        value = value.get(name) if isinstance(value, dict) else None
+    return value
+
+
+def _select(item: dict[str, Any], select: str | None) -> dict[str, Any]:
+    """Projection done by select=a,b: id plus the selected top-level fields that exist"""
+    if not select:
+        return item
+    fields = ["id", *(name.strip() for name in select.split(","))]
+    return {name: item[name] for name in dict.fromkeys(fields) if name in item}
+
+
+def _page(key: str, items: list[dict[str, Any]], query: Mapping[str, str]) -> Payload:
+    """List envelope with DummyJSON's semantics: limit=0 returns everything, limit echoes the number of items returned"""
+    try:
+        limit = int(query.get("limit", DEFAULT_LIMIT))
+        skip = int(query.get("skip", 0))
+    except ValueError:
+        return 400, {"message": "limit and skip must be integers"}
+    sort_by = query.get("sortBy")
+    if sort_by:
+        items = sorted(items, key=lambda item: (item.get(sort_by) is None, item.get(sort_by)), reverse=query.get("order") == "desc")
+    page = items[skip:] if limit == 0 else items[skip : skip + limit]
+    select = query.get("select")
+    return 200, {key: [_select(item, select) for item in page], "total": len(items), "skip": skip, "limit": len(page)}
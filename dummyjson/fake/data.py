@@ -0,0 +1,159 @@
+"""Deterministic fixture data for the fake DummyJSON backend"""
+
+import random
+from typing import Any
+
+SEED = 20240523
+PRODUCT_COUNT = 120
+USER_COUNT = 100
+
+CATALOG: dict[str, list[tuple[str, str]]] = {
+    "beauty": [
+        ("Essence Mascara Lash Princess", "Essence"),
+        ("Eyeshadow Palette with Mirror", "Glamour Beauty"),
+        ("Red Lipstick", "Chic Cosmetics"),
+    ],
+    "fragrances": [
+        ("Calvin Klein CK One", "Calvin Klein"),
+        ("Chanel Coco Noir Eau De Perfume", "Chanel"),
+        ("Dior J'adore Perfume", "Dior"),
+    ],
+    "furniture": [("Annibale Colombo Bed", "Annibale Colombo"), ("Wooden Bathroom Sink With Mirror", "Furniture Co.")],
+    "groceries": [("Apple", "Fresh Farms"), ("Cooking Oil", "Golden Harvest"), ("Green Chili Pepper", "Fresh Farms")],
+    "laptops": [
+        ("Apple MacBook Pro 14 Inch Laptop", "Apple"),
+        ("Asus Zenbook Pro Dual Screen Laptop", "Asus"),
+        ("Lenovo Yoga 920 Laptop", "Lenovo"),
+    ],
+    "smartphones": [("iPhone 13 Pro", "Apple"), ("iPhone X", "Apple"), ("Samsung Galaxy S10", "Samsung")],
+    "mens-watches": [("Rolex Submariner Watch", "Rolex"), ("Brown Leather Belt Watch", "Fashion Timepieces")],
+    "womens-watches": [("Watch Gold for Women", "Fashion Timepieces"), ("IWC Ingenieur Automatic Steel Watch", "IWC")],
+    "mens-shoes": [("Nike Air Jordan 1 Red And Black Shoes", "Nike"), ("Sports Sneakers Off White & Red Shoes", "Off White")],
+    "womens-shoes": [("Black & Brown Slipper Shoes", "Comfort Trends"), ("Golden Shoes Woman", "Fashion Diva")],
+    "sunglasses": [("Classic Sun Glasses", "Fashion Shades"), ("Party Glasses", "Fashion Fun")],
+}
+FIRST_NAMES = ["Emily", "Michael", "Sophia", "James", "Emma", "Olivia", "Alexander", "Ava", "Ethan", "Isabella", "John", "Liam", "Mia"]
+LAST_NAMES = ["Johnson", "Williams", "Brown", "Davis", "Miller", "Wilson", "Moore", "Taylor", "Anderson", "Smith", "Thomas", "Jackson"]
+HAIR_COLORS = ["Brown", "Black", "Blonde", "Red", "Gray", "White"]
+HAIR_TYPES = ["Curly", "Straight", "Wavy", "Kinky"]
+CITIES = [("Phoenix", "Mississippi", "MS"), ("Houston", "Alabama", "AL"), ("Washington", "Kansas", "KS"), ("Seattle", "Nevada", "NV")]
+DEPARTMENTS = ["Engineering", "Support", "Research and Development", "Human Resources", "Marketing", "Accounting"]
+# Stock below which a product is "Low Stock"
+LOW_STOCK = 10
+TIMESTAMP = "2024-05-23T08:56:21.618Z"
+
+
+def make_products(count: int = PRODUCT_COUNT, seed: int = SEED) -> list[dict[str, Any]]:
+    """Products with every field DummyJSON returns, cycling through the catalog categories"""
+    rng = random.Random(seed)
+    entries = [(category, title, brand) for category, items in CATALOG.items() for title, brand in items]
+    products = []
+    for product_id in range(1, count + 1):
+        category, title, brand = entries[(product_id - 1) % len(entries)]
+        if product_id > len(entries):
+            title = f"{title} {(product_id - 1) // len(entries) + 1}"
+        stock = rng.randint(0, 120)
+        products.append(
+            {
+                "id": product_id,
+                "title": title,
+                "description": f"The {title} by {brand}, a popular choice in {category.replace('-', ' ')}.",
+                "category": category,
+                "price": round(rng.uniform(1, 2000), 2),
+                "discountPercentage": round(rng.uniform(0, 20), 2),
+                "rating": round(rng.uniform(2.5, 5), 2),
+                "stock": stock,
+                "tags": [category, brand.lower()],
+                "brand": brand,
+                "sku": f"SKU{product_id:05d}",
+                "weight": rng.randint(1, 10),
+                "dimensions": {
+                    "width": round(rng.uniform(5, 30), 2),
+                    "height": round(rng.uniform(5, 30), 2),
+                    "depth": round(rng.uniform(5, 30), 2),
+                },
+                "warrantyInformation": f"{rng.choice([1, 3, 6, 12])} month warranty",
+                "shippingInformation": f"Ships in {rng.choice([1, 2, 3, 7])} business days",
+                "availabilityStatus": "Low Stock" if stock < LOW_STOCK else "In Stock",
+                "reviews": [
+                    {
+                        "rating": rng.randint(1, 5),
+                        "comment": rng.choice(["Very satisfied!", "Would not recommend!", "Great value for money!"]),
+                        "date": TIMESTAMP,
+                        "reviewerName": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+                        "reviewerEmail": f"reviewer{product_id}.{index}@x.dummyjson.com",
+                    }
+                    for index in range(3)
+                ],
+                "returnPolicy": "30 days return policy",
+                "minimumOrderQuantity": rng.randint(1, 50),
+                "meta": {
+                    "createdAt": TIMESTAMP,
+                    "updatedAt": TIMESTAMP,
+                    "barcode": f"{rng.randrange(10**12, 10**13)}",
+                    "qrCode": "https://cdn.dummyjson.com/qr.png",
+                },
+                "thumbnail": f"https://cdn.dummyjson.com/products/{product_id}/thumbnail.webp",
+                "images": [f"https://cdn.dummyjson.com/products/{product_id}/1.webp"],
+            }
+        )
+    return products
+
+
+def make_users(count: int = USER_COUNT, seed: int = SEED) -> list[dict[str, Any]]:
+    """Users with every field DummyJSON returns, user 1 is emilys/emilyspass as on the real service"""
+    rng = random.Random(seed)
+    users = []
+    for user_id in range(1, count + 1):
+        first_name = "Emily" if user_id == 1 else FIRST_NAMES[(user_id - 1) % len(FIRST_NAMES)]
+        last_name = "Johnson" if user_id == 1 else LAST_NAMES[(user_id * 7) % len(LAST_NAMES)]
+        username = "emilys" if user_id == 1 else f"{first_name.lower()}{last_name.lower()[0]}{user_id}"
+        city, state, state_code = rng.choice(CITIES)
+        address = {
+            "address": f"{rng.randint(100, 9999)} Main Street",
+            "city": city,
+            "state": state,
+            "stateCode": state_code,
+            "postalCode": f"{rng.randint(10000, 99999)}",
+            "coordinates": {"lat": round(rng.uniform(-90, 90), 6), "lng": round(rng.uniform(-180, 180), 6)},
+            "country": "United States",
+        }
+        users.append(
+            {
+                "id": user_id,
+                "firstName": first_name,
+                "lastName": last_name,
+                "maidenName": "Smith" if user_id % 5 == 0 else "",
+                "age": 18 + (user_id * 13) % 50,
+                "gender": "female" if first_name in {"Emily", "Sophia", "Emma", "Olivia", "Ava", "Isabella", "Mia"} else "male",
+                "email": f"{first_name.lower()}.{last_name.lower()}{'' if user_id == 1 else user_id}@x.dummyjson.com",
+                "phone": f"+1 555-{user_id:04d}",
+                "username": username,
+                "password": "emilyspass" if user_id == 1 else f"{username}pass",
+                "birthDate": f"{1960 + user_id % 45}-{user_id % 12 + 1}-{user_id % 28 + 1}",
+                "image": f"https://dummyjson.com/icon/{username}/128",
+                "bloodGroup": rng.choice(["A+", "A-", "B+", "B-", "O+", "O-", "AB+", "AB-"]),
+                "height": round(rng.uniform(150, 200), 2),
+                "weight": round(rng.uniform(50, 110), 2),
+                "eyeColor": rng.choice(["Green", "Brown", "Blue", "Gray", "Amber"]),
+                "hair": {"color": HAIR_COLORS[user_id % len(HAIR_COLORS)], "type": rng.choice(HAIR_TYPES)},
+                "ip": f"10.{user_id % 256}.{rng.randint(0, 255)}.{rng.randint(1, 254)}",
+                "address": address,
+                "macAddress": ":".join(f"{rng.randint(0, 255):02x}" for _ in range(6)),
+                "university": "University of Wisconsin--Madison",
+                "bank": {
+                    "cardExpire": f"{rng.randint(1, 12):02d}/{rng.randint(25, 30)}",
+                    "cardNumber": f"{rng.randrange(10**15, 10**16)}",
+                    "cardType": rng.choice(["Visa", "Mastercard", "Amex"]),
+                    "currency": "USD",
+                    "iban": f"US{rng.randrange(10**19, 10**20)}",
+                },
+                "company": {"department": rng.choice(DEPARTMENTS), "name": f"{last_name} and Sons", "title": "Manager", "address": address},
+                "ein": f"{rng.randint(100, 999)}-{rng.randint(100, 999)}",
+                "ssn": f"{rng.randint(100, 999)}-{rng.randint(10, 99)}-{rng.randint(1000, 9999)}",
+                "userAgent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)",
+                "crypto": {"coin": "Bitcoin", "wallet": f"0x{rng.getrandbits(160):040x}", "network": "Ethereum (ERC20)"},
+                "role": "admin" if user_id == 1 else rng.choice(["user", "moderator"]),
+            }
+        )
+    return users
@@ -0,0 +1,133 @@
+"""
+Load test DummyJSON (or a compatible backend) with the async domain clients
+python -m dummyjson.load --fake --mode open --rps 200 --duration 30 --mix products=70,search=20,login=10
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import sys
+from collections.abc import Callable, Coroutine
+from pathlib import Path
+from typing import Any
+
+from base.api.async_api_client import AsyncAPIClient
+from base.api.request_log import FORMATS, configure_logging
+from base.load.runner import LoadProfile, LoadReport, LoadRunner, Scenario
+from dummyjson.clients.auth_client import AsyncAuthClient
+from dummyjson.clients.product_client import AsyncProductClient
+from dummyjson.clients.user_client import AsyncUserClient
+from dummyjson.fake import FakeDummyJSON
+
+BASE_URL = "https://dummyjson.com"
+DEFAULT_MIX = "products=70,search=20,login=10"
+SEARCH_TERMS = ("phone", "laptop", "perfume", "watch", "shoes", "mascara", "apple")
+
+
+class LoadContext:
+    """Clients and test data shared by all virtual users"""
+
+    def __init__(self, api: AsyncAPIClient, seed: int | None = None, product_count: int = 100, user_count: int = 100):
+        self.api = api
+        self.products = AsyncProductClient(api)
+        self.users = AsyncUserClient(api)
+        self.auth = AsyncAuthClient(api)
+        self.rng = random.Random(seed)
+        self.product_count = product_count
+        self.user_count = user_count
+        self.credentials = {"username": "emilys", "password": "emilyspass"}
+
+
+async def read_product(context: LoadContext) -> None:
+    await context.products.get_product_by_id(context.rng.randint(1, context.product_count))
+
+
+async def search_products(context: LoadContext) -> None:
+    await context.products.search_products(context.rng.choice(SEARCH_TERMS), limit=10)
+
+
+async def read_user(context: LoadContext) -> None:
+    await context.users.get_user_by_id(context.rng.randint(1, context.user_count))
+
+
+async def login_and_me(context: LoadContext) -> None:
+    login = await context.auth.login(**context.credentials)
+    await context.auth.get_current_user(login.accessToken)
+
+
+SCENARIOS: dict[str, Callable[[LoadContext], Coroutine[Any, Any, None]]] = {
+    "products": read_product,
+    "search": search_products,
+    "users": read_user,
+    "login": login_and_me,
+}
+
+
+def parse_mix(mix: str) -> list[Scenario]:
+    """Scenarios from "name=weight,..." such as "products=70,search=20,login=10" """
+    scenarios = []
+    for part in mix.split(","):
+        name, _, weight = part.strip().partition("=")
+        if name not in SCENARIOS:
+            raise ValueError(f"Unknown scenario {name!r}, choose from {', '.join(SCENARIOS)}")
+        scenarios.append(Scenario(name, float(weight or 1), SCENARIOS[name]))
+    return scenarios
+
+
+async def run_load(
+    profile: LoadProfile,
+    mix: str = DEFAULT_MIX,
+    base_url: str = BASE_URL,
+    backend: FakeDummyJSON | None = None,
+) -> LoadReport:
+    """Run profile against base_url, or against backend in-process when one is given"""
+    runner = LoadRunner(parse_mix(mix))
+    transport = runner.record_endpoints(backend.transport() if backend else None)
+    async with AsyncAPIClient(base_url, retries=0, enable_logging=False, transport=transport) as api:
+        product_count = len(backend.products) if backend else 100
+        runner.context = LoadContext(api, seed=profile.seed, product_count=product_count)
+        return await runner.run(profile)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Load test DummyJSON with weighted scenarios")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--base-url", default=BASE_URL, help=f"Backend to load (default {BASE_URL})")
+    target.add_argument("--fake", action="store_true", help="Load the in-process fake backend instead")
+    parser.add_argument("--mode", choices=("open", "closed"), default="closed", help="open: fixed arrival rate, closed: virtual users")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds of load")
+    parser.add_argument("--users", type=int, default=10, help="Virtual users (closed) or maximum scenarios in flight (open)")
+    parser.add_argument("--rps", type=float, default=None, help="Scenario starts per second (open) or throughput cap (closed)")
+    parser.add_argument("--ramp-up", type=float, default=0.0, help="Seconds to reach the full rate or number of users")
+    parser.add_argument("--think-time", type=float, default=0.0, help="Pause between scenarios of a virtual user")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"Scenario weights, from: {', '.join(SCENARIOS)} (default {DEFAULT_MIX})")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--json", type=Path, default=None, metavar="PATH", help="Also write the report as JSON")
+    parser.add_argument("--log-format", choices=FORMATS, default="kv", help="Format of log lines on stderr (default kv)")
+    parser.add_argument("--max-error-rate", type=float, default=None, help="Exit with status 1 above this share of failed scenarios")
+    args = parser.parse_args(argv)
+    if args.mode == "open" and not args.rps:
+        parser.error("--mode open needs --rps")
+    try:
+        parse_mix(args.mix)
+    except ValueError as error:
+        parser.error(str(error))
+
+    # Like logging.basicConfig, leave logging alone when the caller (e.g. pytest) already set it up
+    if not logging.getLogger().handlers:
+        configure_logging(logging.INFO, args.log_format)
+    # Per-request log lines would dominate the run
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    profile = LoadProfile(args.mode, args.duration, args.users, args.rps, args.ramp_up, args.think_time, args.seed)
+    report = asyncio.run(run_load(profile, args.mix, args.base_url, FakeDummyJSON() if args.fake else None))
+    print(report.format())
+    if args.json:
+        args.json.write_text(json.dumps(report.to_dict(), indent=2), encoding="utf-8")
+    error_rate = report.errors / report.total if report.total else 0.0
+    return 1 if args.max_error_rate is not None and error_rate > args.max_error_rate else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
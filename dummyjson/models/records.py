@@ -0,0 +1,17 @@
+"""Frozen, slotted records of products and users for bulk results, see base.models.records"""
+
+from base.models.records import record_type
+from dummyjson.models.product import Dimensions, Meta, Product, Review
+from dummyjson.models.user import Address, Bank, Company, Crypto, Hair, User
+
+ProductRecord = record_type(Product)
+DimensionsRecord = record_type(Dimensions)
+MetaRecord = record_type(Meta)
+ReviewRecord = record_type(Review)
+
+UserRecord = record_type(User)
+HairRecord = record_type(Hair)
+AddressRecord = record_type(Address)
+CompanyRecord = record_type(Company)
+BankRecord = record_type(Bank)
+CryptoRecord = record_type(Crypto)
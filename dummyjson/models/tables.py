@@ -0,0 +1,48 @@
+"""Columnar views of products and users for analytics over full catalogs (requires numpy)"""
+
+from typing import ClassVar
+
+import numpy as np
+
+from base.models.columnar import ColumnTable
+
+
+class ProductTable(ColumnTable):
+    """Products as columns, e.g. ProductTable.from_response(client.get_all_products(limit=0))"""
+
+    items_key = "products"
+    numeric_columns: ClassVar[dict[str, type]] = {
+        "id": np.int64,
+        "price": np.float64,
+        "discountPercentage": np.float64,
+        "rating": np.float64,
+        "stock": np.float64,
+        "weight": np.float64,
+    }
+    categorical_columns = ("title", "category", "brand", "availabilityStatus")
+
+
+class UserTable(ColumnTable):
+    """Users as columns, e.g. UserTable.from_records(client.iter_users())"""
+
+    items_key = "users"
+    numeric_columns: ClassVar[dict[str, type]] = {
+        "id": np.int64,
+        "age": np.float64,
+        "height": np.float64,
+        "weight": np.float64,
+    }
+    categorical_columns = (
+        "firstName",
+        "lastName",
+        "username",
+        "email",
+        "gender",
+        "bloodGroup",
+        "eyeColor",
+        "role",
+        "hair.color",
+        "address.city",
+        "address.country",
+        "company.department",
+    )
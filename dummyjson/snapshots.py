@@ -0,0 +1,136 @@
+"""
+Read-only snapshots of the product catalog and the user directory, fetched once and indexed for O(1) lookups
+Tests share them through the session fixtures catalog and user_directory instead of downloading the data again
+"""
+
+from collections import defaultdict
+from collections.abc import Iterable, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from threading import Lock
+from types import MappingProxyType
+from typing import Any
+
+from base.api.pagination import DEFAULT_CONCURRENCY
+from base.models.records import to_records
+from dummyjson.clients.product_client import ProductClient
+from dummyjson.clients.user_client import UserClient
+from dummyjson.models.records import ProductRecord, UserRecord
+
+# Page size of the snapshot downloads, the pages after the first are requested concurrently
+SNAPSHOT_PAGE_SIZE = 100
+
+
+def _unique_index(records: tuple[Any, ...], attribute: str) -> Mapping[Any, Any]:
+    """First record per attribute value, read-only"""
+    index: dict[Any, Any] = {}
+    for record in records:
+        index.setdefault(getattr(record, attribute), record)
+    return MappingProxyType(index)
+
+
+@dataclass(frozen=True, eq=False)
+class CatalogSnapshot:
+    """Every product as frozen records, indexed by id and category"""
+
+    products: tuple[ProductRecord, ...]
+    by_id: Mapping[int, ProductRecord] = field(init=False, repr=False)
+    by_category: Mapping[str, tuple[ProductRecord, ...]] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        categories: defaultdict[str, list[ProductRecord]] = defaultdict(list)
+        for product in self.products:
+            categories[product.category].append(product)
+        object.__setattr__(self, "by_id", _unique_index(self.products, "id"))
+        object.__setattr__(self, "by_category", MappingProxyType({name: tuple(items) for name, items in categories.items()}))
+
+    @classmethod
+    def from_records(cls, records: Iterable[ProductRecord]) -> "CatalogSnapshot":
+        return cls(tuple(records))
+
+    @classmethod
+    def fetch(cls, products: ProductClient, concurrency: int = DEFAULT_CONCURRENCY) -> "CatalogSnapshot":
+        response = products.get_all_products(limit=SNAPSHOT_PAGE_SIZE, fetch_all=True, concurrency=concurrency)
+        return cls.from_records(to_records(response.products))
+
+    def __len__(self) -> int:
+        return len(self.products)
+
+    @property
+    def categories(self) -> tuple[str, ...]:
+        return tuple(self.by_category)
+
+    def in_category(self, category: str) -> tuple[ProductRecord, ...]:
+        return self.by_category.get(category, ())
+
+
+@dataclass(frozen=True, eq=False)
+class UserDirectory:
+    """Every user as frozen records, indexed by id, email and username"""
+
+    users: tuple[UserRecord, ...]
+    by_id: Mapping[int, UserRecord] = field(init=False, repr=False)
+    by_email: Mapping[str, UserRecord] = field(init=False, repr=False)
+    by_username: Mapping[str, UserRecord] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "by_id", _unique_index(self.users, "id"))
+        object.__setattr__(self, "by_email", _unique_index(self.users, "email"))
+        object.__setattr__(self, "by_username", _unique_index(self.users, "username"))
+
+    @classmethod
+    def from_records(cls, records: Iterable[UserRecord]) -> "UserDirectory":
+        return cls(tuple(records))
+
+    @classmethod
+    def fetch(cls, users: UserClient, concurrency: int = DEFAULT_CONCURRENCY) -> "UserDirectory":
+        response = users.get_all_users(limit=SNAPSHOT_PAGE_SIZE, fetch_all=True, concurrency=concurrency)
+        return cls.from_records(to_records(response.users))
+
+    def __len__(self) -> int:
+        return len(self.users)
+
+
+class Snapshots:
+    """
+    Lazily fetched snapshots shared by a test session: the first access to either starts both downloads in parallel,
+    later accesses (from any thread) wait for the same result
+    """
+
+    def __init__(self, products: ProductClient, users: UserClient, concurrency: int = DEFAULT_CONCURRENCY):
+        self.products = products
+        self.users = users
+        self.concurrency = concurrency
+        self._futures: tuple[Future[CatalogSnapshot], Future[UserDirectory]] | None = None
+        self._lock = Lock()
+
+    def _start(self) -> tuple[Future[CatalogSnapshot], Future[UserDirectory]]:
+        with self._lock:
+            if self._futures is None:
+                executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="snapshot")
+                self._futures = (
+                    executor.submit(CatalogSnapshot.fetch, self.products, self.concurrency),
+                    executor.submit(UserDirectory.fetch, self.users, self.concurrency),
+                )
+                # The workers exit once both downloads are done, callers only wait for the snapshot they read
+                executor.shutdown(wait=False)
+            return self._futures
+
+    def _result(self, index: int) -> Any:
+        futures = self._start()
+        try:
+            return futures[index].result()
+        except Exception:
+            # Failed downloads are not kept for the session, the next access starts both again
+            with self._lock:
+                if self._futures is futures:
+                    self._futures = None
+            raise
+
+    @property
+    def catalog(self) -> CatalogSnapshot:
+        return self._result(0)
+
+    @property
+    def user_directory(self) -> UserDirectory:
+        return self._result(1)
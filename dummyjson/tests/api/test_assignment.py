@@ -12,7 +12,7 @@ import pytest
 
 from dummyjson.clients.auth_client import AuthClient
 from dummyjson.clients.product_client import ProductClient
-from dummyjson.clients.user_client import UserClient
+from dummyjson.snapshots import CatalogSnapshot, UserDirectory
 
 
 @allure.feature("Assignment Tests")
@@ -20,21 +20,17 @@ from dummyjson.clients.user_client import UserClient
 class TestUserVerification:
     @allure.title("Verify user with specific email exists")
     @allure.description("Check that at least one user with email 'emily.johnson@x.dummyjson.com' is returned from /users")
-    def test_user_with_specific_email_exists(self, user_client: UserClient):
+    def test_user_with_specific_email_exists(self, user_directory: UserDirectory):
         """Verify that user with email emily.johnson@x.dummyjson.com exists in the system"""
         target_email = "emily.johnson@x.dummyjson.com"
 
-        # Get all users
-        response = user_client.get_all_users(limit=0)  # Get all users
+        # Every user is downloaded once per session, the email index answers without a scan
+        user = user_directory.by_email.get(target_email)
 
-        # Check that at least one user has the target email
-        users_with_email = [user for user in response.users if user.email == target_email]
-
-        assert len(users_with_email) >= 1, f"Expected at least 1 user with email {target_email}, but found {len(users_with_email)}"
-        assert users_with_email[0].email == target_email, f"User email should be {target_email}"
+        assert user is not None, f"Expected at least 1 user with email {target_email} among {len(user_directory)} users"
+        assert user.email == target_email, f"User email should be {target_email}"
 
         # Additional verification
-        user = users_with_email[0]
         assert user.firstName, "User should have a first name"
         assert user.lastName, "User should have a last name"
         assert user.username, "User should have a username"
@@ -91,19 +87,17 @@ class TestAuthenticationVerification:
 class TestProductsVerification:
     @allure.title("Verify at least 5 products with price, title and description")
     @allure.description("Check that /products returns at least 5 products and each has price, title and description")
-    def test_minimum_5_products_with_required_fields(self, product_client: ProductClient):
+    def test_minimum_5_products_with_required_fields(self, catalog: CatalogSnapshot):
         """Verify that at least 5 products are returned with price, title and description"""
 
-        with allure.step("Step 1: Get products from /products endpoint"):
-            response = product_client.get_all_products(limit=30)
-
-            assert response.total > 0, "Total products should be greater than 0"
-            assert len(response.products) >= 5, f"Expected at least 5 products, but got {len(response.products)}"
+        with allure.step("Step 1: Get products from /products endpoint (session catalog snapshot)"):
+            assert len(catalog) > 0, "Total products should be greater than 0"
+            assert len(catalog) >= 5, f"Expected at least 5 products, but got {len(catalog)}"
 
-            allure.attach(f"Total products in system: {response.total}", "Product Count", allure.attachment_type.TEXT)
+            allure.attach(f"Total products in system: {len(catalog)}", "Product Count", allure.attachment_type.TEXT)
 
         with allure.step("Step 2: Verify each of first 5 products has required fields"):
-            products_to_check = response.products[:5]
+            products_to_check = catalog.products[:5]
 
             for idx, product in enumerate(products_to_check, 1):
                 with allure.step(f"Product {idx}: {product.title}"):
@@ -1,6 +1,7 @@
 import allure
 
 from dummyjson.clients.auth_client import AuthClient
+from dummyjson.clients.token_manager import TokenManager
 
 
 @allure.feature("Authentication API")
@@ -51,6 +52,20 @@ class TestGetCurrentUser:
         assert user.firstName, "First name should not be empty"
         assert user.lastName, "Last name should not be empty"
 
+    @allure.title("Get current user with a managed token")
+    @allure.description("Verify that tokens from the session token manager are accepted and reused")
+    def test_get_current_user_with_managed_token(
+        self, auth_client: AuthClient, token_manager: TokenManager, test_credentials: dict[str, str]
+    ):
+        access_token = token_manager.token(test_credentials["username"], test_credentials["password"])
+
+        user = auth_client.get_current_user(access_token)
+
+        assert user.username == test_credentials["username"], "Managed token should identify the user"
+        assert token_manager.token(test_credentials["username"], test_credentials["password"]) == access_token, (
+            "Token should be cached for the session"
+        )
+
 
 @allure.feature("Authentication API")
 @allure.story("Refresh Token")
@@ -0,0 +1,84 @@
+"""
+Pytest plugin distributing API tests over xdist workers by endpoint, slowest endpoints first
+Tests of one class exercise one endpoint, so each class becomes an xdist_group (run with --dist loadgroup) and
+shares a worker's warm connections and cache entries; groups are ordered by the durations of the last run
+Serial runs and other xdist schedulers keep the collection order and record nothing
+"""
+
+import re
+from collections import defaultdict
+
+import pytest
+
+# pytest cache key (.pytest_cache) of the per-test durations of the last loadgroup run
+TIMINGS_KEY = "dummyjson/timings"
+# Parametrized ids end with "]", so an "@" inside them (e.g. an email) is never taken for the suffix
+GROUP_SUFFIX = re.compile(r"@[\w.]+$")
+
+
+def endpoint_group(item: pytest.Item) -> str:
+    """Module and class of a test, e.g. "test_products.TestSearchProducts" """
+    module = item.path.stem
+    return f"{module}.{item.cls.__name__}" if item.cls else module
+
+
+def base_nodeid(nodeid: str) -> str:
+    """Node id without the "@group" suffix xdist adds under --dist loadgroup"""
+    return GROUP_SUFFIX.sub("", nodeid)
+
+
+def loadgroup_run(config: pytest.Config) -> bool:
+    """Whether tests are distributed over xdist workers with --dist loadgroup (true on the controller and the workers)"""
+    distributed = hasattr(config, "workerinput") or bool(config.getoption("numprocesses", None))
+    return distributed and config.getoption("dist", None) == "loadgroup"
+
+
+class SlowestFirstScheduler:
+    """Groups tests by endpoint, orders them by last-run timings and records the timings of this run"""
+
+    def __init__(self, config: pytest.Config):
+        self.config = config
+        self.durations: dict[str, float] = defaultdict(float)
+
+    def load_timings(self) -> dict[str, float]:
+        cache = getattr(self.config, "cache", None)
+        return cache.get(TIMINGS_KEY, {}) if cache is not None else {}
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_collection_modifyitems(self, items: list[pytest.Item]):
+        for item in items:
+            item.add_marker(pytest.mark.xdist_group(endpoint_group(item)))
+        timings = self.load_timings()
+        if not timings or self.config.getoption("--no-slowest-first"):
+            return
+        # Tests without a timing count as the slowest so that new tests are not left for the end
+        slowest = max(timings.values())
+        duration = {item.nodeid: timings.get(item.nodeid, slowest) for item in items}
+        group_total: dict[str, float] = defaultdict(float)
+        for item in items:
+            group_total[endpoint_group(item)] += duration[item.nodeid]
+        # Deterministic, so every xdist worker collects the same order
+        items.sort(key=lambda item: (-group_total[endpoint_group(item)], endpoint_group(item), -duration[item.nodeid]))
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport):
+        # On the xdist controller this also receives the reports of every worker
+        self.durations[base_nodeid(report.nodeid)] += report.duration
+
+    def pytest_sessionfinish(self):
+        cache = getattr(self.config, "cache", None)
+        if hasattr(self.config, "workerinput") or cache is None or not self.durations:
+            return
+        timings = self.load_timings()
+        timings.update({nodeid: round(duration, 4) for nodeid, duration in self.durations.items()})
+        cache.set(TIMINGS_KEY, timings)
+
+
+def pytest_addoption(parser: pytest.Parser):
+    group = parser.getgroup("dummyjson")
+    group.addoption("--no-slowest-first", action="store_true", default=False, help="Keep collection order instead of slowest-first")
+
+
+def pytest_configure(config: pytest.Config):
+    config.addinivalue_line("markers", "xdist_group(name): run tests of a group on the same xdist worker")
+    if loadgroup_run(config):
+        config.pluginmanager.register(SlowestFirstScheduler(config), "slowest-first-scheduler")
@@ -0,0 +1,18 @@
+import threading
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+from dummyjson.fake import FakeDummyJSON
+from dummyjson.fake.__main__ import make_handler
+
+
+@pytest.fixture(scope="module")
+def fake_server() -> str:
+    """Fake backend served over a real socket, for tests of connections, pools and traced phases"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(FakeDummyJSON()))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
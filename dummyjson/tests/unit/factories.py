@@ -0,0 +1,55 @@
+"""Minimal DummyJSON-shaped payloads for offline tests"""
+
+from typing import Any
+
+
+def make_product(product_id: int) -> dict[str, Any]:
+    return {
+        "id": product_id,
+        "title": f"Product {product_id}",
+        "description": f"Description of product {product_id}",
+        "category": "beauty",
+        "price": 9.99 + product_id,
+        "stock": product_id % 50,
+    }
+
+
+def make_user(user_id: int) -> dict[str, Any]:
+    coordinates = {"lat": 1.0, "lng": 2.0}
+    address = {"address": "1 Main St", "city": "Phoenix", "postalCode": "12345", "coordinates": coordinates, "country": "US"}
+    return {
+        "id": user_id,
+        "firstName": "Emily",
+        "lastName": "Johnson",
+        "maidenName": "Smith",
+        "age": 20 + user_id % 40,
+        "gender": "female",
+        "email": f"user{user_id}@x.dummyjson.com",
+        "phone": "+1 555-0100",
+        "username": f"user{user_id}",
+        "password": "secret",
+        "birthDate": "1996-5-30",
+        "image": "https://dummyjson.com/icon/user/128",
+        "bloodGroup": "O-",
+        "height": 170.5,
+        "weight": 60.2,
+        "eyeColor": "Green",
+        "hair": {"color": "Brown", "type": "Curly"},
+        "ip": "42.48.100.32",
+        "address": address,
+        "macAddress": "47:fa:41:18:ec:eb",
+        "university": "University of Wisconsin",
+        "bank": {"cardExpire": "03/26", "cardNumber": "9289760655481815", "cardType": "Elo", "currency": "CNY", "iban": "YPUXISOBI7TTH"},
+        "company": {"department": "Engineering", "name": "Dooley", "title": "Sales Manager", "address": address},
+        "ein": "977-175",
+        "ssn": "900-590-289",
+        "userAgent": "Mozilla/5.0",
+        "crypto": {"coin": "Bitcoin", "wallet": "0xb9fc2fe63b2a6c003f1c324c3bfa53259162181a", "network": "Ethereum (ERC20)"},
+        "role": "admin",
+    }
+
+
+def make_page(key: str, items: list[dict[str, Any]], limit: int, skip: int) -> dict[str, Any]:
+    """Slice items the way DummyJSON does for limit/skip (limit=0 means everything)"""
+    page = items[skip:] if limit == 0 else items[skip : skip + limit]
+    return {key: page, "total": len(items), "skip": skip, "limit": len(page)}
@@ -0,0 +1,90 @@
+import asyncio
+
+import allure
+import httpx
+import pytest
+
+from base.api.async_api_client import AsyncAPIClient
+from dummyjson.clients.auth_client import AsyncAuthClient
+from dummyjson.clients.product_client import AsyncProductClient
+from dummyjson.clients.user_client import AsyncUserClient
+from dummyjson.tests.unit.factories import make_product, make_user
+
+BASE_URL = "https://dummyjson.test"
+
+
+@allure.feature("Client Layer")
+@allure.story("Async API Client")
+class TestAsyncAPIClient:
+    @allure.title("Default headers are merged with per-call headers")
+    def test_default_headers_merged(self):
+        seen: list[httpx.Headers] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.headers)
+            return httpx.Response(200, json={})
+
+        async def scenario():
+            async with AsyncAPIClient(BASE_URL, transport=httpx.MockTransport(handler)) as api:
+                api.set_bearer_token("token-1")
+                await api.get("/products/1", headers={"X-Trace": "abc"})
+
+        asyncio.run(scenario())
+
+        assert seen[0]["Authorization"] == "Bearer token-1", "Default bearer token should be sent"
+        assert seen[0]["X-Trace"] == "abc", "Per-call header should be sent"
+
+    @allure.title("HTTP errors are retried and then re-raised")
+    def test_retries_then_raises(self):
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(503)
+
+        async def scenario():
+            async with AsyncAPIClient(BASE_URL, retries=2, retry_interval=0, transport=httpx.MockTransport(handler)) as api:
+                await api.get("/products/1")
+
+        with pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(scenario())
+        assert len(calls) == 3, "Client should make 1 attempt plus 2 retries"
+
+
+@allure.feature("Client Layer")
+@allure.story("Async Domain Clients")
+class TestAsyncDomainClients:
+    @allure.title("Concurrent product and user lookups on one event loop")
+    def test_concurrent_lookups(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            resource, item_id = request.url.path.strip("/").split("/")
+            payload = make_product(int(item_id)) if resource == "products" else make_user(int(item_id))
+            return httpx.Response(200, json=payload)
+
+        async def scenario():
+            async with AsyncAPIClient(BASE_URL, transport=httpx.MockTransport(handler)) as api:
+                products, users = AsyncProductClient(api), AsyncUserClient(api)
+                return await asyncio.gather(
+                    asyncio.gather(*(products.get_product_by_id(i) for i in range(1, 21))),
+                    asyncio.gather(*(users.get_user_by_id(i) for i in range(1, 21))),
+                )
+
+        products, users = asyncio.run(scenario())
+
+        assert [p.id for p in products] == list(range(1, 21)), "Products should come back in request order"
+        assert [u.id for u in users] == list(range(1, 21)), "Users should come back in request order"
+
+    @allure.title("Async login sends credentials and parses tokens")
+    def test_async_login(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            body = {**make_user(1), "accessToken": "access", "refreshToken": "refresh"}
+            return httpx.Response(200, json=body)
+
+        async def scenario():
+            async with AsyncAPIClient(BASE_URL, transport=httpx.MockTransport(handler)) as api:
+                return await AsyncAuthClient(api).login("emilys", "emilyspass")
+
+        response = asyncio.run(scenario())
+
+        assert response.accessToken == "access", "Access token should be parsed"
+        assert response.refreshToken == "refresh", "Refresh token should be parsed"
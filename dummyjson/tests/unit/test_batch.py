@@ -0,0 +1,80 @@
+import asyncio
+import threading
+
+import allure
+import httpx
+
+from base.api.api_client import APIClient
+from base.api.async_api_client import AsyncAPIClient
+from base.api.batch import plan_batch
+from dummyjson.clients.product_client import ProductClient
+from dummyjson.clients.user_client import AsyncUserClient
+from dummyjson.tests.unit.factories import make_page, make_product, make_user
+
+BASE_URL = "https://dummyjson.test"
+PRODUCTS = [make_product(i) for i in range(1, 195)]
+USERS = [make_user(i) for i in range(1, 209)]
+
+
+def catalog_handler(requests: list[httpx.Request]):
+    lock = threading.Lock()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        with lock:
+            requests.append(request)
+        resource, _, item_id = request.url.path.strip("/").partition("/")
+        items = USERS if resource == "users" else PRODUCTS
+        if item_id:
+            index = int(item_id) - 1
+            if not 0 <= index < len(items):
+                return httpx.Response(404, json={"message": f"not found: {item_id}"})
+            return httpx.Response(200, json=items[index])
+        return httpx.Response(200, json=make_page(resource, items, int(request.url.params["limit"]), int(request.url.params["skip"])))
+
+    return handler
+
+
+@allure.feature("Client Layer")
+@allure.story("Batch Lookups")
+class TestBatchLookups:
+    @allure.title("Dense ID ranges become pages, sparse IDs single requests")
+    def test_plan(self):
+        plan = plan_batch([5, 1, 2, 3, 3, 4, 90, 150])
+
+        assert plan.pages == [(5, 0, [1, 2, 3, 4, 5])], "Consecutive IDs should be read as one page"
+        assert plan.singles == [90, 150], "Isolated IDs should be requested one by one"
+
+    @allure.title("Sparse product IDs are fetched individually, missing IDs are reported per ID")
+    def test_sparse_products(self):
+        requests: list[httpx.Request] = []
+        with APIClient(BASE_URL, transport=httpx.MockTransport(catalog_handler(requests))) as api:
+            result = ProductClient(api).get_products_by_ids([3, 60, 3, 120, 999], concurrency=4)
+
+        assert sorted(result.items) == [3, 60, 120], "Existing products should be found"
+        assert result[60].title == "Product 60", "Items should be parsed into models"
+        assert list(result.errors) == [999], "Missing product should be reported, not raised"
+        assert isinstance(result.errors[999], httpx.HTTPStatusError), "Error should be the original exception"
+        assert len(requests) == 4, "Duplicate IDs should be requested once"
+
+    @allure.title("Dense user IDs are read with covering pages")
+    def test_dense_users(self):
+        requests: list[httpx.Request] = []
+
+        async def scenario():
+            async with AsyncAPIClient(BASE_URL, transport=httpx.MockTransport(catalog_handler(requests))) as api:
+                return await AsyncUserClient(api).get_users_by_ids(range(1, 151))
+
+        result = asyncio.run(scenario())
+
+        assert sorted(result.items) == list(range(1, 151)), "Every user should be found"
+        assert result.ok, "No errors expected"
+        assert [request.url.params["limit"] for request in requests] == ["100", "50"], "Two covering pages should be requested"
+
+    @allure.title("IDs missing from a covering page fall back to single requests")
+    def test_page_fallback(self):
+        requests: list[httpx.Request] = []
+        with APIClient(BASE_URL, transport=httpx.MockTransport(catalog_handler(requests))) as api:
+            result = ProductClient(api).get_products_by_ids(range(190, 200))
+
+        assert sorted(result.items) == list(range(190, 195)), "Products on the page should be found"
+        assert sorted(result.errors) == list(range(195, 200)), "IDs past the end should be reported as errors"
@@ -0,0 +1,81 @@
+import allure
+
+from base.api.api_client import APIClient
+from base.api.cassette import CassetteTransport
+from benchmarks.__main__ import main
+from benchmarks.harness import Case, Config, compare, load_results, run_cases, save_results
+from benchmarks.payloads import Payloads
+from dummyjson.clients.product_client import ProductClient
+from dummyjson.clients.user_client import UserClient
+from dummyjson.fake import FakeDummyJSON
+
+BASE_URL = "https://dummyjson.test"
+QUICK = Config(sizes=(1,), repeat=3, min_time=0.001)
+
+
+def result(median: float, spread: float = 0.0, unit: str = "s") -> dict:
+    return {"unit": unit, "median": median, "min": median - spread, "max": median + spread}
+
+
+@allure.feature("Client Layer")
+@allure.story("Benchmarks")
+class TestBenchmarks:
+    @allure.title("Cases are measured, filtered and stored as JSON")
+    def test_run_and_store(self, tmp_path):
+        cases = [
+            Case("demo/sum", lambda: lambda: sum(range(100))),
+            Case("demo/size", lambda: lambda: 2048, unit="bytes"),
+            Case("other/skipped", lambda: lambda: None),
+        ]
+
+        results = run_cases(cases, QUICK, only="^demo/")
+        save_results(tmp_path / "bench.json", results, QUICK)
+
+        assert list(results) == ["demo/sum", "demo/size"], "Only matching cases should run, in order"
+        assert len(results["demo/sum"]["samples"]) == 3, "Each timed case should be sampled repeat times"
+        assert 0 < results["demo/sum"]["min"] <= results["demo/sum"]["median"], "Timings should be seconds per call"
+        assert results["demo/size"]["median"] == 2048, "Value cases should report what they return"
+        assert load_results(tmp_path / "bench.json") == results, "Results should round-trip through the file"
+
+    @allure.title("Only clear changes beyond the threshold are flagged")
+    def test_compare(self):
+        baseline = {"fast": result(1.0, 0.05), "noisy": result(1.0, 0.5), "memory": result(100, unit="bytes"), "gone": result(1.0)}
+        current = {"fast": result(1.3, 0.05), "noisy": result(1.3, 0.5), "memory": result(50, unit="bytes"), "added": result(1.0)}
+
+        statuses = {item.name: item.status for item in compare(current, baseline, threshold=0.1)}
+
+        assert statuses == {
+            "fast": "regression",
+            "noisy": "unchanged",
+            "memory": "improvement",
+            "gone": "missing",
+            "added": "new",
+        }, "Overlapping samples should not count as a change"
+        assert [item.name for item in compare({"fast": current["fast"]}, baseline, only="^fast$")] == ["fast"], (
+            "Filtered out cases are not missing"
+        )
+
+    @allure.title("Payloads grow from records of a cassette")
+    def test_recorded_payloads(self, tmp_path):
+        path = tmp_path / "api.json.gz"
+        with APIClient(BASE_URL, retries=0, transport=CassetteTransport(path, mode="record", transport=FakeDummyJSON().transport())) as api:
+            ProductClient(api).get_all_products(limit=3)
+            UserClient(api).get_user_by_id(1)
+
+        payloads = Payloads(path)
+        products = payloads.products(7)["products"]
+
+        assert [product["id"] for product in products] == list(range(1, 8)), "Grown records should get fresh ids"
+        assert {product["title"] for product in products} == {product["title"] for product in products[:3]}, "Recorded records repeat"
+        assert payloads.users(2)["users"][1]["username"] == "emilys", "A single recorded user should be reused"
+
+    @allure.title("Comparing with a slower baseline passes, with a faster one fails")
+    def test_cli_exit_status(self, tmp_path, capsys):
+        current = {"client/request": {**result(2.0), "params": {}, "iqr": 0.0, "number": 1, "samples": [2.0]}}
+        save_results(tmp_path / "current.json", current, QUICK)
+        save_results(tmp_path / "slower.json", {"client/request": {**current["client/request"], **result(3.0)}}, QUICK)
+        save_results(tmp_path / "faster.json", {"client/request": {**current["client/request"], **result(1.0)}}, QUICK)
+
+        assert main(["compare", str(tmp_path / "current.json"), str(tmp_path / "slower.json")]) == 0, "Improvement should pass"
+        assert main(["compare", str(tmp_path / "current.json"), str(tmp_path / "faster.json")]) == 1, "Regression should fail"
+        assert "1 regression(s)" in capsys.readouterr().out, "Regressions should be listed"
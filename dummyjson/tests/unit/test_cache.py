@@ -0,0 +1,104 @@
+import allure
+import httpx
+
+from base.api.api_client import APIClient
+from base.api.cache import ResponseCache
+from dummyjson.clients.product_client import ProductClient
+from dummyjson.tests.unit.factories import make_product
+
+BASE_URL = "https://dummyjson.test"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def product_backend(calls: list[httpx.Request], etag: str | None = None):
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if etag and request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304)
+        if request.method == "PUT":
+            return httpx.Response(200, json={**make_product(1), "title": "Updated"})
+        if request.url.path == "/products/categories":
+            return httpx.Response(200, json=["beauty", "fragrances"])
+        product_id = int(request.url.path.rsplit("/", 1)[1])
+        return httpx.Response(200, json=make_product(product_id), headers={"ETag": etag} if etag else {})
+
+    return httpx.MockTransport(handler)
+
+
+@allure.feature("Client Layer")
+@allure.story("Response Cache")
+class TestResponseCache:
+    @allure.title("Repeated reads are served from the cache")
+    def test_repeated_reads_hit_cache(self):
+        calls: list[httpx.Request] = []
+        cache = ResponseCache(ttl=60)
+
+        with APIClient(BASE_URL, cache=cache, transport=product_backend(calls)) as api:
+            products = ProductClient(api)
+            first = products.get_product_by_id(1)
+            second = products.get_product_by_id(1)
+            products.get_all_categories()
+            products.get_all_categories()
+
+        assert first == second, "Cached product should equal the original"
+        assert len(calls) == 2, "Only the first read of each URL should reach the backend"
+        assert (cache.stats.hits, cache.stats.misses) == (2, 2), "Hit/miss counters should be tracked"
+
+    @allure.title("Expired entries are revalidated with If-None-Match")
+    def test_etag_revalidation(self):
+        calls: list[httpx.Request] = []
+        clock = FakeClock()
+        cache = ResponseCache(ttl=10, clock=clock)
+
+        with APIClient(BASE_URL, cache=cache, transport=product_backend(calls, etag='"v1"')) as api:
+            api.get("/products/1")
+            clock.now += 11
+            response = api.get("/products/1")
+
+        assert calls[1].headers["If-None-Match"] == '"v1"', "Stale entry should be revalidated"
+        assert response.status_code == 200, "304 should be turned into the cached 200 response"
+        assert response.json()["id"] == 1, "Cached body should be returned"
+        assert cache.stats.revalidated == 1, "Revalidation should be counted"
+
+    @allure.title("Mutating calls invalidate cached entries of the same resource")
+    def test_mutation_invalidates(self):
+        calls: list[httpx.Request] = []
+        cache = ResponseCache(ttl=60)
+
+        with APIClient(BASE_URL, cache=cache, transport=product_backend(calls)) as api:
+            products = ProductClient(api)
+            products.get_product_by_id(1)
+            products.update_product(1, {"title": "Updated"})
+            products.get_product_by_id(1)
+
+        assert len(calls) == 3, "Read after update should go to the backend again"
+        assert cache.stats.invalidations == 1, "Cached product entry should be invalidated"
+
+    @allure.title("Least recently used entries are evicted beyond max_entries")
+    def test_lru_eviction(self):
+        calls: list[httpx.Request] = []
+        cache = ResponseCache(ttl=60, max_entries=2)
+
+        with APIClient(BASE_URL, cache=cache, transport=product_backend(calls)) as api:
+            for product_id in [1, 2, 1, 3, 1, 2]:
+                api.get(f"/products/{product_id}")
+
+        assert [int(call.url.path.rsplit("/", 1)[1]) for call in calls] == [1, 2, 3, 2], "Entry 2 should be evicted as LRU"
+        assert cache.stats.evictions == 2, "Evictions should be counted"
+
+    @allure.title("Authorization header is part of the cache key")
+    def test_vary_on_authorization(self):
+        calls: list[httpx.Request] = []
+
+        with APIClient(BASE_URL, cache=ResponseCache(), transport=product_backend(calls)) as api:
+            api.get("/products/1", headers={"Authorization": "Bearer a"})
+            api.get("/products/1", headers={"Authorization": "Bearer b"})
+
+        assert len(calls) == 2, "Different credentials should not share cache entries"
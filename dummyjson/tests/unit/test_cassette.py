@@ -0,0 +1,80 @@
+import asyncio
+import time
+
+import allure
+import httpx
+import pytest
+
+from base.api.api_client import APIClient
+from base.api.async_api_client import AsyncAPIClient
+from base.api.cassette import Cassette, CassetteMissError, CassetteTransport, Interaction
+from dummyjson.clients.auth_client import AuthClient
+from dummyjson.clients.product_client import ProductClient
+from dummyjson.fake import FakeDummyJSON
+
+BASE_URL = "https://dummyjson.test"
+
+
+def record(path, backend: FakeDummyJSON) -> None:
+    with APIClient(BASE_URL, retries=0, transport=CassetteTransport(path, mode="record", transport=backend.transport())) as api:
+        products = ProductClient(api)
+        products.get_all_products(limit=5, skip=10)
+        products.add_product({"title": "Lamp", "price": 10, "category": "furniture"})
+        AuthClient(api).login("emilys", "emilyspass")
+        AuthClient(api).login("emilys", "emilyspass")
+
+
+@allure.feature("Client Layer")
+@allure.story("Cassettes")
+class TestCassette:
+    @allure.title("Recorded traffic is replayed without touching the backend")
+    def test_record_then_replay(self, tmp_path):
+        path = tmp_path / "api.json.gz"
+        backend = FakeDummyJSON()
+        record(path, backend)
+        recorded_calls = sum(backend.calls.values())
+
+        with APIClient(BASE_URL, retries=0, transport=CassetteTransport(path, transport=backend.transport())) as api:
+            page = ProductClient(api).get_all_products(skip=10, limit=5)
+            added = ProductClient(api).add_product({"category": "furniture", "price": 10, "title": "Lamp"})
+            first, second = AuthClient(api).login("emilys", "emilyspass"), AuthClient(api).login("emilys", "emilyspass")
+
+        assert [product.id for product in page.products] == [11, 12, 13, 14, 15], "Query order should not matter"
+        assert added.title == "Lamp", "JSON bodies should match regardless of key order"
+        assert first.accessToken != second.accessToken, "Repeated requests should replay in recording order"
+        assert sum(backend.calls.values()) == recorded_calls, "Replay should not reach the backend"
+        assert len(Cassette(path)) == 4, "Cassette should hold every recorded pair"
+
+    @allure.title("Unrecorded requests fail in replay mode and are recorded in auto mode")
+    def test_miss(self, tmp_path):
+        path = tmp_path / "api.json.gz"
+        backend = FakeDummyJSON()
+        record(path, backend)
+
+        with APIClient(BASE_URL, retries=0, transport=CassetteTransport(path)) as api, pytest.raises(CassetteMissError):
+            api.get("/products", params={"limit": 6, "skip": 10})
+        with APIClient(BASE_URL, retries=0, transport=CassetteTransport(path, mode="auto", transport=backend.transport())) as api:
+            api.get("/products", params={"limit": 5, "skip": 10})
+            api.get("/products/3")
+
+        assert backend.calls["GET /products/3"] == 1, "Auto mode should fetch what is not recorded"
+        assert backend.calls["GET /products"] == 1, "Auto mode should replay what is recorded"
+        assert len(Cassette(path)) == 5, "Auto mode should append new pairs to the cassette"
+
+    @allure.title("Replay can reproduce recorded latencies, also for async clients")
+    def test_async_latency(self, tmp_path):
+        path = tmp_path / "api.json.gz"
+        cassette = Cassette(path)
+        request = httpx.Request("GET", f"{BASE_URL}/products/1")
+        cassette.record(Interaction.capture(request, httpx.Response(200, json={"id": 1}), 0.2))
+        cassette.save()
+
+        async def fetch(simulate: bool) -> float:
+            transport = CassetteTransport(path, simulate_latency=simulate, latency_scale=0.5)
+            async with AsyncAPIClient(BASE_URL, retries=0, transport=transport) as api:
+                started = time.perf_counter()
+                assert (await api.get("/products/1")).json() == {"id": 1}
+                return time.perf_counter() - started
+
+        assert asyncio.run(fetch(True)) >= 0.1, "Recorded latency should be scaled and simulated"
+        assert asyncio.run(fetch(False)) < 0.1, "Replay should be immediate by default"
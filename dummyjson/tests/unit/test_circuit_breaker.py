@@ -0,0 +1,102 @@
+import allure
+import httpx
+import pytest
+
+from base.api.api_client import APIClient
+from base.api.circuit_breaker import CircuitBreaker, CircuitEvent, CircuitOpenError, CircuitState
+from base.api.retry import RetryPolicy
+
+BASE_URL = "https://dummyjson.test"
+HOST = "dummyjson.test"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def backend(statuses: list[int]) -> tuple[httpx.MockTransport, list[httpx.Request]]:
+    calls: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        status = statuses.pop(0) if statuses else 200
+        if status == 0:
+            raise httpx.ConnectError("connection refused")
+        return httpx.Response(status, json={})
+
+    return httpx.MockTransport(handler), calls
+
+
+@allure.feature("Client Layer")
+@allure.story("Circuit Breaker")
+class TestCircuitBreakerStates:
+    @allure.title("Circuit opens after consecutive failures and rejects calls immediately")
+    def test_opens_and_fails_fast(self):
+        breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=30, clock=FakeClock())
+        transport, calls = backend([0, 0, 0])
+
+        with APIClient(BASE_URL, retry_policy=RetryPolicy(retries=5, backoff=0), circuit_breaker=breaker, transport=transport) as api:
+            with pytest.raises(CircuitOpenError):
+                api.get("/products/1")
+            with pytest.raises(CircuitOpenError):
+                api.get("/products/2")
+
+        assert len(calls) == 3, "Retries should stop as soon as the circuit opens"
+        assert breaker.state(HOST) is CircuitState.OPEN, "Circuit should be open"
+        assert breaker.stats()[HOST].rejected == 2, "Both calls after opening should be rejected"
+
+    @allure.title("Half-open circuit lets a single probe through and closes on success")
+    def test_half_open_probe(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10, clock=clock)
+        events: list[CircuitEvent] = []
+        breaker.add_listener(events.append)
+
+        breaker.record_failure(HOST)
+        clock.now = 10
+        breaker.before_request(HOST)
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request(HOST)
+        breaker.record_success(HOST)
+
+        assert [event.state for event in events] == [CircuitState.OPEN, CircuitState.HALF_OPEN, CircuitState.CLOSED]
+        breaker.before_request(HOST)
+
+    @allure.title("Failed probe re-opens the circuit")
+    def test_failed_probe_reopens(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=5, clock=clock)
+        breaker.record_failure(HOST)
+        clock.now = 5
+        breaker.before_request(HOST)
+
+        breaker.record_failure(HOST)
+
+        assert breaker.state(HOST) is CircuitState.OPEN, "Probe failure should re-open the circuit"
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request(HOST)
+
+    @allure.title("Error rate over the window opens the circuit")
+    def test_error_rate_threshold(self):
+        breaker = CircuitBreaker(failure_threshold=100, error_rate_threshold=0.5, window=10, min_calls=4, clock=FakeClock())
+
+        for failed in [False, True, False, True]:
+            breaker.record(HOST, httpx.ConnectError("down") if failed else None)
+
+        assert breaker.state(HOST) is CircuitState.OPEN, "50% errors over 4 calls should open the circuit"
+
+    @allure.title("Client errors do not count as backend failures")
+    def test_client_errors_ignored(self):
+        breaker = CircuitBreaker(failure_threshold=1, clock=FakeClock())
+        transport, _ = backend([404, 404])
+
+        with APIClient(BASE_URL, circuit_breaker=breaker, transport=transport) as api:
+            for _ in range(2):
+                with pytest.raises(httpx.HTTPStatusError):
+                    api.get("/products/0")
+
+        assert breaker.state(HOST) is CircuitState.CLOSED, "404 responses should keep the circuit closed"
@@ -0,0 +1,48 @@
+import json
+
+import allure
+import httpx
+import pytest
+
+from base.api import decoders
+from base.api.api_client import APIClient
+from base.api.decoders import available_decoders, get_decoder
+from dummyjson.clients.user_client import UserClient
+from dummyjson.models.user import UsersResponse
+from dummyjson.tests.unit.factories import make_page, make_user
+
+BASE_URL = "https://dummyjson.test"
+USERS = [make_user(i) for i in range(1, 11)]
+
+
+@allure.feature("Client Layer")
+@allure.story("Pluggable Decoders")
+class TestDecoders:
+    @allure.title("Every available decoder produces the same models")
+    @pytest.mark.parametrize("name", available_decoders())
+    def test_decoders_agree(self, name: str):
+        content = json.dumps(make_page("users", USERS, 0, 0)).encode()
+
+        decoded = get_decoder(name).decode(content, UsersResponse)
+
+        assert decoded == UsersResponse.model_validate_json(content), f"{name} should match pydantic validation"
+        assert get_decoder(name).loads(content)["total"] == len(USERS), f"{name} should decode plain JSON"
+
+    @allure.title("A missing optional backend falls back to the stdlib decoder")
+    def test_missing_backend_fallback(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(decoders, "msgspec", None)
+
+        assert get_decoder("msgspec").name == "stdlib", "Stdlib decoder should be used"
+        with pytest.raises(ValueError):
+            get_decoder("simdjson")
+
+    @allure.title("Clients decode list pages with the configured decoder")
+    def test_client_decoder(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=make_page("users", USERS, int(request.url.params["limit"]), 0))
+
+        with APIClient(BASE_URL, decoder="stdlib", transport=httpx.MockTransport(handler)) as api:
+            response = UserClient(api).get_all_users(limit=0)
+
+        assert api.decoder.name == "stdlib", "Decoder should be picked by name"
+        assert [user.id for user in response.users] == list(range(1, 11)), "Users should be decoded"
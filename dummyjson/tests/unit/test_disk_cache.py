@@ -0,0 +1,76 @@
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import allure
+import httpx
+
+from base.api.api_client import APIClient
+from base.api.cache import CacheEntry, ResponseCache
+from base.api.disk_cache import SQLiteCacheStore
+from dummyjson.clients.product_client import ProductClient
+from dummyjson.tests.unit.factories import make_product
+
+BASE_URL = "https://dummyjson.test"
+
+
+def make_entry(key: str, size: int = 100, path: str = "/products/1") -> CacheEntry:
+    return CacheEntry(
+        key=key, path=path, status_code=200, headers=(("content-type", "application/json"),), content=b"x" * size, stored_at=0.0
+    )
+
+
+def write_entries(path: str, worker: int) -> int:
+    store = SQLiteCacheStore(path)
+    for index in range(50):
+        store.set(make_entry(f"{worker}-{index}"))
+    return len(store)
+
+
+@allure.feature("Client Layer")
+@allure.story("Disk Cache")
+class TestSQLiteCacheStore:
+    @allure.title("Responses cached by one session are reused by the next one")
+    def test_persists_between_sessions(self, tmp_path: Path):
+        calls: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(200, json=make_product(1))
+
+        for _ in range(2):
+            store = SQLiteCacheStore(tmp_path / "cache.sqlite3")
+            with APIClient(BASE_URL, cache=ResponseCache(store=store), transport=httpx.MockTransport(handler)) as api:
+                product = ProductClient(api).get_product_by_id(1)
+            store.close()
+
+        assert product.id == 1, "Product should be read back from disk"
+        assert len(calls) == 1, "Second session should not hit the backend"
+
+    @allure.title("Bodies are compressed and the store stays under max_bytes")
+    def test_max_size_eviction(self, tmp_path: Path):
+        store = SQLiteCacheStore(tmp_path / "cache.sqlite3", max_bytes=200, compression_level=0)
+
+        evicted = [store.set(make_entry(f"key-{index}", size=80)) for index in range(5)]
+
+        assert sum(evicted) == 3, "Oldest entries should be evicted"
+        assert store.size_bytes() <= 200, "Stored size should respect the limit"
+        assert store.get("key-0") is None, "Least recently used entry should be gone"
+        assert store.get("key-4").content == b"x" * 80, "Newest entry should round-trip"
+
+    @allure.title("Prefix invalidation only removes matching paths")
+    def test_delete_prefix(self, tmp_path: Path):
+        store = SQLiteCacheStore(tmp_path / "cache.sqlite3")
+        store.set(make_entry("p", path="/products/1"))
+        store.set(make_entry("u", path="/users/1"))
+
+        assert store.delete_prefix("/products") == 1, "One product entry should be deleted"
+        assert len(store) == 1, "User entry should stay"
+
+    @allure.title("Several processes can write to the same cache file")
+    def test_concurrent_processes(self, tmp_path: Path):
+        path = str(tmp_path / "cache.sqlite3")
+
+        with ProcessPoolExecutor(max_workers=4) as executor:
+            list(executor.map(write_entries, [path] * 4, range(4)))
+
+        assert len(SQLiteCacheStore(path)) == 200, "Entries from all workers should be stored"
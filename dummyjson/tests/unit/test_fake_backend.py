@@ -0,0 +1,120 @@
+import asyncio
+
+import allure
+import httpx
+import pytest
+
+from base.api.api_client import APIClient
+from base.api.async_api_client import AsyncAPIClient
+from dummyjson.clients.auth_client import AuthClient
+from dummyjson.clients.product_client import ProductClient
+from dummyjson.clients.user_client import AsyncUserClient, UserClient
+from dummyjson.fake import FakeDummyJSON
+
+BASE_URL = "https://dummyjson.test"
+
+
+@pytest.fixture
+def backend() -> FakeDummyJSON:
+    return FakeDummyJSON()
+
+
+@pytest.fixture
+def api(backend: FakeDummyJSON) -> APIClient:
+    with APIClient(BASE_URL, retries=0, transport=backend.transport()) as client:
+        yield client
+
+
+@allure.feature("Fake Backend")
+@allure.story("Catalog Routes")
+class TestFakeCatalog:
+    @allure.title("limit, skip and limit=0 follow DummyJSON's pagination")
+    def test_pagination(self, api: APIClient, backend: FakeDummyJSON):
+        products = ProductClient(api)
+
+        default = products.get_all_products()
+        page = products.get_all_products(limit=10, skip=110)
+        everything = products.get_all_products(limit=0)
+
+        assert (default.limit, default.skip, len(default.products)) == (30, 0, 30), "Default page should hold 30 products"
+        assert [product.id for product in page.products] == list(range(111, 121)), "Page should start after skip"
+        assert len(everything.products) == everything.total == len(backend.products), "limit=0 should return everything"
+
+    @allure.title("select= returns id plus the selected fields")
+    def test_select(self, api: APIClient):
+        response = api.json(api.get("/users", params={"limit": 2, "select": "email,username"}))
+
+        assert [sorted(user) for user in response["users"]] == [["email", "id", "username"]] * 2, "Only selected fields should be returned"
+
+    @allure.title("Search, category and filter routes narrow the results")
+    def test_search_category_filter(self, api: APIClient):
+        products, users = ProductClient(api), UserClient(api)
+
+        phones = products.search_products("iphone", limit=0)
+        beauty = products.get_products_by_category("beauty", limit=0)
+        brown = users.filter_users("hair.color", "Brown", limit=0)
+
+        assert phones.products and all("iphone" in product.title.lower() for product in phones.products), "Search should match titles"
+        assert beauty.products and {product.category for product in beauty.products} == {"beauty"}, "Category should filter products"
+        assert brown.users and {user.hair.color for user in brown.users} == {"Brown"}, "Filter should match the dotted key"
+        assert "beauty" in products.get_all_categories(), "Categories should list product categories"
+
+    @allure.title("Unknown ids and routes return 404 JSON errors")
+    def test_not_found(self, api: APIClient):
+        with pytest.raises(httpx.HTTPStatusError) as missing:
+            api.get("/products/9999")
+        with pytest.raises(httpx.HTTPStatusError) as unknown:
+            api.get("/carts")
+
+        assert missing.value.response.json() == {"message": "Product with id '9999' not found"}, "Missing product should be reported"
+        assert unknown.value.response.status_code == 404, "Unknown route should be a 404"
+
+
+@allure.feature("Fake Backend")
+@allure.story("Auth Routes")
+class TestFakeAuth:
+    @allure.title("Login, current user and refresh issue distinct working tokens")
+    def test_token_flow(self, api: APIClient):
+        auth = AuthClient(api)
+
+        login = auth.login("emilys", "emilyspass")
+        me = auth.get_current_user(login.accessToken)
+        refreshed = auth.refresh_token(login.refreshToken)
+
+        assert me.email == "emily.johnson@x.dummyjson.com", "Access token should identify the user"
+        assert refreshed.accessToken != login.accessToken, "Refresh should issue a new access token"
+        assert auth.get_current_user(refreshed.accessToken).id == me.id, "Refreshed token should be accepted"
+
+    @allure.title("Expired and invalid tokens are rejected")
+    def test_expired_token(self):
+        now = [1_000_000.0]
+        backend = FakeDummyJSON(clock=lambda: now[0])
+        with APIClient(BASE_URL, retries=0, transport=backend.transport()) as api:
+            auth = AuthClient(api)
+            login = auth.login("emilys", "emilyspass", expires_in_mins=1)
+            now[0] += 61
+
+            with pytest.raises(httpx.HTTPStatusError) as expired:
+                auth.get_current_user(login.accessToken)
+            with pytest.raises(httpx.HTTPStatusError) as wrong_password:
+                auth.login("emilys", "wrong")
+
+        assert expired.value.response.status_code == 401, "Expired access token should be rejected"
+        assert wrong_password.value.response.status_code == 400, "Wrong password should be rejected"
+
+
+@allure.feature("Fake Backend")
+@allure.story("ASGI App")
+class TestFakeASGI:
+    @allure.title("The backend serves async clients as an ASGI app")
+    def test_asgi_transport(self, backend: FakeDummyJSON):
+        async def scenario():
+            async with AsyncAPIClient(BASE_URL, retries=0, transport=httpx.ASGITransport(app=backend)) as api:
+                users = AsyncUserClient(api)
+                return await asyncio.gather(users.get_user_by_id(1), users.search_users("Smith", limit=0))
+
+        user, smiths = asyncio.run(scenario())
+
+        assert user.username == "emilys", "User 1 should be the documented test account"
+        assert smiths.users and smiths.total == len(smiths.users), "Search should return all matches"
+        assert backend.calls["GET /users/1"] == 1, "Requests should be counted per route"
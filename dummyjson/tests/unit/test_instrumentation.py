@@ -0,0 +1,79 @@
+import asyncio
+
+import allure
+import httpx
+import pytest
+
+from base.api.api_client import APIClient
+from base.api.async_api_client import AsyncAPIClient
+from base.api.instrumentation import MetricsRegistry, RequestEvent, RequestHooks, endpoint_template
+from dummyjson.clients.product_client import AsyncProductClient, ProductClient
+
+BASE_URL = "https://dummyjson.test"
+
+
+@allure.feature("Client Layer")
+@allure.story("Instrumentation")
+class TestInstrumentation:
+    @allure.title("Paths are labelled by endpoint template")
+    def test_endpoint_template(self):
+        hooks = RequestHooks(templates=["/products/category/{slug}"])
+
+        assert endpoint_template("/products/12") == "/products/{id}", "Numeric ids should be folded"
+        assert endpoint_template("/users/5/carts") == "/users/{id}/carts", "Inner ids should be folded"
+        assert hooks.endpoint(httpx.Request("GET", f"{BASE_URL}/products/category/beauty")) == "/products/category/{slug}"
+
+    @allure.title("Hooks report connect, time-to-first-byte, body and parse phases of real requests")
+    def test_phases_over_http(self, fake_server: str):
+        hooks = RequestHooks()
+        events: list[tuple[str, RequestEvent]] = []
+        for name in ("request", "response", "parse"):
+            hooks.on(name, lambda event, name=name: events.append((name, event)))
+
+        with APIClient(fake_server, retries=0, enable_logging=False, hooks=hooks) as api:
+            ProductClient(api).get_product_by_id(7)
+            with api.trusted():
+                ProductClient(api).get_product_by_id(8)
+
+        names = [name for name, _ in events]
+        assert names == ["request", "response", "parse"] * 2, "Each call should emit request, response and parse"
+        response = events[1][1]
+        assert response.endpoint == "/products/{id}" and response.status == 200, "Response should be labelled by template"
+        assert {"connect", "ttfb", "body", "total"} <= response.phases.keys(), "Transport phases should be timed"
+        assert set(events[2][1].phases) == {"decode_validate"}, "Pydantic decodes and validates in one step"
+        assert set(events[5][1].phases) == {"decode_validate"}, "Trusted calls should parse bodies in the same single pass"
+        assert events[5][1].model == "Product", "Parse events should name the model"
+
+    @allure.title("Retries and final errors reach the hooks and the metrics registry")
+    def test_retry_metrics(self):
+        statuses = iter([503, 503, 404])
+        transport = httpx.MockTransport(lambda request: httpx.Response(next(statuses), json={}))
+        registry = MetricsRegistry()
+
+        hooks = registry.attach(RequestHooks())
+        with (
+            APIClient(BASE_URL, retries=3, retry_interval=0, hooks=hooks, transport=transport) as api,
+            pytest.raises(httpx.HTTPStatusError),
+        ):
+            api.get("/products/1")
+
+        assert registry.counter("api_retries_total", method="GET", endpoint="/products/{id}", reason="HTTP 503") == 2
+        assert registry.counter("api_errors_total", method="GET", endpoint="/products/{id}", reason="HTTP 404") == 1
+        assert registry.counter("api_requests_total", method="GET", endpoint="/products/{id}", status=404) == 1
+
+    @allure.title("Async clients feed the registry, which exports Prometheus text")
+    def test_async_prometheus_export(self, fake_server: str):
+        registry = MetricsRegistry()
+
+        async def scenario():
+            async with AsyncAPIClient(fake_server, retries=0, enable_logging=False, hooks=registry.attach(RequestHooks())) as api:
+                products = AsyncProductClient(api)
+                await asyncio.gather(*(products.get_product_by_id(product_id) for product_id in range(1, 4)))
+
+        asyncio.run(scenario())
+        text = registry.to_prometheus()
+
+        assert 'api_requests_total{endpoint="/products/{id}",method="GET",status="200"} 3' in text, "Requests should be counted"
+        assert "# TYPE api_request_duration_seconds histogram" in text, "Phase durations should be histograms"
+        assert 'api_request_duration_seconds_count{endpoint="/products/{id}",method="GET",phase="ttfb"} 3' in text
+        assert 'le="+Inf"' in text and text.endswith("\n"), "Export should follow the text format"
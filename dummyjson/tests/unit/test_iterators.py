@@ -0,0 +1,95 @@
+import asyncio
+import threading
+from contextlib import aclosing
+
+import allure
+import httpx
+
+from base.api.api_client import APIClient
+from base.api.async_api_client import AsyncAPIClient
+from base.api.pagination import aiter_pages
+from dummyjson.clients.product_client import ProductClient
+from dummyjson.clients.user_client import AsyncUserClient
+from dummyjson.tests.unit.factories import make_page, make_product, make_user
+
+BASE_URL = "https://dummyjson.test"
+PRODUCTS = [make_product(i) for i in range(1, 26)]
+USERS = [make_user(i) for i in range(1, 12)]
+
+
+@allure.feature("Client Layer")
+@allure.story("Streaming Iterators")
+class TestIterProducts:
+    @allure.title("iter_products yields every product once, in order")
+    def test_iter_products_yields_all(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            limit, skip = int(request.url.params["limit"]), int(request.url.params["skip"])
+            return httpx.Response(200, json=make_page("products", PRODUCTS, limit, skip))
+
+        with APIClient(BASE_URL, transport=httpx.MockTransport(handler)) as api:
+            ids = [product.id for product in ProductClient(api).iter_products(page_size=10)]
+
+        assert ids == list(range(1, 26)), "All products should be yielded in order"
+
+    @allure.title("First product is yielded while the next page is still loading")
+    def test_first_item_before_next_page(self):
+        release = threading.Event()
+        requested_skips: list[int] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            skip = int(request.url.params["skip"])
+            requested_skips.append(skip)
+            if skip > 0:
+                release.wait(timeout=5)
+            return httpx.Response(200, json=make_page("products", PRODUCTS, 10, skip))
+
+        with APIClient(BASE_URL, transport=httpx.MockTransport(handler)) as api:
+            products = ProductClient(api).iter_products(page_size=10)
+            first = next(products)
+            products.close()
+            release.set()
+
+        assert first.id == 1, "First product should be available before the second page returns"
+        assert 20 not in requested_skips, "No page beyond the prefetched one should be requested after close"
+
+
+@allure.feature("Client Layer")
+@allure.story("Streaming Iterators")
+class TestAsyncIterUsers:
+    @allure.title("Async iter_users yields every user")
+    def test_async_iter_users(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            limit, skip = int(request.url.params["limit"]), int(request.url.params["skip"])
+            return httpx.Response(200, json=make_page("users", USERS, limit, skip))
+
+        async def scenario():
+            async with AsyncAPIClient(BASE_URL, transport=httpx.MockTransport(handler)) as api:
+                return [user.id async for user in AsyncUserClient(api).iter_users(page_size=4)]
+
+        assert asyncio.run(scenario()) == list(range(1, 12)), "All users should be yielded in order"
+
+    @allure.title("Early exit cancels the in-flight prefetch task")
+    def test_early_exit_cancels_prefetch(self):
+        async def scenario():
+            state = {"cancelled": False}
+            started = asyncio.Event()
+
+            async def fetch_page(limit: int, skip: int):
+                if skip == 0:
+                    return make_page("users", USERS, limit, skip)
+                started.set()
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    state["cancelled"] = True
+                    raise
+                return make_page("users", USERS, limit, skip)
+
+            async with aclosing(aiter_pages(fetch_page, "users", 4)) as pages:
+                async for _ in pages:
+                    await started.wait()
+                    break
+            await asyncio.sleep(0)
+            return state["cancelled"]
+
+        assert asyncio.run(scenario()), "Pending prefetch should be cancelled when iteration stops"
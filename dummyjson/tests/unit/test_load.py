@@ -0,0 +1,80 @@
+import asyncio
+import json
+
+import allure
+import httpx
+import pytest
+
+from base.load.histogram import LatencyHistogram
+from base.load.runner import LoadProfile, LoadRunner, Scenario, arrival_time
+from dummyjson.fake import FakeDummyJSON
+from dummyjson.load import main, parse_mix, run_load
+
+
+@allure.feature("Load Testing")
+@allure.story("Latency Histogram")
+class TestLatencyHistogram:
+    @allure.title("Percentiles stay within the relative error of the exact values")
+    def test_percentiles(self):
+        histogram, other = LatencyHistogram(relative_error=0.01), LatencyHistogram(relative_error=0.01)
+        for value in range(1, 5001):
+            histogram.record(value / 1000)
+        for value in range(5001, 10001):
+            other.record(value / 1000)
+        histogram.merge(other)
+
+        for percentile, exact in ((50, 5.0), (90, 9.0), (99, 9.9), (99.9, 9.99)):
+            assert exact <= histogram.percentile(percentile) <= exact * 1.01, f"p{percentile} should be within 1%"
+        assert histogram.summary()["max"] == 10.0, "Maximum should be exact"
+        assert histogram.count == 10000, "Merged histogram should hold both counts"
+
+
+@allure.feature("Load Testing")
+@allure.story("Load Runner")
+class TestLoadRunner:
+    @allure.title("Open loop follows the ramped arrival schedule and drops arrivals beyond the in-flight limit")
+    def test_open_loop(self):
+        async def slow(_):
+            await asyncio.sleep(0.05)
+
+        runner = LoadRunner([Scenario("slow", 1, slow)])
+        report = runner.run_sync(LoadProfile("open", duration=0.5, users=5, rps=200, ramp_up=0.2))
+
+        assert report.total + report.dropped == 80, "0.2s ramp to 200/s then 0.3s at 200/s should plan 80 arrivals"
+        assert report.dropped > 0, "Arrivals beyond 5 in flight should be dropped"
+        assert arrival_time(0, 200, 0.2) == 0.0, "First arrival should start immediately"
+
+    @allure.title("Closed loop respects the rps cap and breaks errors down by type")
+    def test_closed_loop_errors(self):
+        calls = []
+
+        async def flaky(_):
+            calls.append(1)
+            if len(calls) % 2:
+                raise httpx.ConnectTimeout("timeout")
+
+        report = LoadRunner([Scenario("flaky", 1, flaky)]).run_sync(LoadProfile("closed", duration=0.5, users=4, rps=40))
+
+        assert 15 <= report.total <= 21, "Throughput should be capped at 40 scenarios per second"
+        assert report.scenarios["flaky"].errors == {"ConnectTimeout": (report.total + 1) // 2}, "Errors should be counted by type"
+
+    @allure.title("Weighted DummyJSON scenarios run against the fake backend with per-endpoint statistics")
+    def test_against_fake_backend(self):
+        report = asyncio.run(run_load(LoadProfile(duration=0.3, users=4, seed=7), "products=3,login=1", backend=FakeDummyJSON()))
+
+        assert report.errors == 0, "Fake backend should serve every scenario"
+        assert report.scenarios["products"].count > report.scenarios["login"].count, "Weights should shape the mix"
+        assert set(report.endpoints) == {"GET /products/{id}", "POST /auth/login", "GET /auth/me"}, "Paths should map to endpoints"
+        assert report.endpoints["GET /auth/me"].count == report.scenarios["login"].count, "Login scenario should call /auth/me once"
+
+    @allure.title("CLI writes a JSON report and rejects unknown scenarios")
+    def test_cli(self, tmp_path, capsys):
+        path = tmp_path / "report.json"
+
+        status = main(["--fake", "--duration", "0.2", "--users", "2", "--mix", "users=1", "--json", str(path)])
+
+        assert status == 0, "Run without errors should succeed"
+        assert json.loads(path.read_text())["endpoints"]["GET /users/{id}"]["errors"] == 0, "Report should list the endpoint"
+        assert "closed-loop run" in capsys.readouterr().out, "Summary should be printed"
+        with pytest.raises(ValueError):
+            parse_mix("products=1,carts=2")
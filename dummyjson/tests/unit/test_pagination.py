@@ -0,0 +1,74 @@
+import asyncio
+import threading
+
+import allure
+import httpx
+
+from base.api.api_client import APIClient
+from base.api.async_api_client import AsyncAPIClient
+from dummyjson.clients.product_client import AsyncProductClient, ProductClient
+from dummyjson.clients.user_client import UserClient
+from dummyjson.tests.unit.factories import make_page, make_product, make_user
+
+BASE_URL = "https://dummyjson.test"
+PRODUCTS = [make_product(i) for i in range(1, 96)]
+USERS = [make_user(i) for i in range(1, 24)]
+
+
+def paged_handler(requests: list[httpx.Request]):
+    lock = threading.Lock()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        with lock:
+            requests.append(request)
+        limit, skip = int(request.url.params["limit"]), int(request.url.params["skip"])
+        if request.url.path.startswith("/users"):
+            return httpx.Response(200, json=make_page("users", USERS, limit, skip))
+        return httpx.Response(200, json=make_page("products", PRODUCTS, limit, skip))
+
+    return handler
+
+
+@allure.feature("Client Layer")
+@allure.story("Pagination Fan-out")
+class TestFetchAll:
+    @allure.title("fetch_all merges every product page in order")
+    def test_fetch_all_products(self):
+        requests: list[httpx.Request] = []
+        with APIClient(BASE_URL, transport=httpx.MockTransport(paged_handler(requests))) as api:
+            response = ProductClient(api).get_all_products(limit=10, fetch_all=True, concurrency=4)
+
+        assert [p.id for p in response.products] == list(range(1, 96)), "Products should be merged in offset order"
+        assert response.total == len(PRODUCTS), "Total should come from the first page"
+        assert len(requests) == 10, "One request per page of 10 should be made"
+
+    @allure.title("fetch_all starts from skip")
+    def test_fetch_all_users_with_skip(self):
+        with APIClient(BASE_URL, transport=httpx.MockTransport(paged_handler([]))) as api:
+            response = UserClient(api).get_all_users(limit=5, skip=7, fetch_all=True)
+
+        assert [u.id for u in response.users] == list(range(8, 24)), "Users after skip should be returned"
+        assert response.skip == 7, "Skip should be preserved"
+
+    @allure.title("Async fetch_all respects the concurrency cap")
+    def test_async_fetch_all_concurrency_cap(self):
+        in_flight = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            limit, skip = int(request.url.params["limit"]), int(request.url.params["skip"])
+            return httpx.Response(200, json=make_page("products", PRODUCTS, limit, skip))
+
+        async def scenario():
+            async with AsyncAPIClient(BASE_URL, transport=httpx.MockTransport(handler)) as api:
+                return await AsyncProductClient(api).get_all_products(limit=5, fetch_all=True, concurrency=3)
+
+        response = asyncio.run(scenario())
+
+        assert len(response.products) == len(PRODUCTS), "All products should be fetched"
+        assert peak == 3, f"At most 3 pages should be in flight, saw {peak}"
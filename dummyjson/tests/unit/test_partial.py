@@ -0,0 +1,75 @@
+import allure
+import httpx
+import pytest
+
+from base.api.api_client import APIClient
+from base.models.partial import partial_model
+from dummyjson.clients.product_client import ProductClient
+from dummyjson.clients.user_client import UserClient
+from dummyjson.models.product import Product
+from dummyjson.models.user import User
+from dummyjson.tests.unit.factories import make_page, make_product, make_user
+
+BASE_URL = "https://dummyjson.test"
+
+
+def select(item: dict, request: httpx.Request) -> dict:
+    """Project an item the way DummyJSON does for select="""
+    fields = request.url.params.get("select")
+    return {key: value for key, value in item.items() if key == "id" or key in fields.split(",")} if fields else item
+
+
+def projecting_handler(requests: list[httpx.Request]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.path == "/users":
+            users = [select(make_user(i), request) for i in range(1, 6)]
+            return httpx.Response(200, json=make_page("users", users, int(request.url.params["limit"]), 0))
+        return httpx.Response(200, json=select(make_product(int(request.url.path.rsplit("/", 1)[1])), request))
+
+    return handler
+
+
+@allure.feature("Client Layer")
+@allure.story("Field Projection")
+class TestFieldProjection:
+    @allure.title("fields= sends select and returns partial users")
+    def test_list_projection(self):
+        requests: list[httpx.Request] = []
+        with APIClient(BASE_URL, transport=httpx.MockTransport(projecting_handler(requests))) as api:
+            response = UserClient(api).get_all_users(limit=0, fields=["email", "username"])
+
+        user = response.users[0]
+        assert requests[0].url.params["select"] == "email,username", "Fields should be sent as select"
+        assert isinstance(user, User), "Partial users should still be users"
+        assert (user.id, user.email) == (1, "user1@x.dummyjson.com"), "Selected fields should be set"
+        assert user.bank is None, "Fields left out should be empty"
+
+    @allure.title("fields= works for single items")
+    def test_get_by_id_projection(self):
+        with APIClient(BASE_URL, transport=httpx.MockTransport(projecting_handler([]))) as api:
+            product = ProductClient(api).get_product_by_id(3, fields=("title",))
+
+        assert product.title == "Product 3", "Title should be selected"
+        assert product.category is None, "Required fields left out should be optional"
+        assert product.model_fields_set == {"id", "title"}, "Only returned fields should be set"
+
+    @allure.title("Partial models are cached and reject unknown fields")
+    def test_partial_model(self):
+        assert partial_model(Product, ["title"]) is partial_model(Product, ("title",)), "Classes should be reused"
+        assert partial_model(Product, None) is Product, "No fields should mean the full model"
+        with pytest.raises(ValueError):
+            partial_model(User, ["nickname"])
+
+    @allure.title("fields= accepts generators and rejects unknown fields before sending")
+    def test_fields_checked_first(self):
+        requests: list[httpx.Request] = []
+        with APIClient(BASE_URL, transport=httpx.MockTransport(projecting_handler(requests))) as api:
+            response = UserClient(api).get_all_users(limit=0, fields=(name for name in ["email"]))
+            sent = len(requests)
+            with pytest.raises(ValueError):
+                ProductClient(api).get_product_by_id(3, fields=["nickname"])
+
+        assert requests[0].url.params["select"] == "email", "Generator fields should be sent"
+        assert response.users[0].email == "user1@x.dummyjson.com", "Generator fields should be kept in the model"
+        assert len(requests) == sent, "Unknown fields should fail before the request"
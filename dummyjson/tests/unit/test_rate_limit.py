@@ -0,0 +1,88 @@
+import asyncio
+
+import allure
+import httpx
+import pytest
+
+from base.api.api_client import APIClient
+from base.api.async_api_client import AsyncAPIClient
+from base.api.rate_limit import RateLimit, RateLimiter, TokenBucket
+
+BASE_URL = "https://dummyjson.test"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@allure.feature("Client Layer")
+@allure.story("Rate Limiting")
+class TestTokenBucket:
+    @allure.title("Burst is served immediately, further requests are spaced by the rate")
+    def test_burst_then_rate(self):
+        bucket = TokenBucket(RateLimit(rate=10, burst=2), clock=FakeClock())
+
+        delays = [bucket.reserve() for _ in range(4)]
+
+        assert delays == pytest.approx([0, 0, 0.1, 0.2]), "Requests after the burst should wait 1/rate each"
+
+    @allure.title("Tokens refill over time up to the capacity")
+    def test_refill(self):
+        clock = FakeClock()
+        bucket = TokenBucket(RateLimit(rate=5, burst=1), clock=clock)
+        bucket.reserve()
+
+        clock.now = 10
+        assert bucket.reserve() == 0, "Bucket should be refilled after idle time"
+        assert bucket.reserve() == pytest.approx(0.2), "Refill should not exceed capacity"
+
+
+@allure.feature("Client Layer")
+@allure.story("Rate Limiting")
+class TestRateLimiter:
+    @allure.title("Longest prefix rule wins, other paths use the default limit")
+    def test_prefix_rules(self):
+        limiter = RateLimiter(default=RateLimit(100), rules={"/auth/*": RateLimit(1), "/auth/refresh": RateLimit(0.5)})
+
+        assert limiter.match("/auth/login") == "/auth", "/auth/login should match the /auth rule"
+        assert limiter.match("auth/refresh?x=1") == "/auth/refresh", "Most specific rule should win"
+        assert limiter.match("/products/1") is None, "Products should fall back to the default"
+        assert limiter.match("/authors") is None, "Prefix should match whole path segments only"
+
+    @allure.title("Buckets are separate per host and per rule")
+    def test_buckets_per_host(self):
+        limiter = RateLimiter(rules={"/auth": RateLimit(1, burst=1)}, clock=FakeClock())
+
+        assert limiter.reserve("a.test", "/auth/login") == 0, "First request to host a should pass"
+        assert limiter.reserve("b.test", "/auth/login") == 0, "Host b has its own bucket"
+        assert limiter.reserve("a.test", "/auth/me") == 1, "Second auth request to host a should wait"
+        assert limiter.reserve("a.test", "/products") == 0, "Paths without a rule and no default are not limited"
+
+    @allure.title("Limiter shared by sync and async clients spaces their requests")
+    def test_shared_between_clients(self, monkeypatch: pytest.MonkeyPatch):
+        clock = FakeClock()
+        limiter = RateLimiter(default=RateLimit(rate=2, burst=1), clock=clock)
+        waits: list[float] = []
+        monkeypatch.setattr("base.api.api_client.time.sleep", waits.append)
+
+        async def fake_async_sleep(delay: float):
+            waits.append(delay)
+
+        monkeypatch.setattr("base.api.async_api_client.asyncio.sleep", fake_async_sleep)
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, json={}))
+
+        with APIClient(BASE_URL, rate_limiter=limiter, transport=transport) as api:
+            api.get("/products/1")
+            api.get("/products/2")
+
+        async def scenario():
+            async with AsyncAPIClient(BASE_URL, rate_limiter=limiter, transport=transport) as api:
+                await api.get("/products/3")
+
+        asyncio.run(scenario())
+
+        assert waits == pytest.approx([0.5, 1.0]), "Second and third requests should queue behind the shared bucket"
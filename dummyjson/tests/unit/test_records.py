@@ -0,0 +1,54 @@
+import dataclasses
+import pickle
+
+import allure
+import httpx
+import pytest
+
+from base.api.api_client import APIClient
+from base.models.records import to_model, to_record, to_records
+from benchmarks.payloads import full_product
+from dummyjson.clients.user_client import UserClient
+from dummyjson.models.product import Product
+from dummyjson.models.records import ProductRecord, ReviewRecord, UserRecord
+from dummyjson.models.user import User
+from dummyjson.tests.unit.factories import make_page, make_user
+
+BASE_URL = "https://dummyjson.test"
+
+
+@allure.feature("Client Layer")
+@allure.story("Compact Records")
+class TestRecords:
+    @allure.title("Products convert to records and back without loss")
+    def test_round_trip(self):
+        product = Product.model_validate(full_product(1))
+
+        record = to_record(product)
+
+        assert isinstance(record, ProductRecord), "Product should become a ProductRecord"
+        assert isinstance(record.reviews, tuple), "Lists should become tuples"
+        assert isinstance(record.reviews[0], ReviewRecord), "Nested models should become records"
+        assert to_model(record) == product, "Converting back should give an equal product"
+        assert pickle.loads(pickle.dumps(record)) == record, "Records should survive pickling"
+
+    @allure.title("Records are frozen, slotted and hashable")
+    def test_immutable(self):
+        record = to_record(User.model_validate(make_user(1)))
+
+        assert not hasattr(record, "__dict__"), "Records should use __slots__"
+        assert hash(record) == hash(to_record(User.model_validate(make_user(1)))), "Equal records should hash equally"
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            record.age = 99
+
+    @allure.title("Client iterators stream into records")
+    def test_stream_from_client(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            users = [make_user(i) for i in range(1, 8)]
+            return httpx.Response(200, json=make_page("users", users, int(request.url.params["limit"]), int(request.url.params["skip"])))
+
+        with APIClient(BASE_URL, transport=httpx.MockTransport(handler)) as api:
+            records = list(to_records(UserClient(api).iter_users(page_size=3)))
+
+        assert [record.id for record in records] == list(range(1, 8)), "Every user should be converted"
+        assert all(isinstance(record, UserRecord) for record in records), "Users should become UserRecords"
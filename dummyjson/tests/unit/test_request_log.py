@@ -0,0 +1,92 @@
+import io
+import json
+import logging
+
+import allure
+import httpx
+import pytest
+
+from base.api.api_client import APIClient
+from base.api.request_log import DeferredQueueHandler, RequestLog, StructuredFormatter, configure_logging
+from base.api.retry import RetryPolicy
+
+BASE_URL = "https://dummyjson.test"
+LOGGER = "base.api.api_client"
+NO_WAIT = RetryPolicy(retries=2, backoff=0, jitter=0)
+
+
+def respond(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(404 if request.url.path.endswith("/0") else 200, json={"id": 1})
+
+
+def record(event: str, **fields) -> logging.LogRecord:
+    message = logging.LogRecord(LOGGER, logging.INFO, __file__, 1, event, None, None)
+    message.event, message.fields = event, fields
+    return message
+
+
+@allure.feature("Client Layer")
+@allure.story("Request Logs")
+class TestRequestLog:
+    @allure.title("Successes are sampled, failures are always logged")
+    def test_sampling(self, caplog):
+        log = RequestLog(sample_every=3)
+        api = APIClient(BASE_URL, retry_policy=NO_WAIT, request_log=log, transport=httpx.MockTransport(respond))
+
+        with caplog.at_level(logging.INFO, logger=LOGGER), api:
+            for _ in range(6):
+                api.get("/products/1")
+            with pytest.raises(httpx.HTTPStatusError):
+                api.get("/products/0")
+
+        records = [entry for entry in caplog.records if entry.name == LOGGER]
+        events = [(entry.event, entry.levelno) for entry in records]
+        assert events == [("request.ok", logging.INFO)] * 2 + [("request.failed", logging.ERROR)], "1 in 3 successes and every failure"
+        assert records[0].fields["status"] == 200, "Records should carry their fields"
+        assert "request.ok method=GET url=https://dummyjson.test/products/1 status=200" in caplog.text, "Message should be key=value"
+
+    @allure.title("Nothing is built or counted below the logger level")
+    def test_level_guard(self, caplog):
+        log = RequestLog(sample_every=2)
+        api = APIClient(BASE_URL, request_log=log, transport=httpx.MockTransport(respond))
+
+        with api:
+            with caplog.at_level(logging.WARNING, logger=LOGGER):
+                api.get("/products/1")
+            with caplog.at_level(logging.INFO, logger=LOGGER):
+                api.get("/products/1")
+
+        assert [entry.event for entry in caplog.records if entry.name == LOGGER] == ["request.ok"], (
+            "Skipped requests should not use up the sample"
+        )
+        assert APIClient(BASE_URL, enable_logging=False).request_log is None, "Disabled logging should skip the checks too"
+
+    @allure.title("Records render as key=value or JSON lines")
+    def test_formats(self):
+        entry = record("request.ok", url="https://dummyjson.test/products/1", error="Not found", status=200)
+
+        kv = StructuredFormatter("kv").format(entry)
+        line = json.loads(StructuredFormatter("json").format(entry))
+
+        assert kv.endswith('event=request.ok url=https://dummyjson.test/products/1 error="Not found" status=200'), "Spaces are quoted"
+        assert (line["level"], line["event"], line["status"]) == ("INFO", "request.ok", 200), "JSON keeps the value types"
+        with pytest.raises(ValueError, match="Unknown log format"):
+            StructuredFormatter("xml")
+
+    @allure.title("Records are written by the listener thread")
+    def test_queue_handler(self):
+        root = logging.getLogger()
+        handlers, level = root.handlers[:], root.level
+        stream = io.StringIO()
+        try:
+            listener = configure_logging(logging.INFO, "json", stream)
+            replaced = configure_logging(logging.INFO, "json", stream)
+            RequestLog().log(logging.INFO, "request.ok", status=200)
+            queued = [handler for handler in root.handlers if isinstance(handler, DeferredQueueHandler)]
+            replaced.stop()
+        finally:
+            root.handlers[:] = [handler for handler in handlers if not isinstance(handler, DeferredQueueHandler)]
+            root.setLevel(level)
+
+        assert len(queued) == 1 and listener._thread is None, "A second call should replace the first listener"
+        assert json.loads(stream.getvalue())["status"] == 200, "The record should be flushed when the listener stops"
@@ -0,0 +1,100 @@
+import allure
+import httpx
+import pytest
+
+from base.api.api_client import APIClient
+from base.api.retry import RetryPolicy, parse_retry_after
+
+BASE_URL = "https://dummyjson.test"
+NO_WAIT = RetryPolicy(retries=2, backoff=0, jitter=0)
+
+
+def status_error(status: int, headers: dict[str, str] | None = None) -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", f"{BASE_URL}/products/1")
+    response = httpx.Response(status, headers=headers, request=request)
+    return httpx.HTTPStatusError(f"{status}", request=request, response=response)
+
+
+def counting_client(handler_response, policy: RetryPolicy = NO_WAIT) -> tuple[APIClient, list[httpx.Request]]:
+    calls: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return handler_response(request)
+
+    return APIClient(BASE_URL, retry_policy=policy, transport=httpx.MockTransport(handler)), calls
+
+
+@allure.feature("Client Layer")
+@allure.story("Retry Policy")
+class TestRetryClassification:
+    @allure.title("4xx responses other than 408/425/429 are not retried")
+    def test_not_found_not_retried(self):
+        api, calls = counting_client(lambda request: httpx.Response(404))
+
+        with api, pytest.raises(httpx.HTTPStatusError):
+            api.get("/products/0")
+        assert len(calls) == 1, "404 should fail on the first attempt"
+
+    @allure.title("5xx responses are retried up to the retry limit")
+    def test_server_error_retried(self):
+        api, calls = counting_client(lambda request: httpx.Response(503))
+
+        with api, pytest.raises(httpx.HTTPStatusError):
+            api.get("/products/1")
+        assert len(calls) == 3, "503 should be attempted once plus 2 retries"
+
+    @allure.title("Connect errors are retried even for POST")
+    def test_connect_error_retried_for_post(self):
+        attempts = iter([httpx.ConnectError("refused"), None])
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            error = next(attempts)
+            if error:
+                raise error
+            return httpx.Response(200, json={"ok": True})
+
+        api, calls = counting_client(respond)
+        with api:
+            response = api.post("/products/add", json={})
+        assert response.json() == {"ok": True}, "Second attempt should succeed"
+        assert len(calls) == 2, "Connect error should be retried once"
+
+    @allure.title("Read timeouts are retried only for idempotent methods")
+    def test_read_timeout_classification(self):
+        policy = RetryPolicy()
+        error = httpx.ReadTimeout("slow")
+
+        assert policy.is_retryable("GET", error), "GET read timeout should be retried"
+        assert not policy.is_retryable("POST", error), "POST read timeout should not be retried"
+
+
+@allure.feature("Client Layer")
+@allure.story("Retry Policy")
+class TestRetryDelays:
+    @allure.title("Backoff grows exponentially and is capped")
+    def test_exponential_backoff(self):
+        policy = RetryPolicy(retries=10, backoff=0.5, multiplier=2, max_backoff=3, jitter=0)
+
+        assert [policy.backoff_delay(attempt) for attempt in range(1, 5)] == [0.5, 1.0, 2.0, 3.0], "Delays should double up to the cap"
+
+    @allure.title("Jitter keeps the delay within bounds")
+    def test_jitter_bounds(self):
+        policy = RetryPolicy(backoff=1.0, jitter=0.5)
+
+        delays = [policy.backoff_delay(1) for _ in range(200)]
+        assert all(0.5 <= delay <= 1.0 for delay in delays), "Half-jittered delay should stay between 0.5 and 1.0"
+
+    @allure.title("Retry-After header overrides the computed backoff")
+    def test_retry_after(self):
+        policy = RetryPolicy(backoff=0.1, jitter=0)
+
+        assert policy.next_delay("GET", 1, status_error(429, {"Retry-After": "7"})) == 7, "Retry-After seconds should be used"
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0, "Past HTTP date should mean no wait"
+
+    @allure.title("Total deadline stops further retries")
+    def test_deadline(self):
+        policy = RetryPolicy(retries=5, backoff=2, jitter=0, deadline=5)
+
+        assert policy.next_delay("GET", 1, status_error(503), elapsed=1) == 2, "Retry within deadline should be allowed"
+        assert policy.next_delay("GET", 2, status_error(503), elapsed=2) is None, "Retry past the deadline should be refused"
@@ -0,0 +1,62 @@
+import json
+
+import allure
+import pytest
+
+from dummyjson.tests.scheduling import TIMINGS_KEY, base_nodeid
+
+TESTS = """
+class TestFast:
+    def test_a(self): pass
+    def test_b(self): pass
+
+class TestSlow:
+    def test_c(self): pass
+    def test_d(self): pass
+"""
+LOADGROUP = ("-p", "dummyjson.tests.scheduling", "-n", "2", "--dist", "loadgroup")
+
+
+@allure.feature("Test Infrastructure")
+@allure.story("Parallel Scheduling")
+class TestScheduling:
+    @allure.title("Endpoint groups run slowest first under loadgroup using the last run's timings")
+    def test_slowest_group_first(self, pytester: pytest.Pytester):
+        pytester.makepyfile(test_api=TESTS)
+        timings = {
+            "test_api.py::TestFast::test_a": 0.1,
+            "test_api.py::TestFast::test_b": 0.2,
+            "test_api.py::TestSlow::test_c": 2.0,
+            "test_api.py::TestGone::test_x": 3.0,
+        }
+        (pytester.path / ".pytest_cache" / "v" / TIMINGS_KEY).parent.mkdir(parents=True)
+        (pytester.path / ".pytest_cache" / "v" / TIMINGS_KEY).write_text(json.dumps(timings))
+
+        result = pytester.runpytest(*LOADGROUP, "--collect-only", "-q")
+        serial = pytester.runpytest("-p", "dummyjson.tests.scheduling", "--collect-only", "-q")
+
+        collected = [line for line in result.outlines if "::" in line]
+        assert [line for line in serial.outlines if "::" in line] == [
+            f"test_api.py::{name}" for name in ("TestFast::test_a", "TestFast::test_b", "TestSlow::test_c", "TestSlow::test_d")
+        ], "Serial runs should keep collection order"
+        assert collected == [
+            "test_api.py::TestSlow::test_d",
+            "test_api.py::TestSlow::test_c",
+            "test_api.py::TestFast::test_b",
+            "test_api.py::TestFast::test_a",
+        ], "Unknown tests count as slowest, groups are ordered by total duration"
+
+    @allure.title("Timings of loadgroup runs are cached without xdist group suffixes")
+    def test_records_timings(self, pytester: pytest.Pytester):
+        pytester.makepyfile(test_api=TESTS)
+
+        pytester.runpytest("-p", "dummyjson.tests.scheduling").assert_outcomes(passed=4)
+        recorded_serially = (pytester.path / ".pytest_cache" / "v" / TIMINGS_KEY).exists()
+        pytester.runpytest(*LOADGROUP).assert_outcomes(passed=4)
+
+        saved = json.loads((pytester.path / ".pytest_cache" / "v" / TIMINGS_KEY).read_text())
+        assert not recorded_serially, "Serial runs should not record timings"
+        assert sorted(saved) == [
+            f"test_api.py::{name}" for name in ("TestFast::test_a", "TestFast::test_b", "TestSlow::test_c", "TestSlow::test_d")
+        ]
+        assert base_nodeid("t.py::T::test[a@b.com]@t.T") == "t.py::T::test[a@b.com]", "Only the group suffix should be removed"
@@ -0,0 +1,103 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import allure
+import httpx
+import pytest
+
+from base.api.api_client import APIClient
+from base.api.async_api_client import AsyncAPIClient
+from base.api.single_flight import AsyncSingleFlight, SingleFlight
+from dummyjson.clients.product_client import AsyncProductClient, ProductClient
+from dummyjson.tests.unit.factories import make_product
+
+BASE_URL = "https://dummyjson.test"
+
+
+@allure.feature("Client Layer")
+@allure.story("Request Coalescing")
+class TestSingleFlight:
+    @allure.title("Concurrent threads asking for the same product share one request and one parsed model")
+    def test_threads_share_request(self):
+        calls: list[httpx.Request] = []
+        lock = threading.Lock()
+        release = threading.Event()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            with lock:
+                calls.append(request)
+            release.wait(timeout=5)
+            return httpx.Response(200, json=make_product(int(request.url.path.rsplit("/", 1)[1])))
+
+        with APIClient(BASE_URL, coalesce=True, transport=httpx.MockTransport(handler)) as api:
+            products = ProductClient(api)
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                pending = executor.map(products.get_product_by_id, [1] * 8 + [2] * 8)
+                # The two requests are held until every other caller has joined one of them
+                deadline = time.monotonic() + 5
+                while api.single_flight.stats.shared < 14 and time.monotonic() < deadline:
+                    time.sleep(0.001)
+                release.set()
+                results = list(pending)
+
+        assert len(calls) == 2, "One request per distinct product should be sent"
+        assert all(result is results[0] for result in results[:8]), "Callers should share one parsed product"
+        assert api.single_flight.stats.shared == 14, "Fourteen callers should have joined an in-flight request"
+
+    @allure.title("Concurrent tasks asking for the same product share one request")
+    def test_tasks_share_request(self):
+        calls: list[httpx.Request] = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json=make_product(1))
+
+        async def scenario():
+            async with AsyncAPIClient(BASE_URL, coalesce=True, transport=httpx.MockTransport(handler)) as api:
+                products = AsyncProductClient(api)
+                return await asyncio.gather(*(products.get_product_by_id(1) for _ in range(20)))
+
+        results = asyncio.run(scenario())
+
+        assert len(calls) == 1, "Twenty concurrent lookups should result in one request"
+        assert {product.id for product in results} == {1}, "Every caller should get the product"
+
+    @allure.title("Errors are shared with every waiting caller")
+    def test_error_shared(self):
+        flight = SingleFlight()
+        started = threading.Event()
+
+        def failing():
+            started.set()
+            time.sleep(0.05)
+            raise ValueError("boom")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(flight.do, "key", failing)
+            started.wait()
+            follower = executor.submit(flight.do, "key", failing)
+            for future in (leader, follower):
+                with pytest.raises(ValueError):
+                    future.result()
+
+        assert flight.stats.executions == 1, "Failing call should run once"
+
+    @allure.title("Cancelling one waiting task does not cancel the shared request")
+    def test_cancel_one_waiter(self):
+        async def scenario():
+            flight = AsyncSingleFlight()
+
+            async def slow():
+                await asyncio.sleep(0.02)
+                return "done"
+
+            first = asyncio.ensure_future(flight.do("key", slow))
+            second = asyncio.ensure_future(flight.do("key", slow))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await second
+
+        assert asyncio.run(scenario()) == "done", "Remaining caller should still get the result"
@@ -0,0 +1,105 @@
+import dataclasses
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import allure
+import httpx
+import pytest
+
+from base.api.api_client import APIClient
+from dummyjson.clients.product_client import ProductClient
+from dummyjson.clients.user_client import UserClient
+from dummyjson.fake import FakeDummyJSON
+from dummyjson.models.records import ProductRecord, UserRecord
+from dummyjson.snapshots import SNAPSHOT_PAGE_SIZE, Snapshots
+
+BASE_URL = "https://dummyjson.test"
+
+
+@allure.feature("Client Layer")
+@allure.story("Snapshots")
+class TestSnapshots:
+    @allure.title("Both snapshots are downloaded once, on first use, for every thread")
+    def test_fetched_once(self):
+        backend = FakeDummyJSON()
+        with APIClient(BASE_URL, retries=0, transport=backend.transport()) as api:
+            snapshots = Snapshots(ProductClient(api), UserClient(api))
+            untouched = sum(backend.calls.values())
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                catalogs = list(executor.map(lambda _: snapshots.catalog, range(16)))
+            calls = sum(backend.calls.values())
+            directory = snapshots.user_directory
+
+        pages = -(-len(backend.products) // SNAPSHOT_PAGE_SIZE) + -(-len(backend.users) // SNAPSHOT_PAGE_SIZE)
+        assert untouched == 0, "Nothing should be fetched before first use"
+        assert all(catalog is catalogs[0] for catalog in catalogs), "Threads should share one catalog"
+        assert calls == pages == sum(backend.calls.values()), "Users should be fetched with the catalog, each page once"
+        assert len(catalogs[0]) == len(backend.products) and len(directory) == len(backend.users), "Every record should be kept"
+
+    @allure.title("Each snapshot is returned as soon as its own download is done")
+    def test_catalog_does_not_wait_for_users(self):
+        backend = FakeDummyJSON()
+        release = threading.Event()
+        released: list[bool] = []
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/users":
+                released.append(release.wait(timeout=5))
+            return backend._handle_httpx(request)
+
+        with APIClient(BASE_URL, retries=0, transport=httpx.MockTransport(respond)) as api:
+            snapshots = Snapshots(ProductClient(api), UserClient(api))
+            catalog = snapshots.catalog
+            release.set()
+            directory = snapshots.user_directory
+
+        assert len(catalog) == len(backend.products) and len(directory) == len(backend.users), "Both snapshots should be complete"
+        assert released and all(released), "The catalog should be returned while the users are still downloading"
+
+    @allure.title("A failed download is started again on the next access")
+    def test_failure_not_cached(self):
+        backend = FakeDummyJSON()
+        failures = [httpx.Response(503, json={"message": "Service Unavailable"})]
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/users" and failures:
+                return failures.pop()
+            return backend._handle_httpx(request)
+
+        with APIClient(BASE_URL, retries=0, transport=httpx.MockTransport(respond)) as api:
+            snapshots = Snapshots(ProductClient(api), UserClient(api))
+            with pytest.raises(httpx.HTTPStatusError):
+                _ = snapshots.user_directory
+            directory = snapshots.user_directory
+
+        assert len(directory) == len(backend.users), "The second access should download the users again"
+
+    @allure.title("Indexes answer lookups by id, email, username and category")
+    def test_indexes(self):
+        backend = FakeDummyJSON()
+        with APIClient(BASE_URL, retries=0, transport=backend.transport()) as api:
+            snapshots = Snapshots(ProductClient(api), UserClient(api))
+            catalog, directory = snapshots.catalog, snapshots.user_directory
+
+        emily = directory.by_email["emily.johnson@x.dummyjson.com"]
+        beauty = catalog.in_category("beauty")
+
+        assert isinstance(emily, UserRecord) and directory.by_username["emilys"] is emily is directory.by_id[1], "Indexes should agree"
+        assert beauty and all(isinstance(product, ProductRecord) and product.category == "beauty" for product in beauty), (
+            "Category index should hold the category's product records"
+        )
+        assert catalog.by_id[beauty[0].id] is beauty[0], "Category entries should be the indexed records"
+        assert catalog.in_category("unknown") == (), "Unknown categories should be empty"
+        assert set(catalog.categories) == {product["category"] for product in backend.products}, "Every category should be indexed"
+
+    @allure.title("Snapshots and their indexes are read-only")
+    def test_immutable(self):
+        with APIClient(BASE_URL, retries=0, transport=FakeDummyJSON().transport()) as api:
+            directory = Snapshots(ProductClient(api), UserClient(api)).user_directory
+
+        with pytest.raises(TypeError):
+            directory.by_email["someone@example.com"] = directory.users[0]
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            directory.users = ()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            directory.users[0].email = "changed@example.com"
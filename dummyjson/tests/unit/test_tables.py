@@ -0,0 +1,63 @@
+import allure
+import pytest
+
+from base.models.partial import partial_model
+from dummyjson.models.product import ProductsResponse
+from dummyjson.models.user import User
+from dummyjson.tests.unit.factories import make_page, make_product, make_user
+
+np = pytest.importorskip("numpy")
+
+from dummyjson.models.tables import ProductTable, UserTable  # noqa: E402
+
+PRODUCTS = [
+    {**make_product(i), "category": ("beauty", "groceries", "laptops")[i % 3], "rating": None if i == 4 else i / 2} for i in range(1, 10)
+]
+
+
+@allure.feature("Client Layer")
+@allure.story("Columnar Tables")
+class TestColumnTables:
+    @allure.title("Numeric fields become arrays and strings categoricals")
+    def test_columns(self):
+        table = ProductTable.from_response(ProductsResponse.model_validate(make_page("products", PRODUCTS, 0, 0)))
+
+        assert len(table) == len(PRODUCTS), "Every product should be a row"
+        assert table["price"].dtype == np.float64, "Prices should be a float array"
+        assert np.isnan(table["rating"][3]), "Missing numbers should be NaN"
+        assert list(table["category"].categories) == ["beauty", "groceries", "laptops"], "Categories should be encoded once"
+        assert table.row(0)["category"] == "groceries", "Rows should decode categories"
+        with pytest.raises(ValueError):
+            table["price"][0] = 0
+
+    @allure.title("Filter, sort and group-by are vectorized over the columns")
+    def test_filter_sort_group_by(self):
+        table = ProductTable.from_records(PRODUCTS)
+
+        cheap_beauty = table.filter(lambda t: (t["category"] == "beauty") & (t["price"] < 17))
+        by_rating = table.sort("rating", descending=True)
+        groups = table.group_by("category")
+
+        assert cheap_beauty["id"].tolist() == [3, 6], "Filter should combine masks"
+        assert by_rating["id"][0] == 9, "Highest rating should come first"
+        assert groups.count() == {"beauty": 3, "groceries": 3, "laptops": 3}, "Groups should be counted"
+        assert groups.sum("stock")["laptops"] == 2 + 5 + 8, "Sums should be per group"
+        assert groups.mean("rating")["groceries"] == pytest.approx((0.5 + 3.5) / 2), "Means should skip NaN"
+        assert groups.max("price")["beauty"] == pytest.approx(18.99), "Maximum should be per group"
+
+    @allure.title("Users table reads nested fields from dicts and models alike")
+    def test_user_table_nested(self):
+        table = UserTable.from_records([make_user(1), make_user(2)])
+
+        assert table["hair.color"].to_list() == ["Brown", "Brown"], "Nested fields should be read"
+        assert table["age"].tolist() == [21, 22], "Ages should be read"
+        assert (table["email"] == "nobody@example.com").sum() == 0, "Unknown values should match nothing"
+
+    @allure.title("Partial users leave unselected numbers as NaN")
+    def test_user_table_partial(self):
+        model = partial_model(User, ["firstName"])
+        table = UserTable.from_records([model.model_validate({"id": 1, "firstName": "Emily"}), {"id": 2, "firstName": "Michael"}])
+
+        assert table["id"].tolist() == [1, 2], "Ids should still be read"
+        assert np.isnan(table["age"]).all(), "Missing ages should be NaN"
+        assert table["hair.color"].to_list() == [None, None], "Missing strings should be missing values"
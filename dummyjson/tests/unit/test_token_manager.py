@@ -0,0 +1,166 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import allure
+import httpx
+
+from base.api.api_client import APIClient
+from base.api.async_api_client import AsyncAPIClient
+from base.api.cache import ResponseCache
+from base.api.retry import RetryPolicy
+from dummyjson.clients.auth_client import AsyncAuthClient, AuthClient
+from dummyjson.clients.token_manager import AsyncTokenManager, TokenManager, token_expiry
+from dummyjson.clients.user_client import UserClient
+from dummyjson.fake import FakeDummyJSON
+
+BASE_URL = "https://dummyjson.test"
+USER = ("emilys", "emilyspass")
+
+
+START = 1_000_000.0
+
+
+class Clock:
+    def __init__(self):
+        self.now = START
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def behind() -> float:
+    """Client clock stuck at the start, so the server rejects tokens the manager still considers fresh"""
+    return START
+
+
+@allure.feature("Client Layer")
+@allure.story("Token Manager")
+class TestTokenManager:
+    @allure.title("Concurrent callers share one login per credential set")
+    def test_single_login(self):
+        backend = FakeDummyJSON()
+        with APIClient(BASE_URL, retries=0, transport=backend.transport()) as api, TokenManager(AuthClient(api)) as tokens:
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                issued = set(executor.map(lambda _: tokens.token(*USER), range(64)))
+            other = tokens.token(backend.users[1]["username"], backend.users[1]["password"])
+
+        assert len(issued) == 1 and other not in issued, "Each credential set should get its own cached token"
+        assert backend.calls["POST /auth/login"] == 2, "Only the first caller per credential set should log in"
+        assert token_expiry(other) is not None, "Expiry should be read from the JWT exp claim"
+
+    @allure.title("Tokens inside the refresh margin are refreshed once")
+    def test_refresh_before_expiry(self):
+        clock = Clock()
+        backend = FakeDummyJSON(clock=clock)
+        with APIClient(BASE_URL, retries=0, transport=backend.transport()) as api:
+            tokens = TokenManager(AuthClient(api), expires_in_mins=10, refresh_margin=0.5, background=False, clock=clock)
+            first = tokens.token(*USER)
+            clock.now += 4 * 60
+            unchanged = tokens.token(*USER)
+            clock.now += 2 * 60
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                refreshed = set(executor.map(lambda _: tokens.token(*USER), range(32)))
+
+        assert unchanged == first, "Tokens should be reused until the margin"
+        assert len(refreshed) == 1 and first not in refreshed, "Callers inside the margin should share one refresh"
+        assert (tokens.stats.logins, tokens.stats.refreshes) == (1, 1), "Refresh should not log in again"
+
+    @allure.title("A background timer refreshes tokens before callers need them")
+    def test_background_refresh(self):
+        backend = FakeDummyJSON()
+        # 60 second tokens refreshed with 99.5% of their lifetime left, i.e. 0.3 seconds after login
+        with (
+            APIClient(BASE_URL, retries=0, transport=backend.transport()) as api,
+            TokenManager(AuthClient(api), expires_in_mins=1, refresh_margin=0.995) as tokens,
+        ):
+            first = tokens.token(*USER)
+            deadline = time.monotonic() + 5
+            while tokens.stats.refreshes == 0 and time.monotonic() < deadline:
+                time.sleep(0.05)
+            refreshed = tokens.token(*USER)
+
+        assert tokens.stats.refreshes >= 1 and refreshed != first, "The timer should have refreshed the token"
+        assert backend.calls["POST /auth/login"] == 1, "Background refresh should use the refresh token"
+
+    @allure.title("A 401 answer is retried once with a fresh token")
+    def test_retry_on_unauthorized(self):
+        clock = Clock()
+        backend = FakeDummyJSON(clock=clock)
+        with APIClient(BASE_URL, retries=0, transport=backend.transport()) as api:
+            tokens = TokenManager(AuthClient(api), expires_in_mins=1, background=False, clock=behind)
+            tokens.attach(api, *USER)
+            UserClient(api).get_user_by_id(1)
+            clock.now += 61
+            me = api.get("/auth/me").json()
+            # Past the refresh token expiry as well: refreshing fails and the manager logs in again
+            clock.now += 60 * 24 * 7 * 60
+            again = api.get("/auth/me")
+
+        assert me["username"] == "emilys", "Retried request should succeed"
+        assert again.status_code == 200, "Rejected refresh tokens should fall back to a login"
+        assert (tokens.stats.retries, tokens.stats.refreshes, tokens.stats.logins) == (2, 1, 2), "Each 401 should renew once"
+        assert backend.calls["GET /auth/me"] == 4, "Each request should be sent at most twice"
+
+    @allure.title("A retried request whose token was rotated meanwhile still renews on 401")
+    def test_retry_after_rotation(self):
+        clock = Clock()
+        backend = FakeDummyJSON(clock=clock)
+        served = backend.transport()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/auth/me" and backend.calls["GET /auth/me"] == 0:
+                # The token expires while the first attempt fails, so the retry is sent with a stale token
+                backend.calls["GET /auth/me"] += 1
+                clock.now += 61
+                return httpx.Response(503, json={"message": "Service Unavailable"})
+            return served.handle_request(request)
+
+        policy = RetryPolicy(retries=1, backoff=0, jitter=0)
+        with APIClient(BASE_URL, retry_policy=policy, transport=httpx.MockTransport(handler)) as api:
+            tokens = TokenManager(AuthClient(api), expires_in_mins=1, background=False, clock=behind)
+            tokens.attach(api, *USER)
+            response = api.get("/auth/me")
+
+        assert response.json()["username"] == USER[0], "The retried request should succeed"
+        assert (tokens.stats.retries, tokens.stats.refreshes) == (1, 1), "The 401 on the retry should renew the token once"
+
+    @allure.title("Authenticated requests are neither cached nor coalesced")
+    def test_not_shared_across_users(self):
+        backend = FakeDummyJSON()
+        other = (backend.users[1]["username"], backend.users[1]["password"])
+        with (
+            APIClient(BASE_URL, retries=0, cache=ResponseCache(), coalesce=True, transport=backend.transport()) as api,
+            TokenManager(AuthClient(api), background=False) as tokens,
+        ):
+            tokens.attach(api, *USER)
+            first = api.get("/auth/me").json()["username"]
+            tokens.attach(api, *other)
+            second = api.get("/auth/me").json()["username"]
+            third = api.get("/auth/me", auth=tokens.auth_for(*USER)).json()["username"]
+
+        assert (first, second, third) == (USER[0], other[0], USER[0]), "Each request should see its own user"
+        assert api.single_flight.stats.executions == 0, "Authenticated requests should not be coalesced"
+        assert len(api.cache.store) == 0, "Authenticated responses should not be cached"
+
+    @allure.title("Async callers share one login and retry a 401 once")
+    def test_async_manager(self):
+        clock = Clock()
+        backend = FakeDummyJSON(clock=clock)
+
+        async def scenario():
+            async with (
+                AsyncAPIClient(BASE_URL, retries=0, transport=backend.transport()) as api,
+                AsyncTokenManager(AsyncAuthClient(api), expires_in_mins=1, clock=behind) as tokens,
+            ):
+                tokens.attach(api, *USER)
+                issued = set(await asyncio.gather(*(tokens.token(*USER) for _ in range(20))))
+                clock.now += 61
+                responses = await asyncio.gather(*(api.get("/auth/me") for _ in range(5)))
+                return issued, [response.status_code for response in responses], tokens.stats
+
+        issued, statuses, stats = asyncio.run(scenario())
+
+        assert len(issued) == 1 and stats.logins == 1, "Tasks should share one login"
+        assert statuses == [200] * 5, "Rejected requests should be retried with a fresh token"
+        assert stats.refreshes == 1, "Tasks rejected together should share one refresh"
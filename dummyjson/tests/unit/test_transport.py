@@ -0,0 +1,94 @@
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import allure
+import httpx
+import pytest
+
+from base.api import transport as transport_module
+from base.api.api_client import APIClient
+from base.api.async_api_client import AsyncAPIClient
+from base.api.cassette import CassetteTransport
+from base.api.transport import TransportConfig, pool_stats
+from dummyjson.clients.product_client import AsyncProductClient, ProductClient
+
+
+@allure.feature("Client Layer")
+@allure.story("Transport")
+class TestTransport:
+    @allure.title("Settings come from a .env file, the environment and keyword overrides, in rising priority")
+    def test_config_sources(self, tmp_path):
+        env_file = tmp_path / ".env"
+        env_file.write_text("DUMMYJSON_HTTP_MAX_CONNECTIONS=4\nDUMMYJSON_HTTP_HTTP2=true\nDUMMYJSON_HTTP_READ_TIMEOUT=none\n")
+        environ = {"DUMMYJSON_HTTP_MAX_CONNECTIONS": "6", "DUMMYJSON_HTTP_CONNECT_TIMEOUT": "1.5"}
+
+        config = TransportConfig.from_env(env_file, environ, prewarm=2)
+
+        assert (config.max_connections, config.http2, config.prewarm) == (6, True, 2), "Environment and overrides should win"
+        assert config.timeout == httpx.Timeout(connect=1.5, read=None, write=10.0, pool=10.0), "Timeouts should be per phase"
+        assert config.limits.max_keepalive_connections == 20, "Unset fields should keep their defaults"
+        with pytest.raises(ValueError, match="DUMMYJSON_HTTP_PREWARM should be a int"):
+            TransportConfig.from_env(environ={"DUMMYJSON_HTTP_PREWARM": "many"})
+
+    @allure.title("Parallel requests share a few pre-warmed connections")
+    def test_prewarmed_pool_is_reused(self, fake_server: str):
+        config = TransportConfig(max_connections=3, prewarm=3)
+
+        with APIClient(fake_server, retries=0, enable_logging=False, transport_config=config) as api:
+            warm = api.pool_stats()
+            with ThreadPoolExecutor(max_workers=12) as executor:
+                products = list(executor.map(ProductClient(api).get_product_by_id, range(1, 49)))
+            after = api.pool_stats()
+
+        assert (warm.connections, warm.idle) == (3, 3), "Start-up should open the configured connections"
+        assert len(products) == 48, "Every request should be served"
+        assert after.connections == 3 and after.max_connections == 3, "Requests should queue for the warm connections"
+        assert after.requests == 0 and after.utilisation == 0.0, "Nothing should be in flight afterwards"
+
+    @allure.title("Async clients warm up on entering and report their pool")
+    def test_async_warm_up(self, fake_server: str):
+        async def scenario():
+            config = TransportConfig(max_connections=2, prewarm=2)
+            async with AsyncAPIClient(fake_server, retries=0, enable_logging=False, transport_config=config) as api:
+                warm = api.pool_stats()
+                await asyncio.gather(*(AsyncProductClient(api).get_product_by_id(i) for i in range(1, 21)))
+                return warm, api.pool_stats()
+
+        warm, after = asyncio.run(scenario())
+
+        assert warm.connections == 2 and after.connections == 2, "Tasks should share the pre-warmed connections"
+
+    @allure.title("HTTP/2 without the h2 package falls back to HTTP/1.1 with a warning")
+    def test_http2_fallback(self, monkeypatch, caplog):
+        monkeypatch.setattr(transport_module, "HTTP2_AVAILABLE", False)
+        config = TransportConfig(http2=True, prewarm=4)
+
+        with caplog.at_level(logging.WARNING, logger="base.api.transport"):
+            transport = config.transport()
+
+        assert transport._pool._http2 is False, "Pool should speak HTTP/1.1 only"
+        assert config.warm_connections == 4, "Without multiplexing every warm connection is opened"
+        assert "h2 package" in caplog.text, "Missing h2 should be reported"
+
+    @allure.title("Pool stats see through wrapping transports and skip pool-less ones")
+    def test_pool_stats_unwraps(self, tmp_path):
+        wrapped = CassetteTransport(tmp_path / "api.json.gz", mode="record", transport=TransportConfig(max_connections=5).transport())
+
+        assert pool_stats(wrapped).max_connections == 5, "Cassette should expose the pool it records through"
+        assert pool_stats(httpx.MockTransport(lambda request: httpx.Response(200))) is None, "Mocks have no pool"
+        assert (
+            APIClient("https://dummyjson.test", transport_config=TransportConfig(max_connections=None)).pool_stats().max_connections is None
+        )
+
+    @allure.title("Cassettes record through a transport built from the client settings")
+    def test_cassette_records_with_config(self, fake_server: str, tmp_path):
+        config = TransportConfig(max_connections=2, keepalive_expiry=1.0)
+        cassette = CassetteTransport(tmp_path / "api.json.gz", mode="record", transport_config=config)
+
+        with APIClient(fake_server, retries=0, enable_logging=False, transport=cassette) as api:
+            ProductClient(api).get_product_by_id(1)
+            stats = pool_stats(cassette)
+
+        assert stats.max_connections == 2 and stats.connections == 1, "Recording should use the configured pool"
+        assert len(cassette.cassette) == 1, "The request should be recorded"
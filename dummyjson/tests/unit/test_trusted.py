@@ -0,0 +1,98 @@
+import json
+from datetime import datetime
+
+import allure
+import httpx
+import pytest
+from pydantic import ValidationError
+
+from base.api.api_client import APIClient
+from base.models.trusted import ModelBuilder
+from benchmarks.payloads import full_product
+from dummyjson.clients.product_client import ProductClient
+from dummyjson.clients.user_client import UserClient
+from dummyjson.models.product import Product, ProductsResponse, Review
+from dummyjson.models.user import Address, User, UsersResponse
+from dummyjson.tests.unit.factories import make_page, make_user
+
+BASE_URL = "https://dummyjson.test"
+
+
+@allure.feature("Client Layer")
+@allure.story("Trusted Construction")
+class TestTrustedConstruction:
+    @allure.title("Trusted construction builds nested models equal to validated ones")
+    def test_nested_construction(self):
+        payload = full_product(1)
+
+        product = ModelBuilder(trusted=True).build(Product, payload)
+
+        assert isinstance(product.reviews[0], Review), "Reviews should be models"
+        assert isinstance(product.reviews[0].date, datetime), "Dates should be parsed"
+        assert product == Product.model_validate(payload), "Constructed product should equal the validated one"
+
+    @allure.title("Trusted construction skips validation, sampling validates every Nth record")
+    def test_sampling(self):
+        users = [{**make_user(i), "age": "unknown"} for i in range(1, 11)]
+        page = make_page("users", users, 0, 0)
+
+        response = ModelBuilder(trusted=True).build(UsersResponse, page)
+
+        assert isinstance(response.users[0].address, Address), "Nested models should be constructed"
+        assert response.users[0].age == "unknown", "Trusted records should not be validated"
+        with pytest.raises(ValidationError):
+            ModelBuilder(trusted=True, sample_every=5).build(UsersResponse, page)
+
+    @allure.title("Sampling counts records per model, so nested lists do not skew it")
+    def test_sampling_with_nested_lists(self):
+        products = [{**full_product(i), "price": "bad"} for i in range(1, 41)]
+        page = make_page("products", products, 0, 0)
+
+        with pytest.raises(ValidationError):
+            ModelBuilder(trusted=True, sample_every=4).build(ProductsResponse, page)
+
+    @allure.title("Trusted mode can be set per client or per call")
+    def test_client_modes(self):
+        user = {**make_user(1), "age": "unknown"}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/users":
+                return httpx.Response(200, json=make_page("users", [user], 0, 0))
+            return httpx.Response(200, content=json.dumps(user).encode())
+
+        with APIClient(BASE_URL, transport=httpx.MockTransport(handler)) as api:
+            users = UserClient(api)
+            with pytest.raises(ValidationError):
+                next(users.iter_users())
+            with api.trusted():
+                assert next(users.iter_users()).age == "unknown", "Per-call trusted mode should skip validation"
+
+        trusted_builder = ModelBuilder(trusted=True)
+        with APIClient(BASE_URL, model_builder=trusted_builder, transport=httpx.MockTransport(handler)) as api:
+            assert isinstance(UserClient(api).get_all_users(limit=0, fetch_all=True).users[0], User), (
+                "Per-client trusted mode should build users"
+            )
+
+    @allure.title("Batch lookups keep the per-call mode in worker threads")
+    def test_batch_uses_call_mode(self):
+        products = [{**full_product(i), "price": "n/a"} for i in range(1, 101)]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            params = request.url.params
+            return httpx.Response(200, json=make_page("products", products, int(params["limit"]), int(params["skip"])))
+
+        with APIClient(BASE_URL, transport=httpx.MockTransport(handler)) as api, api.trusted():
+            # Dense IDs are read as pages, whose items are built with the per-call builder
+            result = ProductClient(api).get_products_by_ids(range(1, 41))
+
+        assert result.ok, "Trusted lookups should not fail validation"
+        assert result[20].price == "n/a", "Products should be constructed without validation"
+
+    @allure.title("Response bodies are validated in one pass even in trusted mode")
+    def test_parse_validates(self):
+        user = {**make_user(1), "age": "unknown"}
+
+        with APIClient(BASE_URL, transport=httpx.MockTransport(lambda request: httpx.Response(200, json=user))) as api:
+            response = api.get("/users/1")
+            with api.trusted(), pytest.raises(ValidationError):
+                api.parse(response, User)
@@ -1,4 +1,5 @@
 import argparse
+import importlib.util
 import shutil
 import subprocess
 import sys
@@ -28,6 +29,11 @@ def main():
     parser.add_argument("targets", nargs="*", help="Pytest targets (dir/file/test). Example: dummyjson/tests/api/test_products.py")
     parser.add_argument("--open", action="store_true", help="Open generated Allure report in browser")
     parser.add_argument("--clean", action="store_true", help="Clean previous allure results before run")
+    parser.add_argument(
+        "--workers",
+        default=None,
+        help="Run tests in N parallel pytest-xdist workers ('auto' = one per CPU); tests of one endpoint share a worker",
+    )
     args, pytest_args = parser.parse_known_args()
 
     # Project root
@@ -55,6 +61,13 @@ def main():
         *args.targets,
         *pytest_args,
     ]
+    if args.workers:
+        if importlib.util.find_spec("xdist") is None:
+            print("--workers needs pytest-xdist, install it with: uv pip install pytest-xdist")
+            sys.exit(2)
+        # Every worker writes its results (uniquely named files) into the same --alluredir, which merges them
+        # into one report; loadgroup keeps each endpoint group on one worker, slowest groups first
+        pytest_cmd += ["-n", str(args.workers), "--dist", "loadgroup"]
 
     print(f"Running pytest with Allure: {' '.join(pytest_cmd)}")
     result = subprocess.run(pytest_cmd, cwd=project_root)